@@ -0,0 +1,213 @@
+import asyncio
+import time
+from collections import deque
+from typing import Optional, Any
+
+import httpx
+
+from crm_management.crm.client_base import (
+    ClientStats,
+    RequestStats,
+    IDEMPOTENT_METHODS,
+    RETRYABLE_STATUS_CODES,
+    backoff_delay,
+    retry_delay_from_headers,
+)
+from crm_management.crm.rate_limiter import TokenBucket
+
+
+class AsyncAPIClient:
+    def __init__(
+        self,
+        base_url: str,
+        headers: Optional[dict[str, str]] = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        history_size: int = 1000,
+        rate_limiter: TokenBucket | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initialize the asyncio API client, the non-blocking sibling of `APIClient`.
+
+        :param base_url: Base URL for the API.
+        :param headers: Optional headers to include in all requests.
+        :param pool_size: Maximum number of connections kept open.
+        :param keep_alive: Whether connections are kept alive between requests.
+        :param connect_timeout: Seconds to wait for a connection to be established.
+        :param read_timeout: Seconds to wait for the server to send a response.
+        :param max_retries: Maximum number of retries for throttled or failed requests.
+        :param backoff_factor: Base delay in seconds of the exponential backoff.
+        :param max_backoff: Upper bound in seconds for a single backoff delay.
+        :param history_size: Number of per-request metrics kept in `history`.
+        :param rate_limiter: Optional limiter every attempt, retries included, must
+            acquire a token from before being sent.
+        :param transport: Optional httpx transport, e.g. an `httpx.MockTransport` or
+            an `httpx.ASGITransport` serving an in-process stand-in of the API.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.headers = headers or {}
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.stats = ClientStats()
+        self.history: deque[RequestStats] = deque(maxlen=history_size)
+        self.rate_limiter = rate_limiter
+
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size if keep_alive else 0,
+            ),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close all the pooled connections."""
+        await self._client.aclose()
+
+    def _build_url(self, endpoint: str) -> str:
+        """Helper method to construct full URL from base URL and endpoint."""
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _should_retry(
+        self,
+        method: str,
+        response: httpx.Response | None = None,
+        error: httpx.HTTPError | None = None,
+    ) -> bool:
+        """
+        Decide if a request can be retried safely.
+
+        Non-idempotent methods are only retried when the server certainly did not
+        process them, i.e. on throttling or when no connection could be made.
+        """
+        if method.upper() in IDEMPOTENT_METHODS:
+            if error is not None:
+                return isinstance(error, httpx.TransportError)
+            return response is not None and (
+                response.status_code in RETRYABLE_STATUS_CODES
+            )
+        if error is not None:
+            return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+        return response is not None and response.status_code == 429
+
+    def _record(
+        self, method: str, url: str, status_code: int | None, start: float, retries: int
+    ) -> None:
+        latency = time.perf_counter() - start
+        self.history.append(RequestStats(method, url, status_code, latency, retries))
+        self.stats.requests += 1
+        self.stats.retries += retries
+        self.stats.total_latency += latency
+        if status_code is None or status_code >= 400:
+            self.stats.failures += 1
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """
+        Make a generic HTTP request, retrying throttled and transient failures.
+
+        :param method: HTTP method ('GET', 'POST', 'PUT', 'DELETE').
+        :param endpoint: API endpoint.
+        :param kwargs: Additional arguments to pass to `httpx` methods (e.g., json, params, data).
+        :return: Response object.
+        """
+        url = self._build_url(endpoint)
+        start = time.perf_counter()
+        retries = 0
+
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            try:
+                response = await self._client.request(method, url, **kwargs)
+            except httpx.HTTPError as error:
+                if retries >= self.max_retries or not self._should_retry(
+                    method, error=error
+                ):
+                    self._record(method, url, None, start, retries)
+                    raise
+                delay = backoff_delay(retries, self.backoff_factor, self.max_backoff)
+            else:
+                if retries >= self.max_retries or not self._should_retry(
+                    method, response=response
+                ):
+                    break
+                delay = retry_delay_from_headers(response.headers)
+                if delay is None:
+                    delay = backoff_delay(
+                        retries, self.backoff_factor, self.max_backoff
+                    )
+
+            await asyncio.sleep(delay)
+            retries += 1
+
+        self._record(method, url, response.status_code, start, retries)
+        response.raise_for_status()
+        return response
+
+    async def get(
+        self, endpoint: str, params: Optional[dict[str, Any]] = None
+    ) -> httpx.Response:
+        """
+        Send a GET request.
+
+        :param endpoint: API endpoint.
+        :param params: Query parameters.
+        :return: Response object.
+        """
+        return await self._request("GET", endpoint, params=params)
+
+    async def post(
+        self,
+        endpoint: str,
+        json: Optional[dict[str, Any]] = None,
+        data: Optional[dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        Send a POST request.
+
+        :param endpoint: API endpoint.
+        :param json: JSON payload.
+        :param data: Form data payload.
+        :return: Response object.
+        """
+        return await self._request("POST", endpoint, json=json, data=data)
+
+    async def put(
+        self,
+        endpoint: str,
+        json: Optional[dict[str, Any]] = None,
+        data: Optional[dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        Send a PUT request.
+
+        :param endpoint: API endpoint.
+        :param json: JSON payload.
+        :param data: Form data payload.
+        :return: Response object.
+        """
+        return await self._request("PUT", endpoint, json=json, data=data)
+
+    async def delete(self, endpoint: str) -> httpx.Response:
+        """
+        Send a DELETE request.
+
+        :param endpoint: API endpoint.
+        :return: Response object.
+        """
+        return await self._request("DELETE", endpoint)
@@ -0,0 +1,194 @@
+import asyncio
+import os
+from collections import deque
+from typing import TypeVar, Generic, Type, AsyncIterator, Any
+
+from crm_management.crm.async_client_base import AsyncAPIClient
+from crm_management.crm.config import APIConfig
+from crm_management.crm.dto_base import BaseDTO, DecodeError
+from crm_management.crm.service_base import CRMBaseAPI
+
+T = TypeVar("T", bound=BaseDTO)
+
+
+class AsyncCRMBaseAPI(Generic[T]):
+    """
+    asyncio sibling of `CRMBaseAPI`.
+
+    The CRUD operations are implemented once here for every domain: records are
+    mapped with the DTO's `from_dict`/`model_dump`, and single-record responses
+    are unwrapped from `item_key` (e.g. `{"deal": {...}}`) when present.
+    """
+
+    _is_last_page = CRMBaseAPI._is_last_page
+
+    def __init__(
+        self,
+        api_endpoint: str,
+        dto_class: Type[T],
+        item_key: str,
+        view_id: str | None = None,
+        collection_key: str | None = None,
+        page_size: int = APIConfig.PAGE_SIZE,
+        prefetch_pages: int = APIConfig.PREFETCH_PAGES,
+        api_client: AsyncAPIClient | None = None,
+    ):
+        self.api_endpoint = api_endpoint
+        self.item_key = item_key
+        self.view_id = view_id
+        self.collection_key = collection_key
+        self.page_size = page_size
+        self.prefetch_pages = prefetch_pages
+        # Records of the listed pages that could not be decoded into DTOs
+        self.decode_errors: deque[DecodeError] = deque(maxlen=1000)
+        self._dto_class: Type[T] = dto_class
+        self.__api_client: AsyncAPIClient | None = api_client
+
+    @property
+    def _api_client(self) -> AsyncAPIClient:
+        if self.__api_client is None:
+            self.__api_client = AsyncAPIClient(
+                base_url=APIConfig.BASE_URL,
+                headers={
+                    "Authorization": f"Token token={os.getenv('CRM_API_TOKEN')}",
+                    "Content-Type": "application/json",
+                },
+                pool_size=APIConfig.POOL_SIZE,
+                keep_alive=APIConfig.KEEP_ALIVE,
+                connect_timeout=APIConfig.CONNECT_TIMEOUT,
+                read_timeout=APIConfig.READ_TIMEOUT,
+                max_retries=APIConfig.MAX_RETRIES,
+                backoff_factor=APIConfig.BACKOFF_FACTOR,
+                max_backoff=APIConfig.MAX_BACKOFF,
+                rate_limiter=CRMBaseAPI._rate_limiter(),
+            )
+        return self.__api_client
+
+    async def aclose(self) -> None:
+        """Close the underlying client and its pooled connections."""
+        if self.__api_client is not None:
+            await self.__api_client.aclose()
+
+    @property
+    def view_endpoint(self) -> str:
+        if self.view_id is None or self.collection_key is None:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not define a view to list records from."
+            )
+        return f"{self.api_endpoint}/view/{self.view_id}"
+
+    def _unwrap(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return payload.get(self.item_key, payload)
+
+    def _parse_page(self, payload: dict[str, Any]) -> list[T]:
+        """Build the DTOs of the records listed in a page payload."""
+        result = self._dto_class.from_dicts(payload.get(self.collection_key) or [])
+        self.decode_errors.extend(result.errors)
+        return result.items
+
+    async def _fetch_page(self, page: int, page_size: int) -> dict[str, Any]:
+        """Fetch the raw payload of a single page of the view."""
+        response = await self._api_client.get(
+            self.view_endpoint, params={"page": page, "per_page": page_size}
+        )
+        return response.json()
+
+    async def iter_pages(
+        self, page_size: int | None = None, prefetch_pages: int | None = None
+    ) -> AsyncIterator[list[T]]:
+        """
+        Lazily walk every page of the view, following its pagination metadata.
+
+        Up to `prefetch_pages` of the following pages are requested concurrently
+        while the current one is consumed; pages are still yielded in order.
+
+        :param page_size: Number of records requested per page.
+        :param prefetch_pages: Number of pages fetched ahead, 0 to fetch one at a time.
+        :return: Async iterator over the DTOs of each page.
+        """
+        page_size = page_size or self.page_size
+        if prefetch_pages is None:
+            prefetch_pages = self.prefetch_pages
+
+        page = 1
+        payload = await self._fetch_page(page=page, page_size=page_size)
+        total_pages = (payload.get("meta") or {}).get("total_pages")
+
+        if prefetch_pages <= 0 or total_pages is None:
+            while True:
+                page_items = self._parse_page(payload)
+                if page_items:
+                    yield page_items
+                if not page_items or self._is_last_page(payload, page, page_size):
+                    return
+                page += 1
+                payload = await self._fetch_page(page=page, page_size=page_size)
+
+        page_items = self._parse_page(payload)
+        if page_items:
+            yield page_items
+        if not page_items or total_pages <= 1:
+            return
+
+        pending: list[asyncio.Task] = []
+        next_page = 2
+        try:
+            while pending or next_page <= total_pages:
+                while len(pending) < prefetch_pages and next_page <= total_pages:
+                    pending.append(
+                        asyncio.create_task(self._fetch_page(next_page, page_size))
+                    )
+                    next_page += 1
+                page_items = self._parse_page(await pending.pop(0))
+                if page_items:
+                    yield page_items
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def iter_all(
+        self, page_size: int | None = None, prefetch_pages: int | None = None
+    ) -> AsyncIterator[T]:
+        """
+        Lazily yield every record of the view.
+
+        :param page_size: Number of records requested per page.
+        :param prefetch_pages: Number of pages fetched ahead, 0 to fetch one at a time.
+        :return: Async iterator over DTOs.
+        """
+        async for page in self.iter_pages(
+            page_size=page_size, prefetch_pages=prefetch_pages
+        ):
+            for item in page:
+                yield item
+
+    async def find_all(
+        self, page_size: int | None = None, prefetch_pages: int | None = None
+    ) -> list[T]:
+        return [
+            item
+            async for item in self.iter_all(
+                page_size=page_size, prefetch_pages=prefetch_pages
+            )
+        ]
+
+    async def find_by_id(self, entity_id: str) -> T:
+        url = f"{self.api_endpoint}/{entity_id}"
+        response = await self._api_client.get(url)
+        return self._dto_class.from_dict(self._unwrap(response.json()))
+
+    async def update_one(self, updated_data: T) -> T:
+        url = f"{self.api_endpoint}/{updated_data.id}"
+        response = await self._api_client.put(url, json=updated_data.model_dump())
+        return self._dto_class.from_dict(self._unwrap(response.json()))
+
+    async def delete_one(self, entity_id: str) -> bool:
+        url = f"{self.api_endpoint}/{entity_id}"
+        response = await self._api_client.delete(url)
+        return response.status_code == 204
+
+    async def create_one(self, new_data: T) -> T:
+        response = await self._api_client.post(
+            self.api_endpoint, json=new_data.model_dump()
+        )
+        return self._dto_class.from_dict(self._unwrap(response.json()))
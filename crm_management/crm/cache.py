@@ -0,0 +1,223 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+@dataclass
+class CachedResponse:
+    """Body and headers of a cached GET response."""
+
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def etag(self) -> str | None:
+        return CaseInsensitiveDict(self.headers).get("ETag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return CaseInsensitiveDict(self.headers).get("Last-Modified")
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> "CachedResponse":
+        return cls(
+            url=response.url,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=response.content,
+        )
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        return response
+
+
+@dataclass
+class CacheStats:
+    """Counters of how the requests going through a `ResponseCache` were served."""
+
+    hits: int = 0
+    revalidations: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served without downloading the payload again."""
+        lookups = self.hits + self.revalidations + self.misses
+        return (self.hits + self.revalidations) / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """Base class of the caches `APIClient` can keep its GET responses in."""
+
+    def __init__(self):
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def count(self, event: str) -> None:
+        """Increment a counter of `stats`, from any of the threads sharing the cache."""
+        with self._lock:
+            setattr(self.stats, event, getattr(self.stats, event) + 1)
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class LRUResponseCache(ResponseCache):
+    """In-memory cache evicting the least recently used responses."""
+
+    def __init__(self, max_entries: int = 10_000, max_bytes: int = 64 * 1024**2):
+        """
+        :param max_entries: Maximum number of responses kept.
+        :param max_bytes: Maximum total size of the response bodies kept.
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._size = 0
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        if len(entry.content) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= len(entry.content)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._size -= len(self._entries.pop(key).content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class SQLiteResponseCache(ResponseCache):
+    """On-disk cache, so responses survive across runs of the scripts."""
+
+    def __init__(self, path: str, max_entries: int = 100_000):
+        """
+        :param path: Path of the SQLite database file.
+        :param max_entries: Maximum number of responses kept.
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self._writes = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, url TEXT, status_code INTEGER, "
+                "headers TEXT, content BLOB, stored_at REAL, used_at REAL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_responses_used_at ON responses (used_at)"
+            )
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT url, status_code, headers, content, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key)
+            )
+        url, status_code, headers, content, stored_at = row
+        return CachedResponse(url, status_code, json.loads(headers), content, stored_at)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.url,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.stored_at,
+                    time.time(),
+                ),
+            )
+            # Trimming scans the table, so it is only done every so many writes
+            self._writes += 1
+            if self._writes % 100 == 0:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                    "ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock, self._connection:
+            # A range over the primary key, so the deletion uses its index
+            self._connection.execute(
+                "DELETE FROM responses WHERE key >= ? AND key < ?",
+                (prefix, f"{prefix}\U0010ffff"),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
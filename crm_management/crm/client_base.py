@@ -1,25 +1,252 @@
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Any, Mapping
+
 import requests
-from typing import Optional, Any
+from requests.adapters import HTTPAdapter
+
+from crm_management.crm.cache import ResponseCache, CachedResponse
+from crm_management.crm.rate_limiter import TokenBucket
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def backoff_delay(attempt: int, backoff_factor: float, max_backoff: float) -> float:
+    """Exponential backoff with full jitter for the given zero-based retry attempt."""
+    return random.uniform(0, min(max_backoff, backoff_factor * 2**attempt))
+
+
+def retry_delay_from_headers(headers: Mapping[str, str]) -> float | None:
+    """
+    Read how long the server asked clients to wait before retrying.
+
+    `Retry-After` (in seconds or as an HTTP date) takes precedence over the
+    `X-RateLimit-Reset` header (as seconds or as an epoch timestamp), which is
+    only honored once the rate limit is exhausted.
+
+    :param headers: Case-insensitive response headers.
+    :return: Delay in seconds, or None if the headers do not specify one.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+
+    rate_limit_reset = headers.get("X-RateLimit-Reset")
+    if rate_limit_reset is not None and headers.get("X-RateLimit-Remaining") in (
+        None,
+        "0",
+    ):
+        try:
+            reset = float(rate_limit_reset)
+            # Large values are epoch timestamps rather than relative seconds
+            if reset > 1e9:
+                reset -= time.time()
+            return max(0.0, reset)
+        except ValueError:
+            pass
+
+    return None
+
+
+@dataclass
+class RequestStats:
+    """Metrics of a single logical request, including all of its retries."""
+
+    method: str
+    url: str
+    status_code: int | None
+    latency: float
+    retries: int
+
+
+@dataclass
+class ClientStats:
+    """Aggregated metrics of all the requests sent by an `APIClient`."""
+
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    total_latency: float = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
 
 
 class APIClient:
-    def __init__(self, base_url: str, headers: Optional[dict[str, str]] = None):
+    def __init__(
+        self,
+        base_url: str,
+        headers: Optional[dict[str, str]] = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        history_size: int = 1000,
+        rate_limiter: TokenBucket | None = None,
+        cache: ResponseCache | None = None,
+        cache_ttl: float = 0.0,
+    ):
         """
         Initialize the API client.
 
+        Requests are sent through a persistent `requests.Session`, so TCP and TLS
+        connections are pooled and reused across calls instead of being opened for
+        every request.
+
         :param base_url: Base URL for the API.
         :param headers: Optional headers to include in all requests.
+        :param pool_size: Maximum number of connections kept open per host.
+        :param keep_alive: Whether connections are kept alive between requests.
+        :param connect_timeout: Seconds to wait for a connection to be established.
+        :param read_timeout: Seconds to wait for the server to send a response.
+        :param max_retries: Maximum number of retries for throttled or failed requests.
+        :param backoff_factor: Base delay in seconds of the exponential backoff.
+        :param max_backoff: Upper bound in seconds for a single backoff delay.
+        :param history_size: Number of per-request metrics kept in `history`.
+        :param rate_limiter: Optional limiter every attempt, retries included, must
+            acquire a token from before being sent.
+        :param cache: Optional cache GET responses are kept in. Cached responses
+            older than `cache_ttl` are revalidated with a conditional GET using
+            their `ETag`/`Last-Modified`, so unchanged payloads cost a 304.
+        :param cache_ttl: Seconds a cached response is served without revalidation.
         """
         self.base_url = base_url.rstrip("/")
         self.headers = headers or {}
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.stats = ClientStats()
+        self.history: deque[RequestStats] = deque(maxlen=history_size)
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self._stats_lock = threading.Lock()
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(self.headers)
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
+
+    def __enter__(self) -> "APIClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all the pooled connections."""
+        self._session.close()
 
     def _build_url(self, endpoint: str) -> str:
         """Helper method to construct full URL from base URL and endpoint."""
         return f"{self.base_url}/{endpoint.lstrip('/')}"
 
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given retry attempt."""
+        return backoff_delay(attempt, self.backoff_factor, self.max_backoff)
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Compute how long to wait before retrying a throttled or failed response.
+
+        :param response: Response that triggered the retry.
+        :param attempt: Zero-based number of the attempt that failed.
+        :return: Delay in seconds.
+        """
+        delay = retry_delay_from_headers(response.headers)
+        return self._backoff(attempt) if delay is None else delay
+
+    def _should_retry(
+        self,
+        method: str,
+        response: requests.Response | None = None,
+        error: requests.RequestException | None = None,
+    ) -> bool:
+        """
+        Decide if a request can be retried safely.
+
+        Non-idempotent methods are only retried when the server certainly did not
+        process them, i.e. on throttling or when no connection could be made.
+        """
+        if method.upper() in IDEMPOTENT_METHODS:
+            if error is not None:
+                return isinstance(error, (requests.ConnectionError, requests.Timeout))
+            return response is not None and (
+                response.status_code in RETRYABLE_STATUS_CODES
+            )
+        if error is not None:
+            return isinstance(error, requests.ConnectTimeout)
+        return response is not None and response.status_code == 429
+
+    def _record(
+        self, method: str, url: str, status_code: int | None, start: float, retries: int
+    ) -> None:
+        latency = time.perf_counter() - start
+        with self._stats_lock:
+            self.history.append(
+                RequestStats(method, url, status_code, latency, retries)
+            )
+            self.stats.requests += 1
+            self.stats.retries += retries
+            self.stats.total_latency += latency
+            if status_code is None or status_code >= 400:
+                self.stats.failures += 1
+
+    def _cache_key(self, endpoint: str, params: Optional[dict[str, Any]]) -> str:
+        """Full URL of a GET request, with its query parameters in a stable order."""
+        return (
+            requests.Request(
+                "GET",
+                self._build_url(endpoint),
+                params=sorted((params or {}).items()),
+            )
+            .prepare()
+            .url
+        )
+
+    def invalidate(self, endpoint: str, prefix: bool = False) -> None:
+        """
+        Drop the cached responses of an endpoint, whatever their query parameters.
+
+        :param endpoint: API endpoint.
+        :param prefix: Also drop the responses of every URL starting with the endpoint.
+        """
+        if self.cache is None:
+            return
+        url = self._build_url(endpoint)
+        if prefix:
+            self.cache.delete_prefix(url)
+        else:
+            self.cache.delete(url)
+            self.cache.delete_prefix(f"{url}?")
+        self.cache.count("invalidations")
+
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """
-        Make a generic HTTP request.
+        Make a generic HTTP request, retrying throttled and transient failures.
 
         :param method: HTTP method ('GET', 'POST', 'PUT', 'DELETE').
         :param endpoint: API endpoint.
@@ -27,21 +254,95 @@ class APIClient:
         :return: Response object.
         """
         url = self._build_url(endpoint)
-        response = requests.request(method, url, headers=self.headers, **kwargs)
-        response.raise_for_status()
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.perf_counter()
+        retries = 0
+
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self._session.request(method, url, **kwargs)
+            except requests.RequestException as error:
+                if retries >= self.max_retries or not self._should_retry(
+                    method, error=error
+                ):
+                    self._record(method, url, None, start, retries)
+                    raise
+                delay = self._backoff(retries)
+            else:
+                if retries >= self.max_retries or not self._should_retry(
+                    method, response=response
+                ):
+                    break
+                delay = self._retry_delay(response, retries)
+                response.close()
+
+            time.sleep(delay)
+            retries += 1
+
+        self._record(method, url, response.status_code, start, retries)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            # Release the connection of a streamed response nobody will read
+            response.close()
+            raise
+        if method.upper() != "GET":
+            self.invalidate(endpoint)
         return response
 
     def get(
-        self, endpoint: str, params: Optional[dict[str, Any]] = None
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        stream: bool = False,
+        cache: bool = True,
     ) -> requests.Response:
         """
         Send a GET request.
 
         :param endpoint: API endpoint.
         :param params: Query parameters.
+        :param stream: Return as soon as the headers arrived and leave the body
+            to be read incrementally, e.g. with `response.iter_content()`. Streamed
+            responses bypass the cache, and the caller must close them.
+        :param cache: Go through the response cache, if any. Turn it off for
+            responses that are not read again, e.g. the pages of a full listing.
         :return: Response object.
         """
-        return self._request("GET", endpoint, params=params)
+        if stream:
+            return self._request("GET", endpoint, params=params, stream=True)
+        if self.cache is None or not cache:
+            return self._request("GET", endpoint, params=params)
+
+        key = self._cache_key(endpoint, params)
+        entry = self.cache.get(key)
+        if entry is not None and time.time() - entry.stored_at < self.cache_ttl:
+            self.cache.count("hits")
+            return entry.to_response()
+
+        headers = {}
+        if entry is not None and entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        response = self._request("GET", endpoint, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            self.cache.count("revalidations")
+            entry.stored_at = time.time()
+            self.cache.set(key, entry)
+            return entry.to_response()
+
+        self.cache.count("misses")
+        if response.status_code == 200 and (
+            self.cache_ttl > 0
+            or "ETag" in response.headers
+            or "Last-Modified" in response.headers
+        ):
+            self.cache.set(key, CachedResponse.from_response(response))
+        return response
 
     def post(
         self,
@@ -4,3 +4,20 @@ from dataclasses import dataclass
 @dataclass
 class APIConfig:
     BASE_URL: str = "https://sbtitest-org.myfreshworks.com/crm/sales"
+    POOL_SIZE: int = 10
+    KEEP_ALIVE: bool = True
+    CONNECT_TIMEOUT: float = 5.0
+    READ_TIMEOUT: float = 30.0
+    MAX_RETRIES: int = 5
+    BACKOFF_FACTOR: float = 0.5
+    MAX_BACKOFF: float = 60.0
+    PAGE_SIZE: int = 100
+    REQUESTS_PER_MINUTE: float = 100
+    PREFETCH_PAGES: int = 4
+    WRITE_WORKERS: int = 8
+    CACHE_BACKEND: str | None = "memory"
+    CACHE_TTL: float = 0.0
+    CACHE_PATH: str = ".crm_cache.sqlite"
+    CACHE_VIEW_PAGES: bool = False
+    STREAM_RESPONSES: bool = False
+    STREAM_CHUNK_SIZE: int = 64 * 1024
@@ -1,11 +1,226 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
+from functools import cache
+from typing import Any, ClassVar, Iterable, TypeVar, Generic
+
+import pandas
+from pydantic import AliasPath, BaseModel, TypeAdapter, ValidationError
+
+D = TypeVar("D", bound="BaseDTO")
+
+
+@dataclass
+class DecodeError:
+    """A raw CRM record that could not be turned into a DTO."""
+
+    index: int
+    item: dict[str, Any]
+    error: str
+
+
+@dataclass
+class DecodeResult(Generic[D]):
+    """DTOs decoded from a batch of raw CRM records, and the records rejected."""
+
+    items: list[D] = field(default_factory=list)
+    errors: list[DecodeError] = field(default_factory=list)
+
+
+def enum_dtype(enum_class: type[Enum]) -> pandas.CategoricalDtype:
+    """Categorical dtype of the values of an enum, for a DTO's `frame_schema`."""
+    return pandas.CategoricalDtype([member.value for member in enum_class])
+
+
+def _frame_column(values: list[Any], dtype: Any) -> Any:
+    """Array of a column of values in a `frame_schema` dtype."""
+    dtype = pandas.api.types.pandas_dtype(dtype)
+    if isinstance(dtype, pandas.CategoricalDtype):
+        return pandas.Categorical(
+            [value.value if isinstance(value, Enum) else value for value in values],
+            dtype=dtype,
+        )
+    if isinstance(dtype, pandas.DatetimeTZDtype):
+        return pandas.to_datetime(values, utc=True, format="ISO8601").tz_convert(
+            dtype.tz
+        )
+    if pandas.api.types.is_datetime64_dtype(dtype):
+        return pandas.to_datetime([_wall_clock(value) for value in values]).astype(
+            dtype
+        )
+    if pandas.api.types.is_numeric_dtype(dtype):
+        return pandas.to_numeric(pandas.Series(values, dtype=object)).astype(dtype)
+    return pandas.array(values, dtype=dtype)
+
+
+def _wall_clock(value: Any) -> Any:
+    """
+    Naive datetime of the local time a value was recorded in, dropping its
+    offset without converting it, as the DB mirror stores it.
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    return value
+
+
+def _alias_path(name: str, alias: Any) -> list[str | int]:
+    """Keys leading to a field in the raw CRM record, from its validation alias."""
+    if isinstance(alias, AliasPath):
+        return alias.path
+    return [alias if isinstance(alias, str) else name]
+
 
-from pydantic import BaseModel
+@cache
+def _list_adapter(dto_class: type[D]) -> TypeAdapter[list[D]]:
+    """Validator of a whole list of DTOs, built once per DTO class."""
+    return TypeAdapter(list[dto_class])
 
 
 class BaseDTO(BaseModel):
+    """
+    Base class of the DTOs of the CRM records.
+
+    Subclasses map the raw CRM payload to their fields declaratively, with a
+    `validation_alias` (an `AliasPath` for the custom fields) on every field
+    whose name differs from the CRM's. Decoding a record is then a single pass
+    of pydantic's compiled validator, without an intermediate dict.
+    """
+
     id: int
 
+    # pandas dtype of the columns of the frames built from the DTOs, by field
+    frame_schema: ClassVar[dict[str, Any]] = {}
+
     class Config:
         use_enum_values = True
+        populate_by_name = True
         json_encoders = {datetime: lambda dt: dt.isoformat()}
+
+    @classmethod
+    def from_dict(cls: type[D], data: dict[str, Any]) -> D:
+        return cls.model_validate(data)
+
+    @classmethod
+    def from_dicts(cls: type[D], items: Iterable[dict[str, Any]]) -> DecodeResult[D]:
+        """
+        Decode a batch of raw CRM records, e.g. a page of a view, at once.
+
+        The records are validated in a single call of a list validator built once
+        per DTO class, instead of one model construction per record. Records that
+        fail validation are reported in the result instead of aborting the batch.
+
+        :param items: Raw CRM records.
+        :return: Decoded DTOs, in order, and the rejected records.
+        """
+        items = list(items)
+        adapter = _list_adapter(cls)
+        try:
+            return DecodeResult(items=adapter.validate_python(items))
+        except ValidationError as validation_error:
+            invalid: dict[int, list[str]] = {}
+            for error in validation_error.errors():
+                location = ".".join(map(str, error["loc"][1:]))
+                invalid.setdefault(error["loc"][0], []).append(
+                    f"{location}: {error['msg']}"
+                )
+
+        return DecodeResult(
+            items=adapter.validate_python(
+                [item for index, item in enumerate(items) if index not in invalid]
+            ),
+            errors=[
+                DecodeError(index=index, item=items[index], error="; ".join(messages))
+                for index, messages in sorted(invalid.items())
+            ],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return self.model_dump()
+
+    @classmethod
+    def _frame_columns(cls, columns: Iterable[str] | None) -> list[str]:
+        columns = list(cls.model_fields if columns is None else columns)
+        unknown = set(columns) - set(cls.model_fields)
+        if unknown:
+            raise ValueError(f"{cls.__name__} has no fields {sorted(unknown)}.")
+        return columns
+
+    @classmethod
+    def to_frame(
+        cls, dtos: Iterable[D], columns: Iterable[str] | None = None
+    ) -> pandas.DataFrame:
+        """
+        Load a batch of DTOs into a data frame, column by column.
+
+        Each column is built from the DTOs' fields in one go and typed with the
+        `frame_schema`, e.g. categoricals for the enums and nullable integers,
+        instead of going through a dict per DTO and letting pandas infer
+        `object` columns.
+
+        :param dtos: DTOs of this class.
+        :param columns: Fields to load, all of them by default.
+        :return: One row per DTO.
+        """
+        dtos = list(dtos)
+        return pandas.DataFrame(
+            {
+                name: _frame_column(
+                    [dto.__dict__[name] for dto in dtos],
+                    cls.frame_schema.get(name, object),
+                )
+                for name in cls._frame_columns(columns)
+            }
+        )
+
+    @classmethod
+    def frame_from_dicts(
+        cls, items: Iterable[dict[str, Any]], columns: Iterable[str] | None = None
+    ) -> pandas.DataFrame:
+        """
+        Load raw CRM records straight into a data frame, without building DTOs.
+
+        Fields are read from the records through their validation aliases and
+        converted by the `frame_schema` dtypes only, so the records are not
+        validated: values that do not fit a dtype are an error, and enum values
+        unknown to a categorical are read as missing.
+
+        :param items: Raw CRM records.
+        :param columns: Fields to load, all of them by default.
+        :return: One row per record.
+        """
+        items = list(items)
+        frame = {}
+        for name in cls._frame_columns(columns):
+            path = _alias_path(name, cls.model_fields[name].validation_alias)
+            values = []
+            for item in items:
+                value = item
+                for key in path:
+                    value = value.get(key) if isinstance(value, dict) else None
+                values.append(value)
+            frame[name] = _frame_column(values, cls.frame_schema.get(name, object))
+        return pandas.DataFrame(frame)
+
+    def content_hash(self) -> str:
+        """
+        Digest of the canonical form of the record's fields, `id` excluded.
+
+        Enum members are reduced to their values and datetimes to their naive
+        wall-clock time, the way the DB mirror stores them, so a record hashes
+        the same whether it was read from the CRM or the DB.
+        """
+        canonical = {}
+        for name, value in self.model_dump(exclude={"id"}).items():
+            if isinstance(value, Enum):
+                value = value.value
+            elif isinstance(value, datetime):
+                value = _wall_clock(value).isoformat()
+            canonical[name] = value
+        payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
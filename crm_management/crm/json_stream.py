@@ -0,0 +1,114 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARACTERS = "0123456789+-.eE"
+
+
+class JSONArrayStream:
+    """
+    Incremental reader of a JSON object whose largest member is an array.
+
+    The CRM views answer with an object such as
+    `{"deals": [...], "meta": {...}}`. Iterating over this class yields the
+    elements of the array under `key` one by one, decoding them as soon as
+    their bytes have arrived, so neither the whole body nor the whole dict tree
+    is ever held in memory. The other members of the object, e.g. the
+    pagination metadata, are small and are kept in `members` once read.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], key: str):
+        """
+        :param chunks: Raw body of the response, e.g. `response.iter_content()`.
+        :param key: Member of the top-level object holding the array.
+        """
+        self.key = key
+        self.members: dict[str, Any] = {}
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def _read_more(self) -> bool:
+        """Append the next chunk to the buffer, dropping what was already parsed."""
+        if self._exhausted:
+            return False
+        self._buffer = self._buffer[self._position :]
+        self._position = 0
+        for chunk in self._chunks:
+            text = self._text_decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        self._exhausted = True
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, '' at the end of the body."""
+        while True:
+            while (
+                self._position < len(self._buffer)
+                and self._buffer[self._position] in _WHITESPACE
+            ):
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_more():
+                return ""
+
+    def _expect(self, characters: str) -> str:
+        character = self._peek()
+        if not character or character not in characters:
+            raise json.JSONDecodeError(
+                f"Expecting one of {characters!r}", self._buffer, self._position
+            )
+        self._position += 1
+        return character
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value, reading more of the body as needed."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk,
+            # e.g. "2.5e" is read as 2.5 until the exponent digits arrive
+            if (
+                not self._exhausted
+                and isinstance(value, (int, float))
+                and self._buffer[end:].strip(_NUMBER_CHARACTERS) == ""
+            ):
+                self._read_more()
+                continue
+            self._position = end
+            return value
+
+    def __iter__(self) -> Iterator[Any]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._position += 1
+            return
+        while True:
+            name = self._value()
+            self._expect(":")
+            if name == self.key and self._peek() == "[":
+                self._position += 1
+                if self._peek() == "]":
+                    self._position += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(",]") == "]":
+                            break
+            else:
+                self.members[name] = self._value()
+            if self._expect(",}") == "}":
+                return
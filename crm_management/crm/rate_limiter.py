@@ -0,0 +1,54 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how many requests are sent per minute.
+
+    Tokens are handed out as reservations: a caller that finds the bucket empty
+    takes its token anyway and waits until the bucket would have refilled it, so
+    concurrent callers are served in arrival order and never exceed the rate.
+    """
+
+    def __init__(self, requests_per_minute: float, capacity: float | None = None):
+        """
+        :param requests_per_minute: Sustained rate allowed by the API plan.
+        :param capacity: Maximum number of requests that can be sent in a burst.
+            Defaults to the requests of 10 seconds, and at least one.
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be greater than 0.")
+        self.rate = requests_per_minute / 60.0
+        if capacity is None:
+            capacity = max(1.0, requests_per_minute / 6)
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float = 1.0) -> float:
+        """Take `tokens` from the bucket and return how long to wait for them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until `tokens` are available."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Wait, without blocking the event loop, until `tokens` are available."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
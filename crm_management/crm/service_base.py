@@ -1,20 +1,95 @@
 import os
+import threading
 from abc import abstractmethod
-from typing import TypeVar, Generic, Type
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from datetime import datetime, timezone
+from typing import TypeVar, Generic, Type, Iterator, Any
 
+from crm_management.crm.cache import (
+    ResponseCache,
+    LRUResponseCache,
+    SQLiteResponseCache,
+)
 from crm_management.crm.client_base import APIClient
 from crm_management.crm.config import APIConfig
-from crm_management.crm.dto_base import BaseDTO
+from crm_management.crm.dto_base import BaseDTO, DecodeError
+from crm_management.crm.json_stream import JSONArrayStream
+from crm_management.crm.rate_limiter import TokenBucket
 
 T = TypeVar("T", bound=BaseDTO)
 
 
+def parse_crm_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp sent by the CRM into a naive UTC datetime."""
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
 class CRMBaseAPI(Generic[T]):
-    def __init__(self, api_endpoint: str, dto_class: Type[T]):
+    # All the domain APIs share the same plan quota, so they share one limiter
+    __rate_limiter: TokenBucket | None = None
+    __response_cache: ResponseCache | None = None
+    # Held while the shared limiter and cache are created, so threads building
+    # their first API at the same time do not each get their own
+    __shared_lock = threading.Lock()
+    # Number of streamed records decoded together into DTOs
+    stream_decode_batch: int = 100
+
+    def __init__(
+        self,
+        api_endpoint: str,
+        dto_class: Type[T],
+        view_id: str | None = None,
+        collection_key: str | None = None,
+        page_size: int = APIConfig.PAGE_SIZE,
+        prefetch_pages: int = APIConfig.PREFETCH_PAGES,
+        stream_responses: bool | None = None,
+        cache_view_pages: bool | None = None,
+    ):
         self.api_endpoint = api_endpoint
+        self.view_id = view_id
+        self.collection_key = collection_key
+        self.page_size = page_size
+        self.prefetch_pages = prefetch_pages
+        self.stream_responses = stream_responses
+        self.cache_view_pages = cache_view_pages
+        # Records of the listed pages that could not be decoded into DTOs
+        self.decode_errors: deque[DecodeError] = deque(maxlen=1000)
+        # Number of records ever rejected, including those rotated out of
+        # `decode_errors`
+        self.decode_error_count = 0
         self._dto_class: Type[T] = dto_class
         self.__api_client: APIClient | None = None
 
+    @classmethod
+    def _rate_limiter(cls) -> TokenBucket:
+        with CRMBaseAPI.__shared_lock:
+            if CRMBaseAPI.__rate_limiter is None:
+                CRMBaseAPI.__rate_limiter = TokenBucket(
+                    requests_per_minute=float(
+                        os.getenv(
+                            "CRM_REQUESTS_PER_MINUTE", APIConfig.REQUESTS_PER_MINUTE
+                        )
+                    )
+                )
+            return CRMBaseAPI.__rate_limiter
+
+    @classmethod
+    def _response_cache(cls) -> ResponseCache | None:
+        with CRMBaseAPI.__shared_lock:
+            if CRMBaseAPI.__response_cache is None:
+                backend = os.getenv("CRM_CACHE_BACKEND", APIConfig.CACHE_BACKEND)
+                if backend == "memory":
+                    CRMBaseAPI.__response_cache = LRUResponseCache()
+                elif backend == "sqlite":
+                    CRMBaseAPI.__response_cache = SQLiteResponseCache(
+                        os.getenv("CRM_CACHE_PATH", APIConfig.CACHE_PATH)
+                    )
+            return CRMBaseAPI.__response_cache
+
     @property
     def _api_client(self) -> APIClient:
         if self.__api_client is None:
@@ -24,12 +99,271 @@ class CRMBaseAPI(Generic[T]):
                     "Authorization": f"Token token={os.getenv('CRM_API_TOKEN')}",
                     "Content-Type": "application/json",
                 },
+                pool_size=APIConfig.POOL_SIZE,
+                keep_alive=APIConfig.KEEP_ALIVE,
+                connect_timeout=APIConfig.CONNECT_TIMEOUT,
+                read_timeout=APIConfig.READ_TIMEOUT,
+                max_retries=APIConfig.MAX_RETRIES,
+                backoff_factor=APIConfig.BACKOFF_FACTOR,
+                max_backoff=APIConfig.MAX_BACKOFF,
+                rate_limiter=self._rate_limiter(),
+                cache=self._response_cache(),
+                cache_ttl=float(os.getenv("CRM_CACHE_TTL", APIConfig.CACHE_TTL)),
             )
         return self.__api_client
 
-    @abstractmethod
-    def find_all(self) -> list[T]:
-        pass
+    def invalidate(self, entity_id: str | int) -> None:
+        """Drop the cached responses of a record and of the view listing it."""
+        self._api_client.invalidate(f"{self.api_endpoint}/{entity_id}")
+        if self.view_id is not None:
+            self._api_client.invalidate(self.view_endpoint, prefix=True)
+
+    @property
+    def view_endpoint(self) -> str:
+        if self.view_id is None or self.collection_key is None:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not define a view to list records from."
+            )
+        return f"{self.api_endpoint}/view/{self.view_id}"
+
+    def _fetch_page(self, page: int, page_size: int, **params: Any) -> dict[str, Any]:
+        """Fetch the raw payload of a single page of the view."""
+        return self._api_client.get(
+            self.view_endpoint,
+            params={"page": page, "per_page": page_size, **params},
+            cache=self._caches_view_pages(),
+        ).json()
+
+    def _is_last_page(
+        self,
+        payload: dict[str, Any],
+        page: int,
+        page_size: int,
+        item_count: int | None = None,
+    ) -> bool:
+        """
+        Check the pagination metadata of a page payload.
+
+        Falls back to a short page when the response has no `meta.total_pages`.
+        """
+        total_pages = (payload.get("meta") or {}).get("total_pages")
+        if total_pages is not None:
+            return page >= total_pages
+        if item_count is None:
+            item_count = len(payload.get(self.collection_key) or [])
+        return item_count < page_size
+
+    def _caches_view_pages(self) -> bool:
+        # A sync reads every page once, so caching them only holds memory
+        if self.cache_view_pages is not None:
+            return self.cache_view_pages
+        return os.getenv(
+            "CRM_CACHE_VIEW_PAGES", str(APIConfig.CACHE_VIEW_PAGES)
+        ).lower() in ("1", "true", "yes")
+
+    def _streams_responses(self) -> bool:
+        if self.stream_responses is not None:
+            return self.stream_responses
+        return os.getenv(
+            "CRM_STREAM_RESPONSES", str(APIConfig.STREAM_RESPONSES)
+        ).lower() in ("1", "true", "yes")
+
+    def _decode(self, items: list[dict[str, Any]]) -> list[T]:
+        """Decode a batch of raw records, keeping aside those that are invalid."""
+        result = self._dto_class.from_dicts(items)
+        self._keep_decode_errors(result.errors)
+        return result.items
+
+    def _keep_decode_errors(self, errors: list[DecodeError]) -> None:
+        self.decode_errors.extend(errors)
+        self.decode_error_count += len(errors)
+
+    def _parse_page(self, payload: dict[str, Any]) -> list[T]:
+        """Build the DTOs of the records listed in a page payload."""
+        return self._decode(payload.get(self.collection_key) or [])
+
+    def iter_pages(
+        self, page_size: int | None = None, prefetch_pages: int | None = None
+    ) -> Iterator[list[T]]:
+        """
+        Lazily walk every page of the view, following its pagination metadata.
+
+        Once the first page reveals how many pages there are, up to
+        `prefetch_pages` of the following pages are fetched concurrently while
+        the current one is being consumed. Pages are still yielded in order, and
+        every request goes through the shared rate limiter.
+
+        :param page_size: Number of records requested per page.
+        :param prefetch_pages: Number of pages fetched ahead, 0 to fetch one at a time.
+        :return: Iterator over the DTOs of each page.
+        """
+        page_size = page_size or self.page_size
+        if prefetch_pages is None:
+            prefetch_pages = self.prefetch_pages
+
+        payload = self._fetch_page(page=1, page_size=page_size)
+        total_pages = (payload.get("meta") or {}).get("total_pages")
+        if prefetch_pages <= 0 or total_pages is None:
+            yield from self._iter_pages_sequentially(payload, page_size)
+            return
+
+        page_items = self._parse_page(payload)
+        if page_items:
+            yield page_items
+        if not page_items or total_pages <= 1:
+            return
+
+        pending: deque[Future] = deque()
+        next_page = 2
+        with ThreadPoolExecutor(max_workers=prefetch_pages) as executor:
+            try:
+                while pending or next_page <= total_pages:
+                    while len(pending) < prefetch_pages and next_page <= total_pages:
+                        pending.append(
+                            executor.submit(self._fetch_page, next_page, page_size)
+                        )
+                        next_page += 1
+                    page_items = self._parse_page(pending.popleft().result())
+                    if page_items:
+                        yield page_items
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _iter_pages_sequentially(
+        self, payload: dict[str, Any], page_size: int
+    ) -> Iterator[list[T]]:
+        """Walk the view one page at a time, starting from an already fetched page."""
+        page = 1
+        while True:
+            page_items = self._parse_page(payload)
+            if page_items:
+                yield page_items
+            if not page_items or self._is_last_page(payload, page, page_size):
+                return
+            page += 1
+            payload = self._fetch_page(page=page, page_size=page_size)
+
+    def iter_streamed(self, page_size: int | None = None) -> Iterator[T]:
+        """
+        Lazily yield every record of the view, decoding each response as it arrives.
+
+        The record array of every page is parsed incrementally from the response
+        stream, and DTOs are built `stream_decode_batch` records at a time, so
+        neither the raw body nor the dict tree of a whole page is ever held in
+        memory. Pages are fetched one at a time, which keeps large pages cheap.
+
+        :param page_size: Number of records requested per page.
+        :return: Iterator over DTOs.
+        """
+        page_size = page_size or self.page_size
+        page = 1
+        while True:
+            with self._api_client.get(
+                self.view_endpoint,
+                params={"page": page, "per_page": page_size},
+                stream=True,
+            ) as response:
+                items = JSONArrayStream(
+                    response.iter_content(APIConfig.STREAM_CHUNK_SIZE),
+                    self.collection_key,
+                )
+                item_count = 0
+                batch: list[dict[str, Any]] = []
+                for item in items:
+                    item_count += 1
+                    batch.append(item)
+                    if len(batch) >= self.stream_decode_batch:
+                        yield from self._decode(batch)
+                        batch = []
+                yield from self._decode(batch)
+
+            if not item_count or self._is_last_page(
+                items.members, page, page_size, item_count
+            ):
+                return
+            page += 1
+
+    def iter_all(
+        self,
+        page_size: int | None = None,
+        prefetch_pages: int | None = None,
+        stream: bool | None = None,
+    ) -> Iterator[T]:
+        """
+        Lazily yield every record of the view, one page in memory at a time.
+
+        :param page_size: Number of records requested per page.
+        :param prefetch_pages: Number of pages fetched ahead, 0 to fetch one at a time.
+        :param stream: Decode the responses incrementally with `iter_streamed`.
+            Defaults to the `CRM_STREAM_RESPONSES` environment variable.
+        :return: Iterator over DTOs.
+        """
+        if stream is None:
+            stream = self._streams_responses()
+        if stream:
+            yield from self.iter_streamed(page_size=page_size)
+            return
+        for page in self.iter_pages(page_size=page_size, prefetch_pages=prefetch_pages):
+            yield from page
+
+    def iter_modified_since(
+        self, since: datetime | None, page_size: int | None = None
+    ) -> Iterator[tuple[T, datetime]]:
+        """
+        Lazily yield the records modified at or after `since`.
+
+        The view is walked sorted by `updated_at`, most recent first, and the walk
+        stops at the first record older than `since`, so only the pages holding
+        modified records are fetched.
+
+        :param since: Naive UTC high-water mark, None to walk the whole view.
+        :param page_size: Number of records requested per page.
+        :return: Iterator over each DTO and its naive UTC `updated_at`.
+        """
+        page_size = page_size or self.page_size
+        page = 1
+        while True:
+            payload = self._fetch_page(
+                page=page, page_size=page_size, sort="updated_at", sort_type="desc"
+            )
+            items = payload.get(self.collection_key) or []
+            modified: list[tuple[dict[str, Any], datetime]] = []
+            for item in items:
+                updated_at = parse_crm_timestamp(item["updated_at"])
+                if since is not None and updated_at < since:
+                    break
+                modified.append((item, updated_at))
+
+            result = self._dto_class.from_dicts(item for item, _ in modified)
+            self._keep_decode_errors(result.errors)
+            invalid = {error.index for error in result.errors}
+            timestamps = [
+                updated_at
+                for index, (_, updated_at) in enumerate(modified)
+                if index not in invalid
+            ]
+            yield from zip(result.items, timestamps)
+
+            if (
+                len(modified) < len(items)
+                or not items
+                or self._is_last_page(payload, page, page_size)
+            ):
+                return
+            page += 1
+
+    def find_all(
+        self,
+        page_size: int | None = None,
+        prefetch_pages: int | None = None,
+        stream: bool | None = None,
+    ) -> list[T]:
+        return list(
+            self.iter_all(
+                page_size=page_size, prefetch_pages=prefetch_pages, stream=stream
+            )
+        )
 
     @abstractmethod
     def find_by_id(self, entity_id: str) -> T:
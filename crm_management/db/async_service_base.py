@@ -0,0 +1,198 @@
+from contextlib import asynccontextmanager
+from typing import (
+    TypeVar,
+    Generic,
+    List,
+    Optional,
+    Any,
+    Type,
+    Iterable,
+    AsyncIterator,
+    Callable,
+)
+
+import pandas
+from sqlalchemy.engine import Row
+from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crm_management.db.orm_base import Base
+from crm_management.db.service_base import (
+    DBBaseAPI,
+    FrameWriteMode,
+    RowFormat,
+    UpsertResult,
+)
+from crm_management.db.unit_of_work import UnitOfWork
+
+T = TypeVar("T", bound=Base)
+R = TypeVar("R")
+
+
+class AsyncDBBaseAPI(Generic[T]):
+    """
+    asyncio sibling of `DBBaseAPI`, on an `AsyncSession`.
+
+    Every operation runs the `DBBaseAPI` implementation on the session's
+    connection through `AsyncSession.run_sync`, so the reads and writes (the
+    bulk upserts, the unit of work batching and the entity cache included)
+    behave exactly as in the sync API, while the driver I/O (e.g. aiosqlite or
+    asyncpg) is awaited and does not block the event loop.
+
+    The session should be created with `expire_on_commit=False`, as the
+    attributes expired by a commit cannot be lazily reloaded outside
+    `run_sync`.
+    """
+
+    # Columns identifying a record across syncs, i.e. its key in the CRM
+    natural_key: tuple[str, ...] = ("id",)
+
+    def __init__(self, session: AsyncSession, model: T):
+        self.session = session
+        self.model = model
+        self._sync_api = DBBaseAPI(session.sync_session, model)
+        self._sync_api.natural_key = self.natural_key
+
+    async def _run(self, method: Callable[..., R], *args, **kwargs) -> R:
+        """Run a method of the sync API in the session's greenlet."""
+        return await self.session.run_sync(lambda _: method(*args, **kwargs))
+
+    @asynccontextmanager
+    async def transaction(
+        self, batch_size: int | None = None
+    ) -> AsyncIterator[UnitOfWork]:
+        """
+        Group the writes made through this API's session into a unit of work,
+        see `DBBaseAPI.transaction`. Its savepoints are not available here.
+
+        :param batch_size: Number of operations committed together, None to
+            commit only when the scope exits.
+        """
+        # Nested scopes join the outer unit of work, which only the scope that
+        # created it may exit
+        scope = UnitOfWork(self.session.sync_session, batch_size=batch_size)
+        unit_of_work = scope.__enter__()
+        try:
+            yield unit_of_work
+        except BaseException as error:
+            await self._run(scope.__exit__, type(error), error, error.__traceback__)
+            raise
+        await self._run(scope.__exit__, None, None, None)
+
+    async def create(self, instance: T) -> T:
+        """Create and persist a new instance."""
+        return await self._run(self._sync_api.create, instance)
+
+    async def get(self, id: int) -> Optional[T]:
+        """Retrieve an instance by its primary key, through the entity cache if any."""
+        return await self._run(self._sync_api.get, id)
+
+    async def get_many(self, ids: Iterable[int]) -> List[T]:
+        """Retrieve all the instances whose primary key is in `ids` in one query."""
+        return await self._run(self._sync_api.get_many, list(ids))
+
+    async def get_field_and_value(self, field: str, value: Any) -> List[T]:
+        """Retrieve all instances where a given field matches a value."""
+        return await self._run(self._sync_api.get_field_and_value, field, value)
+
+    async def find_by_fields(self, **fields) -> T | None:
+        """Find a single record by a combination of fields."""
+        return await self._run(self._sync_api.find_by_fields, **fields)
+
+    async def get_all(self) -> List[T]:
+        """Retrieve all instances."""
+        return await self._run(self._sync_api.get_all)
+
+    async def iter_all(
+        self,
+        chunk_size: int = 1000,
+        row_format: RowFormat = "orm",
+        criteria: Iterable[ColumnElement[bool]] = (),
+    ) -> AsyncIterator[T | Row | dict[str, Any]]:
+        """
+        Stream every instance in primary key order, `chunk_size` rows at a time,
+        with keyset pagination, see `DBBaseAPI.iter_all`.
+        """
+        criteria = tuple(criteria)
+        last_id = None
+        while True:
+            rows = await self._run(
+                self._sync_api._read_page, chunk_size, row_format, criteria, last_id
+            )
+            for row in rows:
+                yield row
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1]["id"] if row_format == "dict" else rows[-1].id
+
+    def iter_field_and_value(
+        self,
+        field: str,
+        value: Any,
+        chunk_size: int = 1000,
+        row_format: RowFormat = "orm",
+    ) -> AsyncIterator[T | Row | dict[str, Any]]:
+        """Stream the instances where a given field matches a value, see `iter_all`."""
+        if not hasattr(self.model, field):
+            raise AttributeError(f"{self.model.__name__} has no attribute '{field}'")
+        return self.iter_all(
+            chunk_size,
+            row_format,
+            criteria=[
+                getattr(self.model, field) == self._sync_api._coerce(field, value)
+            ],
+        )
+
+    async def update(self, id: int, updates: Type[T]) -> Optional[T]:
+        """Update an existing instance by its primary key."""
+        return await self._run(self._sync_api.update, id, updates)
+
+    async def save_many(self, instances: List[T]) -> List[T]:
+        """Insert or update a batch of instances by primary key in a single transaction."""
+        return await self._run(self._sync_api.save_many, instances)
+
+    async def upsert_many(
+        self, instances: Iterable[T], chunk_size: int = 500
+    ) -> UpsertResult:
+        """
+        Insert or update a batch of instances by natural key in a single
+        transaction, see `DBBaseAPI.upsert_many`.
+        """
+        return await self._run(
+            self._sync_api.upsert_many, list(instances), chunk_size=chunk_size
+        )
+
+    async def upsert_rows(
+        self, rows: Iterable[dict[str, Any]], chunk_size: int = 500
+    ) -> UpsertResult:
+        """Same as `upsert_many`, for rows given as dicts of column values."""
+        return await self._run(
+            self._sync_api.upsert_rows, list(rows), chunk_size=chunk_size
+        )
+
+    async def upsert_frame(
+        self,
+        frame: pandas.DataFrame,
+        chunk_size: int = 500,
+        mode: FrameWriteMode = "upsert",
+    ) -> UpsertResult:
+        """Write a data frame to the table, see `DBBaseAPI.upsert_frame`."""
+        return await self._run(
+            self._sync_api.upsert_frame, frame, chunk_size=chunk_size, mode=mode
+        )
+
+    async def get_content_hashes(self) -> dict[int, str | None]:
+        """Retrieve the content hash of every instance by primary key, in one query."""
+        return await self._run(self._sync_api.get_content_hashes)
+
+    async def get_ids(self) -> set[int]:
+        """Retrieve the primary keys of all the instances."""
+        return await self._run(self._sync_api.get_ids)
+
+    async def delete_many(self, ids: Iterable[int]) -> int:
+        """Delete all the instances whose primary key is in `ids` in one statement."""
+        return await self._run(self._sync_api.delete_many, list(ids))
+
+    async def delete(self, id: int) -> bool:
+        """Delete an instance by its primary key."""
+        return await self._run(self._sync_api.delete, id)
@@ -0,0 +1,74 @@
+import os
+from dataclasses import dataclass, replace
+
+
+@dataclass
+class EngineProfile:
+    """Settings of the SQLAlchemy engine and, on SQLite, of its connections."""
+
+    POOL_SIZE: int = 5
+    MAX_OVERFLOW: int = 10
+    POOL_PRE_PING: bool = True
+    POOL_RECYCLE: int = 1800
+    STATEMENT_CACHE_SIZE: int = 500
+    ECHO: bool = False
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024**2
+    # Negative values are in KiB rather than in pages
+    SQLITE_CACHE_SIZE: int = -64 * 1024
+    SQLITE_BUSY_TIMEOUT: int = 5000
+
+
+ENGINE_PROFILES = {
+    "default": EngineProfile(),
+    # One-off loads into a fresh database, trading durability for speed
+    "bulk": EngineProfile(
+        SQLITE_SYNCHRONOUS="OFF", SQLITE_CACHE_SIZE=-256 * 1024, POOL_PRE_PING=False
+    ),
+    # Logs every statement, for troubleshooting only
+    "debug": EngineProfile(ECHO=True),
+}
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+def engine_profile_from_env() -> EngineProfile:
+    """
+    Engine profile named by `DB_ENGINE_PROFILE`, with its settings overridden by
+    the `DB_POOL_SIZE`, `DB_MAX_OVERFLOW`, `DB_POOL_PRE_PING`,
+    `DB_STATEMENT_CACHE_SIZE`, `DB_ECHO` and `DB_SQLITE_SYNCHRONOUS` env variables.
+    """
+    name = os.getenv("DB_ENGINE_PROFILE", "default")
+    if name not in ENGINE_PROFILES:
+        raise ValueError(
+            f"Unknown engine profile '{name}'. Choose from {', '.join(ENGINE_PROFILES)}."
+        )
+    profile = ENGINE_PROFILES[name]
+    return replace(
+        profile,
+        POOL_SIZE=int(os.getenv("DB_POOL_SIZE", profile.POOL_SIZE)),
+        MAX_OVERFLOW=int(os.getenv("DB_MAX_OVERFLOW", profile.MAX_OVERFLOW)),
+        POOL_PRE_PING=_env_bool("DB_POOL_PRE_PING", profile.POOL_PRE_PING),
+        STATEMENT_CACHE_SIZE=int(
+            os.getenv("DB_STATEMENT_CACHE_SIZE", profile.STATEMENT_CACHE_SIZE)
+        ),
+        ECHO=_env_bool("DB_ECHO", profile.ECHO),
+        SQLITE_SYNCHRONOUS=os.getenv(
+            "DB_SQLITE_SYNCHRONOUS", profile.SQLITE_SYNCHRONOUS
+        ),
+    )
+
+
+@dataclass
+class EntityCacheConfig:
+    """Settings of the process-level cache in front of `DBBaseAPI.get`."""
+
+    # 0 disables the cache
+    MAX_ENTRIES: int = 0
+    TTL: float = 300.0
@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+# Keys of `Session.info` holding the rows read by the session's transaction in
+# progress, only published to the cache once it commits, and the keys of the
+# rows it wrote, dropped from the cache when it commits
+STAGED_ROWS = "entity_cache_staged_rows"
+WRITTEN_KEYS = "entity_cache_written_keys"
+
+
+@dataclass
+class EntityCacheStats:
+    """Counters of how the lookups going through an `EntityCache` were served."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class EntityCache:
+    """
+    Process-level LRU cache of DB rows, keyed by model and primary key.
+
+    Entries are snapshots of the column values, not ORM instances, so they can
+    be shared by every session of the process. Entries older than `ttl` seconds
+    are treated as missing, which bounds how stale a row written by another
+    process can be.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 300.0):
+        """
+        :param max_entries: Maximum number of rows kept.
+        :param ttl: Seconds a row is served from the cache after being read.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = EntityCacheStats()
+        self._entries: OrderedDict[Hashable, tuple[dict[str, Any], float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[1] >= self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, columns: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (columns, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable, session: Session | None = None) -> None:
+        """
+        Drop a row, e.g. before writing it.
+
+        :param session: Session writing the row, whose staged copy is dropped too.
+        """
+        if session is not None:
+            self._watch(session)
+            session.info[STAGED_ROWS].pop(key, None)
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def invalidate_model(self, model: type, session: Session | None = None) -> None:
+        """Drop every row of a model, e.g. after a bulk write by natural key."""
+        if session is not None:
+            self._watch(session)
+            staged = session.info[STAGED_ROWS]
+            for key in [key for key in staged if key[0] is model]:
+                del staged[key]
+        with self._lock:
+            for key in [key for key in self._entries if key[0] is model]:
+                del self._entries[key]
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stage(self, session: Session, key: Hashable, columns: dict[str, Any]) -> None:
+        """
+        Keep a row read by the transaction in progress on `session`, to be
+        published to the cache when it commits.
+
+        Until then the row is only visible to the session itself: other
+        sessions must not be served values the transaction wrote and may still
+        roll back. Staged rows are dropped if the transaction rolls back or
+        writes them.
+        """
+        self._watch(session)
+        session.info[STAGED_ROWS][key] = columns
+
+    def _watch(self, session: Session) -> None:
+        """Follow the flushes, commits and rollbacks of a session, once."""
+        if STAGED_ROWS in session.info:
+            return
+        session.info[STAGED_ROWS] = {}
+        session.info[WRITTEN_KEYS] = set()
+        event.listen(session, "after_flush", self._drop_flushed_rows)
+        event.listen(session, "after_commit", self._publish_staged_rows)
+        event.listen(session, "after_soft_rollback", self._drop_staged_rows)
+
+    def _drop_flushed_rows(self, session: Session, flush_context) -> None:
+        # The staged values of the rows written by the flush are outdated
+        staged = session.info[STAGED_ROWS]
+        for instance in [*session.new, *session.dirty, *session.deleted]:
+            identity = inspect(instance).identity
+            if identity is not None and len(identity) == 1:
+                key = (type(instance), identity[0])
+                staged.pop(key, None)
+                session.info[WRITTEN_KEYS].add(key)
+
+    def _publish_staged_rows(self, session: Session) -> None:
+        for key in session.info[WRITTEN_KEYS]:
+            self.invalidate(key)
+        for key, columns in session.info[STAGED_ROWS].items():
+            self.set(key, columns)
+        session.info[STAGED_ROWS].clear()
+        session.info[WRITTEN_KEYS].clear()
+
+    def _drop_staged_rows(self, session: Session, previous_transaction) -> None:
+        # The rows may hold values the rollback just undid
+        session.info[STAGED_ROWS].clear()
+        session.info[WRITTEN_KEYS].clear()
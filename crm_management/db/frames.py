@@ -0,0 +1,63 @@
+from typing import Any, Iterable
+
+import pandas
+from sqlalchemy import Date, DateTime, Table
+from sqlalchemy.sql.schema import Column
+
+
+def frame_rows(
+    frame: pandas.DataFrame, table: Table, unique_by: Iterable[str] | None = None
+) -> list[dict[str, Any]]:
+    """
+    Turn a data frame into the rows of a table, ready for an `executemany`.
+
+    Every column is converted at once to the Python values the driver expects:
+    the values of `Date` columns are normalized to dates whatever they are
+    (timestamps, datetimes or ISO strings), and missing values become None.
+    The rows are then zipped from the column lists, without going through the
+    frame row by row.
+
+    :param frame: One column per column of the table to write.
+    :param table: Table the rows are written to.
+    :param unique_by: Columns identifying a row, e.g. a natural key. Rows
+        sharing them are collapsed, the last one winning.
+    :return: Dicts of column values.
+    """
+    unknown = set(frame.columns) - set(table.c.keys())
+    if unknown:
+        raise ValueError(f"Table {table.name} has no columns {sorted(unknown)}.")
+
+    frame = frame.assign(
+        **{
+            name: _normalized(frame[name], table.c[name])
+            for name in frame.columns
+            if isinstance(table.c[name].type, (Date, DateTime))
+        }
+    )
+    if unique_by is not None:
+        frame = frame.drop_duplicates(subset=list(unique_by), keep="last")
+
+    names = list(frame.columns)
+    columns = [_python_values(frame[name], table.c[name]) for name in names]
+    return [dict(zip(names, values)) for values in zip(*columns)]
+
+
+def _normalized(values: pandas.Series, column: Column) -> pandas.Series:
+    """Temporal values as `datetime64`, truncated to the day for dates."""
+    values = pandas.to_datetime(values, format="ISO8601")
+    if isinstance(column.type, DateTime):
+        return values
+    if values.dt.tz is not None:
+        values = values.dt.tz_localize(None)
+    return values.dt.normalize()
+
+
+def _python_values(values: pandas.Series, column: Column) -> list[Any]:
+    if isinstance(column.type, DateTime):
+        values = pandas.Series(
+            values.dt.to_pydatetime(), index=values.index, dtype=object
+        )
+    elif isinstance(column.type, Date):
+        values = values.dt.date
+    # numpy scalars are turned into Python ones by the cast to object
+    return values.astype(object).where(values.notna(), None).tolist()
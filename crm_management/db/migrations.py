@@ -0,0 +1,96 @@
+from sqlalchemy import Connection, Engine, Index, Table, delete, func, inspect, select
+
+from crm_management.db.orm_base import Base
+
+# Tables holding data derived from the mirror, which the next run recomputes,
+# so duplicate rows breaking a new unique index can be deleted from them
+DERIVED_TABLES = frozenset({"deal_aggregations"})
+
+
+def add_missing_columns(engine: Engine) -> list[str]:
+    """
+    Add the columns declared after their table was first created.
+
+    Only nullable columns can be added this way, as the existing rows have no
+    value for them.
+
+    :param engine: Engine of the database to migrate.
+    :return: Names of the added columns, as `table.column`.
+    """
+    inspector = inspect(engine)
+    preparer = engine.dialect.identifier_preparer
+    added = []
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                if not column.nullable:
+                    raise ValueError(
+                        f"Cannot add the non-nullable column {table.name}.{column.name}."
+                    )
+                connection.exec_driver_sql(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} "
+                    f"{column.type.compile(dialect=engine.dialect)}"
+                )
+                added.append(f"{table.name}.{column.name}")
+    return added
+
+
+def remove_rows_breaking_unique_indexes(engine: Engine) -> dict[str, int]:
+    """
+    Delete the duplicate rows preventing a missing unique index from being created.
+
+    Among the rows sharing the columns of the index, the one with the highest
+    primary key, i.e. the last written, is kept. Rows are only deleted from the
+    `DERIVED_TABLES`: duplicates in any other table, e.g. of the CRM mirror,
+    are an error for someone to resolve.
+
+    :param engine: Engine of the database to migrate.
+    :return: Number of rows deleted, by index name.
+    :raises ValueError: If a table other than the derived ones has duplicates.
+    """
+    inspector = inspect(engine)
+    deleted = {}
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if not index.unique or index.name in existing:
+                    continue
+                if table.name not in DERIVED_TABLES:
+                    _check_no_duplicates(connection, table, index)
+                    continue
+                primary_key = list(table.primary_key.columns)[0]
+                kept = (
+                    select(func.max(primary_key))
+                    .group_by(*index.columns)
+                    .scalar_subquery()
+                )
+                deleted[index.name] = connection.execute(
+                    delete(table).where(primary_key.not_in(kept))
+                ).rowcount
+    return deleted
+
+
+def _check_no_duplicates(connection: Connection, table: Table, index: Index) -> None:
+    """Raise an error listing the values of the index held by several rows."""
+    duplicates = connection.execute(
+        select(*index.columns, func.count())
+        .group_by(*index.columns)
+        .having(func.count() > 1)
+        .limit(20)
+    ).all()
+    if duplicates:
+        columns = ", ".join(column.name for column in index.columns)
+        listed = "; ".join(f"{tuple(row[:-1])} x {row[-1]}" for row in duplicates)
+        raise ValueError(
+            f"Cannot create the unique index {index.name}: rows of {table.name} "
+            f"share the same ({columns}): {listed}."
+        )
@@ -1,34 +1,234 @@
-from typing import TypeVar, Generic, List, Optional, Any, Type
+import os
+from dataclasses import dataclass
+from enum import Enum as PyEnum
+from typing import (
+    TypeVar,
+    Generic,
+    List,
+    Optional,
+    Any,
+    Type,
+    Iterable,
+    Iterator,
+    Literal,
+)
 
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+import pandas
+from sqlalchemy import (
+    Boolean,
+    Column,
+    and_,
+    or_,
+    bindparam,
+    select,
+    Enum,
+    insert,
+    inspect,
+    literal_column,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.exc import NoResultFound
 
+from crm_management.db.config import EntityCacheConfig
+from crm_management.db.entity_cache import EntityCache
+from crm_management.db.frames import frame_rows
 from crm_management.db.orm_base import Base
+from crm_management.db.unit_of_work import UnitOfWork
 
 T = TypeVar("T", bound=Base)
 
+# Shapes the rows of the streaming reads can be returned in
+RowFormat = Literal["orm", "tuple", "dict"]
+
+# How `upsert_frame` writes the rows
+FrameWriteMode = Literal["upsert", "insert"]
+
+# Dialects implementing `INSERT ... ON CONFLICT DO UPDATE`
+UPSERT_DIALECTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+@dataclass
+class UpsertResult:
+    """Number of rows an `upsert_many` inserted, updated and left unchanged."""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
 
 class DBBaseAPI(Generic[T]):
     """Abstract base class for db CRUD operations."""
 
+    # Columns identifying a record across syncs, i.e. its key in the CRM
+    natural_key: tuple[str, ...] = ("id",)
+    # All the DB APIs of the process share one cache of the rows read by id
+    __entity_cache: EntityCache | None = None
+
     def __init__(self, session: Session, model: T):
         self.session = session
         self.model = model
+        # Set to None to always read from the database through this API
+        self.entity_cache = self._entity_cache()
+
+    @classmethod
+    def _entity_cache(cls) -> EntityCache | None:
+        if DBBaseAPI.__entity_cache is None:
+            max_entries = int(
+                os.getenv("DB_ENTITY_CACHE_SIZE", EntityCacheConfig.MAX_ENTRIES)
+            )
+            if max_entries > 0:
+                DBBaseAPI.__entity_cache = EntityCache(
+                    max_entries=max_entries,
+                    ttl=float(os.getenv("DB_ENTITY_CACHE_TTL", EntityCacheConfig.TTL)),
+                )
+        return DBBaseAPI.__entity_cache
+
+    @classmethod
+    def use_entity_cache(cls, cache: EntityCache | None) -> None:
+        """Share `cache` between the DB APIs created from now on, None to disable it."""
+        DBBaseAPI.__entity_cache = cache
+
+    def transaction(self, batch_size: int | None = None) -> UnitOfWork:
+        """
+        Group the writes made through this API's session into a unit of work.
+
+        :param batch_size: Number of operations committed together, None to
+            commit only when the scope exits.
+        :return: Context manager committing on exit and rolling back on error.
+        """
+        return UnitOfWork(self.session, batch_size=batch_size)
+
+    def _commit(self, operations: int = 1) -> None:
+        """Commit the session, or leave it to the unit of work in progress."""
+        unit_of_work = UnitOfWork.current(self.session)
+        if unit_of_work is None:
+            self.session.commit()
+        else:
+            unit_of_work.record(operations)
+
+    def _rollback(self) -> None:
+        """Roll back a failed write, unless a unit of work is in charge of it."""
+        if UnitOfWork.current(self.session) is None:
+            self.session.rollback()
+
+    def _invalidate(self, ids: Iterable[int | None]) -> None:
+        """Drop the cached rows of instances about to be written."""
+        if self.entity_cache is not None:
+            for id in ids:
+                if id is not None:
+                    self.entity_cache.invalidate((self.model, id), self.session)
+
+    def _cache(self, instance: T) -> None:
+        """
+        Keep the column values of an instance read from the database, published
+        to the entity cache when the session commits.
+        """
+        state = inspect(instance)
+        # Values the session has not written yet are not the stored ones
+        if state.pending or state.modified:
+            return
+        self.entity_cache.stage(
+            self.session,
+            (self.model, instance.id),
+            {
+                column.key: getattr(instance, column.key)
+                for column in self.model.__table__.columns
+            },
+        )
+
+    def _get_cached(self, id: int) -> Optional[T]:
+        """
+        Instance served from the session or the entity cache, None on a miss.
+
+        A cached row is merged into the session without loading it, so it is
+        attached like a queried instance but costs no SELECT.
+        """
+        existing = self.session.identity_map.get(identity_key(self.model, id))
+        # The session's own pending changes win over the cache
+        if existing is not None:
+            state = inspect(existing)
+            if state.modified or not state.expired_attributes:
+                return existing
+        columns = self.entity_cache.get((self.model, id))
+        if columns is None:
+            return None
+        instance = self.model(**columns)
+        make_transient_to_detached(instance)
+        return self.session.merge(instance, load=False)
 
     def create(self, instance: T) -> T:
         """Create and persist a new instance."""
+        self._invalidate([instance.id])
         self.session.add(instance)
-        self.session.commit()
-        self.session.refresh(instance)
+        self._commit()
         return instance
 
     def get(self, id: int) -> Optional[T]:
-        """Retrieve an instance by its primary key."""
+        """Retrieve an instance by its primary key, through the entity cache if any."""
+        if self.entity_cache is not None:
+            instance = self._get_cached(id)
+            if instance is not None:
+                return instance
         try:
-            return self.session.query(self.model).filter_by(id=id).one()
+            instance = self.session.query(self.model).filter_by(id=id).one()
         except NoResultFound:
             return None
+        if self.entity_cache is not None:
+            self._cache(instance)
+        return instance
+
+    def get_many(self, ids: Iterable[int]) -> List[T]:
+        """
+        Retrieve all the instances whose primary key is in `ids` in one query.
+
+        With an entity cache, the cached instances are served from it and only
+        the missing ones are queried.
+        """
+        ids = list(set(ids))
+        if not ids:
+            return []
+        if self.entity_cache is None:
+            return self.session.query(self.model).filter(self.model.id.in_(ids)).all()
+
+        instances, missing_ids = [], []
+        for id in ids:
+            instance = self._get_cached(id)
+            if instance is None:
+                missing_ids.append(id)
+            else:
+                instances.append(instance)
+        if missing_ids:
+            loaded = (
+                self.session.query(self.model)
+                .filter(self.model.id.in_(missing_ids))
+                .all()
+            )
+            for instance in loaded:
+                self._cache(instance)
+            instances.extend(loaded)
+        return instances
+
+    def _coerce(self, field: str, value: Any) -> Any:
+        """Convert a DTO value (e.g. an enum's value) to the type of a column."""
+        column_type = getattr(self.model, field).type
+        if isinstance(value, PyEnum):
+            value = value.value
+        if (
+            isinstance(column_type, Enum)
+            and column_type.enum_class is not None
+            and not isinstance(value, column_type.enum_class)
+        ):
+            return column_type.enum_class(value)
+        return value
 
     def get_field_and_value(self, field: str, value: Any) -> List[T]:
         """Retrieve all instances where a given field matches a value."""
@@ -36,7 +236,7 @@ class DBBaseAPI(Generic[T]):
             raise AttributeError(f"{self.model.__name__} has no attribute '{field}'")
         return (
             self.session.query(self.model)
-            .filter(getattr(self.model, field) == value)
+            .filter(getattr(self.model, field) == self._coerce(field, value))
             .all()
         )
 
@@ -59,24 +259,396 @@ class DBBaseAPI(Generic[T]):
         """Retrieve all instances."""
         return self.session.query(self.model).all()
 
+    def iter_all(
+        self,
+        chunk_size: int = 1000,
+        row_format: RowFormat = "orm",
+        criteria: Iterable[ColumnElement[bool]] = (),
+    ) -> Iterator[T | Row | dict[str, Any]]:
+        """
+        Stream every instance in primary key order, `chunk_size` rows at a time.
+
+        Pages are read with keyset pagination (`WHERE id > last id ORDER BY id
+        LIMIT chunk_size`), so every query is an index range scan and memory
+        stays constant however large the table is, without holding a server-side
+        cursor open across the whole read.
+
+        :param chunk_size: Number of rows read per query.
+        :param row_format: `orm` for ORM instances, or `tuple`/`dict` for plain
+            rows of the column values, which skip the identity map and change
+            tracking altogether.
+        :param criteria: Optional filters applied to the rows.
+        :return: Iterator over the rows.
+        """
+        criteria = tuple(criteria)
+        last_id = None
+        while True:
+            rows = self._read_page(chunk_size, row_format, criteria, last_id)
+            yield from rows
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1]["id"] if row_format == "dict" else rows[-1].id
+
+    def _read_page(
+        self,
+        chunk_size: int,
+        row_format: RowFormat,
+        criteria: tuple[ColumnElement[bool], ...],
+        last_id: int | None,
+    ) -> list[T | Row | dict[str, Any]]:
+        """Read the page of `iter_all` following the row whose primary key is `last_id`."""
+        primary_key = self.model.id
+        if row_format == "orm":
+            statement = select(self.model)
+        else:
+            statement = select(*self.model.__table__.columns)
+        statement = statement.where(*criteria).order_by(primary_key).limit(chunk_size)
+        if last_id is not None:
+            statement = statement.where(primary_key > last_id)
+
+        if row_format == "orm":
+            return self.session.scalars(statement).all()
+        if row_format == "dict":
+            return [dict(row) for row in self.session.execute(statement).mappings()]
+        return self.session.execute(statement).all()
+
+    def iter_field_and_value(
+        self,
+        field: str,
+        value: Any,
+        chunk_size: int = 1000,
+        row_format: RowFormat = "orm",
+    ) -> Iterator[T | Row | dict[str, Any]]:
+        """Stream the instances where a given field matches a value, see `iter_all`."""
+        if not hasattr(self.model, field):
+            raise AttributeError(f"{self.model.__name__} has no attribute '{field}'")
+        return self.iter_all(
+            chunk_size,
+            row_format,
+            criteria=[getattr(self.model, field) == self._coerce(field, value)],
+        )
+
     def update(self, id: int, updates: Type[T]) -> Optional[T]:
         """Update an existing instance by its primary key."""
         instance = self.get(id)
         if instance:
+            self._invalidate([id])
             for key, value in vars(updates).items():
                 if key.startswith("_"):  # Skip SQLAlchemy internal attributes
                     continue
                 setattr(instance, key, value)
-            self.session.commit()
-            self.session.refresh(instance)
+            self._commit()
             return instance
         return None
 
+    def save_many(self, instances: List[T]) -> List[T]:
+        """
+        Insert or update a batch of instances by primary key in a single transaction.
+
+        The existing rows are loaded with one query up front, so merging each
+        instance does not issue a SELECT of its own.
+        """
+        self.get_many(instance.id for instance in instances if instance.id is not None)
+        self._invalidate(instance.id for instance in instances)
+        try:
+            merged = [self.session.merge(instance) for instance in instances]
+            self._commit(len(merged))
+        except Exception:
+            self._rollback()
+            raise
+        return merged
+
+    def _row(self, instance: T) -> dict[str, Any]:
+        """Column values of an instance, leaving out unset autoincrement keys."""
+        return {
+            column.key: getattr(instance, column.key)
+            for column in self.model.__table__.columns
+            if not (column.primary_key and getattr(instance, column.key) is None)
+        }
+
+    def _key(self, row: dict[str, Any]) -> tuple:
+        return tuple(row[name] for name in self.natural_key)
+
+    def _natural_key_in(self, keys: list[tuple]):
+        """
+        Condition matching at least the rows whose natural key is one of `keys`.
+
+        Composite keys are matched column by column rather than with a row value
+        IN, which SQLite cannot look up through the index, so a few other rows
+        may match too: callers filter them out by key.
+        """
+        columns = [self.model.__table__.c[name] for name in self.natural_key]
+        return and_(
+            *(
+                column.in_({key[position] for key in keys})
+                for position, column in enumerate(columns)
+            )
+        )
+
+    def upsert_many(
+        self, instances: Iterable[T], chunk_size: int = 500
+    ) -> UpsertResult:
+        """
+        Insert or update a batch of instances by natural key in a single transaction.
+
+        Each chunk of `chunk_size` rows is written with a single
+        `INSERT ... ON CONFLICT (natural key) DO UPDATE` statement executed for the
+        whole chunk on SQLite and PostgreSQL (which the driver batches into
+        multi-row VALUES). Rows are only updated when one of their columns changed,
+        so unchanged rows are not rewritten. Inserts are told from updates by the
+        rows the statement returns: on PostgreSQL, by whether their `xmax` is 0;
+        elsewhere, the new rows are first inserted with `ON CONFLICT DO NOTHING`
+        and the conflicting ones then updated. Other dialects fall back to
+        comparing each chunk against the stored rows and writing the new and the
+        changed ones with one `executemany` INSERT and UPDATE.
+
+        Instances sharing a natural key are collapsed, the last one winning.
+
+        :param instances: Transient instances to write.
+        :param chunk_size: Number of rows written per statement.
+        :return: Number of rows inserted, updated and left unchanged.
+        """
+        return self.upsert_rows(
+            (self._row(instance) for instance in instances), chunk_size=chunk_size
+        )
+
+    def upsert_rows(
+        self, rows: Iterable[dict[str, Any]], chunk_size: int = 500
+    ) -> UpsertResult:
+        """
+        Same as `upsert_many`, for rows given as dicts of column values, e.g. the
+        records of a data frame, without building ORM instances first.
+        """
+        unique_rows = {}
+        for row in rows:
+            unique_rows[self._key(row)] = row
+
+        # The rows of a multi-row statement must all set the same columns
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in unique_rows.values():
+            groups.setdefault(tuple(row), []).append(row)
+
+        # Rows are matched by natural key, so their primary keys are not known
+        if self.entity_cache is not None:
+            self.entity_cache.invalidate_model(self.model, self.session)
+
+        result = UpsertResult()
+        upsert = UPSERT_DIALECTS.get(self.session.get_bind().dialect.name)
+        try:
+            for group in groups.values():
+                for start in range(0, len(group), chunk_size):
+                    chunk = group[start : start + chunk_size]
+                    if upsert is None:
+                        self._write_chunk(chunk, result)
+                    else:
+                        self._upsert_chunk(upsert, chunk, result)
+            self._commit(result.total)
+        except Exception:
+            self._rollback()
+            raise
+        return result
+
+    def upsert_frame(
+        self,
+        frame: pandas.DataFrame,
+        chunk_size: int = 500,
+        mode: FrameWriteMode = "upsert",
+    ) -> UpsertResult:
+        """
+        Write a data frame to the table in a single transaction, e.g. a report
+        computed with pandas.
+
+        The frame is converted to rows column by column, see `frame_rows`, and
+        written `chunk_size` rows per statement, as by `upsert_rows`. With
+        `mode="insert"`, the rows are only inserted with one `executemany`
+        INSERT per chunk, without looking up the stored ones, which is faster
+        for rows known to be new and fails on the others.
+
+        :param frame: One column per column of the table to write.
+        :param chunk_size: Number of rows written per statement.
+        :param mode: `upsert` by natural key or `insert`.
+        :return: Number of rows inserted, updated and left unchanged.
+        """
+        table = self.model.__table__
+        rows = frame_rows(
+            frame, table, unique_by=self.natural_key if mode == "upsert" else None
+        )
+        if self.entity_cache is not None:
+            self.entity_cache.invalidate_model(self.model, self.session)
+
+        result = UpsertResult()
+        upsert = UPSERT_DIALECTS.get(self.session.get_bind().dialect.name)
+        try:
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                if mode == "insert":
+                    self.session.execute(insert(table), chunk)
+                    result.inserted += len(chunk)
+                elif upsert is None:
+                    self._write_chunk(chunk, result)
+                else:
+                    self._upsert_chunk(upsert, chunk, result)
+            self._commit(result.total)
+        except Exception:
+            self._rollback()
+            raise
+        return result
+
+    def _upsert_chunk(
+        self, upsert, chunk: list[dict[str, Any]], result: UpsertResult
+    ) -> None:
+        """
+        Upsert a chunk with `ON CONFLICT`, counting the rows from what the
+        statements return rather than from the driver's `rowcount`, which
+        `executemany` does not report reliably on every driver.
+        """
+        table = self.model.__table__
+        updated_columns = [
+            table.c[key]
+            for key in chunk[0]
+            if not table.c[key].primary_key and key not in self.natural_key
+        ]
+        index_elements = [table.c[name] for name in self.natural_key]
+
+        if self.session.get_bind().dialect.name == "postgresql" and updated_columns:
+            # xmax is only set on the row versions written by an update
+            inserted = (
+                self.session.execute(
+                    self._on_conflict_update(upsert, updated_columns).returning(
+                        literal_column("xmax = 0", Boolean)
+                    ),
+                    chunk,
+                )
+                .scalars()
+                .all()
+            )
+            result.inserted += sum(inserted)
+            result.updated += len(inserted) - sum(inserted)
+            result.unchanged += len(chunk) - len(inserted)
+            return
+
+        # New rows first, then the conflicting ones, so each statement's
+        # returned rows are exactly the inserted, then the updated rows
+        inserted_keys = {
+            tuple(row)
+            for row in self.session.execute(
+                upsert(table)
+                .on_conflict_do_nothing(index_elements=index_elements)
+                .returning(*index_elements),
+                chunk,
+            )
+        }
+        conflicting = [row for row in chunk if self._key(row) not in inserted_keys]
+        updated = 0
+        if conflicting and updated_columns:
+            updated = len(
+                self.session.execute(
+                    self._on_conflict_update(upsert, updated_columns).returning(
+                        *index_elements
+                    ),
+                    conflicting,
+                ).all()
+            )
+        result.inserted += len(chunk) - len(conflicting)
+        result.updated += updated
+        result.unchanged += len(conflicting) - updated
+
+    def _on_conflict_update(self, upsert, updated_columns: list[Column]):
+        """`INSERT ... ON CONFLICT DO UPDATE` of the rows whose columns changed."""
+        table = self.model.__table__
+        statement = upsert(table)
+        return statement.on_conflict_do_update(
+            index_elements=[table.c[name] for name in self.natural_key],
+            set_={
+                column.key: statement.excluded[column.key] for column in updated_columns
+            },
+            where=or_(
+                *(
+                    column.is_distinct_from(statement.excluded[column.key])
+                    for column in updated_columns
+                )
+            ),
+        )
+
+    def _write_chunk(self, chunk: list[dict[str, Any]], result: UpsertResult) -> None:
+        """Upsert a chunk on dialects without `ON CONFLICT`, by comparing it first."""
+        table = self.model.__table__
+        primary_key = list(table.primary_key.columns)
+        stored = {
+            self._key(row): row
+            for row in self.session.execute(
+                select(table).where(
+                    self._natural_key_in([self._key(row) for row in chunk])
+                )
+            ).mappings()
+        }
+
+        new_rows, changed_rows = [], []
+        for row in chunk:
+            current = stored.get(self._key(row))
+            if current is None:
+                new_rows.append(row)
+            elif any(
+                current[key] != value
+                for key, value in row.items()
+                if not table.c[key].primary_key
+            ):
+                changed = {
+                    key: value
+                    for key, value in row.items()
+                    if not table.c[key].primary_key
+                }
+                for column in primary_key:
+                    changed[f"_{column.key}"] = current[column.key]
+                changed_rows.append(changed)
+
+        if new_rows:
+            self.session.execute(insert(table), new_rows)
+        if changed_rows:
+            # The SET clause is made of the non-key columns of the parameters
+            self.session.execute(
+                update(table).where(
+                    and_(
+                        *(
+                            column == bindparam(f"_{column.key}")
+                            for column in primary_key
+                        )
+                    )
+                ),
+                changed_rows,
+            )
+        result.inserted += len(new_rows)
+        result.updated += len(changed_rows)
+        result.unchanged += len(chunk) - len(new_rows) - len(changed_rows)
+
+    def get_content_hashes(self) -> dict[int, str | None]:
+        """Retrieve the content hash of every instance by primary key, in one query."""
+        return dict(self.session.query(self.model.id, self.model.content_hash))
+
+    def get_ids(self) -> set[int]:
+        """Retrieve the primary keys of all the instances."""
+        return {id for (id,) in self.session.query(self.model.id)}
+
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """Delete all the instances whose primary key is in `ids` in one statement."""
+        ids = list(set(ids))
+        if not ids:
+            return 0
+        self._invalidate(ids)
+        deleted = (
+            self.session.query(self.model)
+            .filter(self.model.id.in_(ids))
+            .delete(synchronize_session=False)
+        )
+        self._commit(deleted)
+        return deleted
+
     def delete(self, id: int) -> bool:
         """Delete an instance by its primary key."""
         instance = self.get(id)
         if instance:
+            self._invalidate([id])
             self.session.delete(instance)
-            self.session.commit()
+            self._commit()
             return True
         return False
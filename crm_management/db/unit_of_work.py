@@ -0,0 +1,109 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+# Key of `Session.info` the unit of work in progress is kept under, so every
+# DB API sharing the session takes part in it
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+class UnitOfWork:
+    """
+    Transaction scope grouping the writes of many DB API calls into few commits.
+
+    While a unit of work is in progress on a session, the `DBBaseAPI` mutations
+    made through that session do not commit: they only count as pending
+    operations, and the session flushes them when it needs to. Everything is
+    committed at once when the scope exits, or every `batch_size` operations if
+    given, and rolled back if the scope raises. Entering a unit of work while
+    another one is in progress on the same session joins the outer one.
+
+    ```python
+    with UnitOfWork(session, batch_size=1000) as unit_of_work:
+        for record in records:
+            with unit_of_work.savepoint():
+                api.create(record)
+    ```
+    """
+
+    def __init__(self, session: Session, batch_size: int | None = None):
+        """
+        :param session: Session the writes are made through.
+        :param batch_size: Number of operations committed together, None to
+            commit only when the scope exits.
+        """
+        self.session = session
+        self.batch_size = batch_size
+        self.operations = 0
+        self.commits = 0
+        self.errors: list[Exception] = []
+        self._pending = 0
+        self._savepoints = 0
+        self._outer: UnitOfWork | None = None
+
+    @staticmethod
+    def current(session: Session) -> "UnitOfWork | None":
+        """Unit of work in progress on a session, if any."""
+        return session.info.get(UNIT_OF_WORK_KEY)
+
+    def __enter__(self) -> "UnitOfWork":
+        self._outer = self.current(self.session)
+        if self._outer is not None:
+            return self._outer
+        self.session.info[UNIT_OF_WORK_KEY] = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._outer is not None:
+            return
+        del self.session.info[UNIT_OF_WORK_KEY]
+        if exc_type is None:
+            self.commit()
+        else:
+            self.session.rollback()
+
+    def record(self, operations: int = 1) -> None:
+        """Count operations made in the scope, committing once a batch is full."""
+        self.operations += operations
+        self._pending += operations
+        self._commit_full_batch()
+
+    def _commit_full_batch(self) -> None:
+        # Committing would also release the savepoints in progress
+        if (
+            self.batch_size is not None
+            and self._pending >= self.batch_size
+            and not self._savepoints
+        ):
+            self.commit()
+
+    def commit(self) -> None:
+        """Commit the pending operations right away."""
+        self.session.commit()
+        self.commits += 1
+        self._pending = 0
+
+    @contextmanager
+    def savepoint(self, suppress: bool = True) -> Iterator[None]:
+        """
+        Isolate the writes of one record from the rest of the unit of work.
+
+        If the block raises, only its own writes are rolled back and the error
+        is kept in `errors`, so a bad record does not abort the batch.
+
+        :param suppress: Swallow the error once recorded instead of re-raising it.
+        """
+        self._savepoints += 1
+        savepoint = self.session.begin_nested()
+        try:
+            yield
+            savepoint.commit()
+        except Exception as error:
+            savepoint.rollback()
+            self.errors.append(error)
+            if not suppress:
+                raise
+        finally:
+            self._savepoints -= 1
+        self._commit_full_batch()
@@ -1,14 +1,121 @@
 import os
+from typing import Any
 
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, event, make_url, Engine, URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
+from crm_management.db.config import EngineProfile, engine_profile_from_env
+from crm_management.db.migrations import (
+    add_missing_columns,
+    remove_rows_breaking_unique_indexes,
+)
 from crm_management.db.orm_base import Base
 
 
 def init_db() -> Engine:
+    """
+    Build the engine of the database at `DATABASE_URL`.
+
+    The schema is not created here anymore: run `create_schema` (or the
+    `scripts/init_db` script) once when deploying a new database.
+    """
     db_url = os.getenv("DATABASE_URL")
     if db_url is None:
         raise ValueError("No database URL found in the env variables.")
-    engine = create_engine(db_url, echo=True)
-    Base.metadata.create_all(bind=engine)
+    return create_db_engine(db_url)
+
+
+def create_db_engine(db_url: str, profile: EngineProfile | None = None) -> Engine:
+    """
+    Build an engine tuned by an engine profile.
+
+    :param db_url: SQLAlchemy URL of the database.
+    :param profile: Pool, cache and SQLite settings, by default the profile
+        selected by the `DB_*` env variables (see `engine_profile_from_env`).
+    :return: Engine, with the pragmas of the profile applied to every SQLite
+        connection it opens.
+    """
+    profile = profile or engine_profile_from_env()
+    url = make_url(db_url)
+    engine = create_engine(url, **_engine_options(url, profile))
+    if engine.dialect.name == "sqlite":
+        configure_sqlite(engine, profile)
     return engine
+
+
+def create_async_db_engine(
+    db_url: str, profile: EngineProfile | None = None
+) -> AsyncEngine:
+    """
+    Build an asyncio engine tuned by an engine profile, for `AsyncDBBaseAPI`.
+
+    :param db_url: SQLAlchemy URL of the database with an async driver, e.g.
+        `sqlite+aiosqlite:///crm.db` or `postgresql+asyncpg://...`.
+    :param profile: Pool, cache and SQLite settings, see `create_db_engine`.
+    :return: Async engine. Its sessions should be created with
+        `async_sessionmaker(engine, expire_on_commit=False)`.
+    """
+    profile = profile or engine_profile_from_env()
+    url = make_url(db_url)
+    engine = create_async_engine(url, **_engine_options(url, profile))
+    if engine.dialect.name == "sqlite":
+        configure_sqlite(engine.sync_engine, profile)
+    return engine
+
+
+def _engine_options(url: URL, profile: EngineProfile) -> dict[str, Any]:
+    options = dict(
+        echo=profile.ECHO,
+        pool_pre_ping=profile.POOL_PRE_PING,
+        query_cache_size=profile.STATEMENT_CACHE_SIZE,
+    )
+    # In-memory SQLite databases live in a single connection, so are not pooled
+    if url.get_backend_name() != "sqlite" or url.database not in (None, "", ":memory:"):
+        options.update(
+            pool_size=profile.POOL_SIZE,
+            max_overflow=profile.MAX_OVERFLOW,
+            pool_recycle=profile.POOL_RECYCLE,
+        )
+    return options
+
+
+def create_schema(engine: Engine) -> None:
+    """Create the missing tables, columns and indexes of every ORM model."""
+    Base.metadata.create_all(bind=engine)
+    add_missing_columns(engine)
+    remove_rows_breaking_unique_indexes(engine)
+    create_missing_indexes(engine)
+
+
+def create_missing_indexes(engine: Engine) -> None:
+    """Create the indexes declared after their table was first created."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+def configure_sqlite(engine: Engine, profile: EngineProfile) -> None:
+    """
+    Apply the pragmas of a profile to every connection of a SQLite engine.
+
+    SQLAlchemy also emits BEGIN itself instead of the `sqlite3` driver. The
+    driver delays BEGIN until the first DML statement, so a SAVEPOINT opened
+    before it starts its own transaction and releasing it commits. Savepoints
+    of a unit of work then only isolate records correctly with the driver's
+    transaction handling turned off.
+    """
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA journal_mode={profile.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={profile.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA mmap_size={profile.SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size={profile.SQLITE_CACHE_SIZE}")
+        cursor.execute(f"PRAGMA busy_timeout={profile.SQLITE_BUSY_TIMEOUT}")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def begin(connection):
+        connection.exec_driver_sql("BEGIN")
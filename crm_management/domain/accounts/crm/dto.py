@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any
 
-from crm_management.crm.dto_base import BaseDTO
+from pydantic import AliasPath, Field
+
+from crm_management.crm.dto_base import BaseDTO, enum_dtype
 
 
 class RegionCRMEnum(Enum):
@@ -13,21 +14,22 @@ class RegionCRMEnum(Enum):
 
 
 class AccountDTO(BaseDTO):
-    id: int | None
-    account_id: int
-    account_name: str
-    industry: str
-    account_value: int
-    region: RegionCRMEnum
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> AccountDTO:
-        custom_fields = data.get("custom_field", {})
-        return cls(
-            id=data.get("id"),
-            account_id=custom_fields.get("cf_account_id"),
-            account_name=data.get("name"),
-            industry=custom_fields.get("cf_industry"),
-            account_value=custom_fields.get("cf_account_value"),
-            region=RegionCRMEnum(custom_fields.get("cf_region")),
-        )
+    id: int | None = None
+    account_id: int = Field(validation_alias=AliasPath("custom_field", "cf_account_id"))
+    account_name: str = Field(validation_alias="name")
+    industry: str = Field(validation_alias=AliasPath("custom_field", "cf_industry"))
+    account_value: int = Field(
+        validation_alias=AliasPath("custom_field", "cf_account_value")
+    )
+    region: RegionCRMEnum = Field(
+        validation_alias=AliasPath("custom_field", "cf_region")
+    )
+
+    frame_schema = {
+        "id": "Int64",
+        "account_id": "Int64",
+        "account_name": "string",
+        "industry": "category",
+        "account_value": "Int64",
+        "region": enum_dtype(RegionCRMEnum),
+    }
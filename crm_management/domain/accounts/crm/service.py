@@ -1,20 +1,24 @@
+from crm_management.crm.async_client_base import AsyncAPIClient
+from crm_management.crm.async_service_base import AsyncCRMBaseAPI
 from crm_management.crm.service_base import CRMBaseAPI
 from crm_management.domain.accounts.crm.dto import AccountDTO
 
+ACCOUNTS_VIEW_ID = "202000979627"
+
 
 class CRMAccountsAPI(CRMBaseAPI[AccountDTO]):
     def __init__(self):
-        super().__init__(api_endpoint="/api/sales_accounts", dto_class=AccountDTO)
-
-    def find_all(self) -> list[AccountDTO]:
-        response = self._api_client.get(f"{self.api_endpoint}/view/202000979627").json()
-        items = response.get("sales_accounts")
-        return [self._dto_class.from_dict(item) for item in items]
+        super().__init__(
+            api_endpoint="/api/sales_accounts",
+            dto_class=AccountDTO,
+            view_id=ACCOUNTS_VIEW_ID,
+            collection_key="sales_accounts",
+        )
 
     def find_by_id(self, entity_id: str) -> AccountDTO:
         url = f"{self.api_endpoint}/{entity_id}"
         response = self._api_client.get(url).json()
-        return self._dto_class.from_dict(response)
+        return self._dto_class.from_dict(response.get("sales_account", response))
 
     def update_one(self, updated_data: AccountDTO) -> AccountDTO:
         url = f"{self.api_endpoint}/{updated_data.id}"
@@ -23,13 +27,27 @@ class CRMAccountsAPI(CRMBaseAPI[AccountDTO]):
             .json()
             .get("sales_account")
         )
+        self.invalidate(updated_data.id)
         return self._dto_class.from_dict(response)
 
     def delete_one(self, entity_id: str) -> bool:
         url = f"{self.api_endpoint}/{entity_id}"
         response = self._api_client.delete(url)
+        self.invalidate(entity_id)
         return response.status_code == 204
 
     def create_one(self, new_data: AccountDTO) -> AccountDTO:
         response = self._api_client.post(self.api_endpoint, json=new_data.dict()).json()
         return self._dto_class.from_dict(response)
+
+
+class AsyncCRMAccountsAPI(AsyncCRMBaseAPI[AccountDTO]):
+    def __init__(self, api_client: AsyncAPIClient | None = None):
+        super().__init__(
+            api_endpoint="/api/sales_accounts",
+            dto_class=AccountDTO,
+            item_key="sales_account",
+            view_id=ACCOUNTS_VIEW_ID,
+            collection_key="sales_accounts",
+            api_client=api_client,
+        )
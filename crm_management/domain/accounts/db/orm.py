@@ -15,8 +15,10 @@ class AccountORM(Base):
     __tablename__ = "accounts"
     id = Column(Integer, primary_key=True, autoincrement=True)
     account_id = Column(Integer, unique=True, nullable=False)
-    account_name = Column(String, nullable=False)
+    account_name = Column(String, nullable=False, index=True)
     industry = Column(String, nullable=False)
     account_value = Column(Integer, nullable=False)
     region = Column(Enum(RegionORMEnum), nullable=False)
+    # Digest of the canonical fields, see `BaseDTO.content_hash`
+    content_hash = Column(String(32), nullable=True)
     deals = relationship("DealORM", backref="accounts")
@@ -1,3 +1,4 @@
+from crm_management.db.async_service_base import AsyncDBBaseAPI
 from crm_management.db.service_base import DBBaseAPI
 from crm_management.domain.accounts.db.orm import AccountORM
 
@@ -5,5 +6,16 @@ from crm_management.domain.accounts.db.orm import AccountORM
 class DBAccountsAPI(DBBaseAPI[AccountORM]):
     """Database operations for the Account domain."""
 
+    natural_key = ("account_id",)
+
+    def __init__(self, session):
+        super().__init__(session, AccountORM)
+
+
+class AsyncDBAccountsAPI(AsyncDBBaseAPI[AccountORM]):
+    """Asynchronous database operations for the Account domain."""
+
+    natural_key = DBAccountsAPI.natural_key
+
     def __init__(self, session):
         super().__init__(session, AccountORM)
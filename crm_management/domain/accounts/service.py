@@ -1,13 +1,16 @@
-from typing import Any
+from typing import Any, Iterable
 
 from crm_management.domain.accounts.crm.dto import AccountDTO, RegionCRMEnum
 from crm_management.domain.accounts.crm.service import CRMAccountsAPI
 from crm_management.domain.accounts.db.service import DBAccountsAPI
 from crm_management.domain.accounts.db.orm import AccountORM, RegionORMEnum
-from crm_management.services.base import ServiceBase
+from crm_management.services.base import ServiceBase, Freshness
+from crm_management.services.dedup import KeepPolicy
 
 
 class ServiceAccount(ServiceBase[AccountDTO, AccountORM]):
+    dedup_keys = ("account_id", "account_name")
+
     def __init__(self, crm_api: CRMAccountsAPI, domain_api: DBAccountsAPI):
         super().__init__(crm_api=crm_api, domain_api=domain_api)
         self.crm_api = crm_api
@@ -19,17 +22,20 @@ class ServiceAccount(ServiceBase[AccountDTO, AccountORM]):
     def find_by_id(self, entity_id: str) -> AccountDTO | None:
         return super().find_by_id(entity_id=entity_id)
 
-    def find_by_field_name(self, field_name: str, value: Any) -> list[AccountDTO]:
-        return super().find_by_field_name(field_name=field_name, value=value)
+    def find_by_field_name(
+        self, field_name: str, value: Any, freshness: Freshness = Freshness.VERIFIED
+    ) -> list[AccountDTO]:
+        return super().find_by_field_name(
+            field_name=field_name, value=value, freshness=freshness
+        )
 
     def update_one(self, updated_data: AccountDTO) -> AccountDTO:
         return super().update_one(updated_data=updated_data)
 
-    def clean_crm_data(self, data: list[AccountDTO]) -> list[AccountDTO]:
-        deduplicated_data = self._remove_duplicates(
-            data=data, keys=["account_id", "account_name"]
-        )
-        return self._handle_missing_values(deduplicated_data)
+    def clean_crm_data(
+        self, data: Iterable[AccountDTO], keep: KeepPolicy = KeepPolicy.FIRST
+    ) -> list[AccountDTO]:
+        return self._handle_missing_values(self.deduplicate(data, keep=keep).records)
 
     def _crm_dto_from_orm(self, data: AccountORM) -> AccountDTO:
         return AccountDTO(
@@ -38,7 +44,7 @@ class ServiceAccount(ServiceBase[AccountDTO, AccountORM]):
             account_name=data.account_name,
             industry=data.industry,
             account_value=data.account_value,
-            region=RegionCRMEnum(data.region),
+            region=RegionCRMEnum(data.region.value),
         )
 
     def _orm_from_crm_dto(self, data: AccountDTO) -> AccountORM:
@@ -50,12 +56,3 @@ class ServiceAccount(ServiceBase[AccountDTO, AccountORM]):
             account_value=data.account_value,
             region=RegionORMEnum(data.region),
         )
-
-    def has_changes(self, crm_data: AccountDTO, db_data: AccountORM) -> bool:
-        return (
-            crm_data.account_id != db_data.account_id
-            or crm_data.account_name != db_data.account_name
-            or crm_data.industry != db_data.industry
-            or crm_data.account_value != db_data.account_value
-            or crm_data.region != db_data.region
-        )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any
 
-from crm_management.crm.dto_base import BaseDTO
+from pydantic import AliasPath, Field
+
+from crm_management.crm.dto_base import BaseDTO, enum_dtype
 
 
 class LeadSourceCRMEnum(Enum):
@@ -13,25 +14,28 @@ class LeadSourceCRMEnum(Enum):
 
 
 class ContactDTO(BaseDTO):
-    id: int | None
-    contact_id: str
-    first_name: str
-    last_name: str
-    email: str
-    job_title: str | None
-    lead_source: LeadSourceCRMEnum
-    last_contact_date: str | None
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> ContactDTO:
-        custom_fields = data.get("custom_field", {})
-        return cls(
-            id=data.get("id"),
-            contact_id=data.get("external_id", ""),
-            first_name=data.get("first_name", ""),
-            last_name=data.get("last_name", ""),
-            email=data.get("email", ""),
-            job_title=custom_fields.get("job_title"),
-            lead_source=LeadSourceCRMEnum(custom_fields.get("cf_lead_source")),
-            last_contact_date=custom_fields.get("cf_last_contacted_date"),
-        )
+    id: int | None = None
+    contact_id: str = Field("", validation_alias="external_id")
+    first_name: str = ""
+    last_name: str = ""
+    email: str = ""
+    job_title: str | None = Field(
+        None, validation_alias=AliasPath("custom_field", "job_title")
+    )
+    lead_source: LeadSourceCRMEnum = Field(
+        validation_alias=AliasPath("custom_field", "cf_lead_source")
+    )
+    last_contact_date: str | None = Field(
+        None, validation_alias=AliasPath("custom_field", "cf_last_contacted_date")
+    )
+
+    frame_schema = {
+        "id": "Int64",
+        "contact_id": "string",
+        "first_name": "string",
+        "last_name": "string",
+        "email": "string",
+        "job_title": "category",
+        "lead_source": enum_dtype(LeadSourceCRMEnum),
+        "last_contact_date": "string",
+    }
@@ -1,33 +1,51 @@
+from crm_management.crm.async_client_base import AsyncAPIClient
+from crm_management.crm.async_service_base import AsyncCRMBaseAPI
 from crm_management.crm.service_base import CRMBaseAPI
 from crm_management.domain.contacts.crm.dto import ContactDTO
 
+CONTACTS_VIEW_ID = "202000979603"
+
 
 class CRMContactsAPI(CRMBaseAPI[ContactDTO]):
     def __init__(self):
-        super().__init__(api_endpoint="/api/contacts", dto_class=ContactDTO)
-
-    def find_all(self) -> list[ContactDTO]:
-        response = self._api_client.get(f"{self.api_endpoint}/view/202000979603").json()
-        items = response.get("contacts")
-        return [self._dto_class.from_dict(item) for item in items]
+        super().__init__(
+            api_endpoint="/api/contacts",
+            dto_class=ContactDTO,
+            view_id=CONTACTS_VIEW_ID,
+            collection_key="contacts",
+        )
 
     def find_by_id(self, entity_id: str) -> ContactDTO:
         url = f"{self.api_endpoint}/{entity_id}"
         response = self._api_client.get(url).json()
-        return self._dto_class.from_dict(response)
+        return self._dto_class.from_dict(response.get("contact", response))
 
     def update_one(self, updated_data: ContactDTO) -> ContactDTO:
         url = f"{self.api_endpoint}/{updated_data.id}"
         response = (
             self._api_client.put(url, json=updated_data.dict()).json().get("contact")
         )
+        self.invalidate(updated_data.id)
         return self._dto_class.from_dict(response)
 
     def delete_one(self, entity_id: str) -> bool:
         url = f"{self.api_endpoint}/{entity_id}"
         response = self._api_client.delete(url)
+        self.invalidate(entity_id)
         return response.status_code == 204
 
     def create_one(self, new_data: ContactDTO) -> ContactDTO:
         response = self._api_client.post(self.api_endpoint, json=new_data.dict()).json()
         return self._dto_class.from_dict(response)
+
+
+class AsyncCRMContactsAPI(AsyncCRMBaseAPI[ContactDTO]):
+    def __init__(self, api_client: AsyncAPIClient | None = None):
+        super().__init__(
+            api_endpoint="/api/contacts",
+            dto_class=ContactDTO,
+            item_key="contact",
+            view_id=CONTACTS_VIEW_ID,
+            collection_key="contacts",
+            api_client=api_client,
+        )
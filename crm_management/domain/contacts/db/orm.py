@@ -17,7 +17,9 @@ class ContactORM(Base):
     contact_id = Column(String, unique=True, nullable=False)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
-    email = Column(String, nullable=False)
+    email = Column(String, nullable=False, index=True)
     job_title = Column(String, nullable=True)
     lead_source = Column(Enum(LeadSourceORMEnum), nullable=False)
     last_contact_date = Column(String, nullable=True)
+    # Digest of the canonical fields, see `BaseDTO.content_hash`
+    content_hash = Column(String(32), nullable=True)
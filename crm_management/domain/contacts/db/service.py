@@ -1,3 +1,4 @@
+from crm_management.db.async_service_base import AsyncDBBaseAPI
 from crm_management.db.service_base import DBBaseAPI
 from crm_management.domain.contacts.db.orm import ContactORM
 
@@ -5,5 +6,16 @@ from crm_management.domain.contacts.db.orm import ContactORM
 class DBContactsAPI(DBBaseAPI[ContactORM]):
     """Database operations for the Contact domain."""
 
+    natural_key = ("contact_id",)
+
+    def __init__(self, session):
+        super().__init__(session, ContactORM)
+
+
+class AsyncDBContactsAPI(AsyncDBBaseAPI[ContactORM]):
+    """Asynchronous database operations for the Contact domain."""
+
+    natural_key = DBContactsAPI.natural_key
+
     def __init__(self, session):
         super().__init__(session, ContactORM)
@@ -0,0 +1,230 @@
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy
+import pandas
+
+from crm_management.domain.deals.crm.dto import DealDTO
+from crm_management.domain.reports.db.service import AGGREGATION_TYPES, AggregationType
+
+# Columns of the deals the aggregates are computed from
+DEAL_COLUMNS = [
+    "account_id",
+    "deal_stage",
+    "created_at",
+    "deal_size",
+    "probability_of_closure",
+]
+# Columns of the buckets, after their keys
+MEASURE_COLUMNS = [
+    "total_deal_size",
+    "deal_count",
+    "mean_deal_size",
+    "weighted_deal_size",
+]
+
+
+@dataclass
+class DealAggregates:
+    """
+    Daily, weekly and monthly buckets of a set of deals.
+
+    Every frame holds one row per bucket with its `aggregation_type` and
+    `aggregation_period` (the day, the Sunday ending the week or the last day
+    of the month, like the buckets stored in `deal_aggregations`), the total,
+    count and mean of the deal sizes and the deal sizes weighted by their
+    probability of closure.
+    """
+
+    by_account_and_stage: pandas.DataFrame
+    by_account: pandas.DataFrame
+    by_stage: pandas.DataFrame
+
+    def for_type(
+        self, aggregation_type: AggregationType, by: str = "account"
+    ) -> pandas.DataFrame:
+        """
+        Buckets of one aggregation type.
+
+        :param aggregation_type: Granularity of the buckets.
+        :param by: `account`, `stage` or `account_and_stage`.
+        """
+        if aggregation_type not in AGGREGATION_TYPES:
+            raise ValueError(
+                "Invalid aggregation level. Choose from 'daily', 'weekly', or 'monthly'."
+            )
+        frame = getattr(self, f"by_{by}")
+        return (
+            frame[frame["aggregation_type"] == aggregation_type]
+            .drop(columns="aggregation_type")
+            .reset_index(drop=True)
+        )
+
+
+def deals_frame(deals: Iterable[DealDTO]) -> pandas.DataFrame:
+    """Load the columns the aggregates need from DTOs, see `BaseDTO.to_frame`."""
+    return DealDTO.to_frame(deals, columns=DEAL_COLUMNS)
+
+
+def closure_probabilities(values: pandas.Series) -> numpy.ndarray:
+    """
+    Parse the probabilities of closure, given as fractions or as percentages
+    (`0.4`, `40` or `40%`). Missing or unreadable ones count as 0.
+    """
+    probabilities = pandas.to_numeric(
+        values.astype("string").str.strip().str.rstrip("%"), errors="coerce"
+    ).to_numpy(dtype=float, na_value=numpy.nan)
+    probabilities = numpy.where(probabilities > 1, probabilities / 100, probabilities)
+    return numpy.nan_to_num(probabilities, nan=0.0)
+
+
+def bucket_days(created_at: numpy.ndarray) -> dict[AggregationType, numpy.ndarray]:
+    """
+    Day numbers (since 1970-01-01) of the buckets deals fall in, by aggregation
+    type, labeled as by `bucket_of`.
+
+    :param created_at: Creation dates as `datetime64`.
+    """
+    days = created_at.astype("datetime64[D]")
+    day_numbers = days.astype(numpy.int64)
+    # 1970-01-01 was a Thursday, i.e. weekday 3 counting from Monday
+    weekdays = (day_numbers + 3) % 7
+    month_ends = (days.astype("datetime64[M]") + 1).astype("datetime64[D]") - 1
+    return {
+        "daily": day_numbers,
+        "weekly": day_numbers + 6 - weekdays,
+        "monthly": month_ends.astype(numpy.int64),
+    }
+
+
+def aggregate_deals(
+    deals: pandas.DataFrame,
+    aggregation_types: Iterable[AggregationType] = AGGREGATION_TYPES,
+) -> DealAggregates:
+    """
+    Compute the buckets of every aggregation type in a single pass over the deals.
+
+    Accounts, stages and bucket days are coded as integers and packed into one
+    int64 key per deal and aggregation type, so all the buckets are found with a
+    single sort of the keys and their measures summed with `bincount`, without
+    grouping by objects or building a frame per aggregation type. Deals without
+    an account, a creation date or a size are left out.
+
+    :param deals: Deals, with the `DEAL_COLUMNS` (e.g. from `deals_frame`).
+    :param aggregation_types: Granularities to compute.
+    :return: Buckets by account and stage, by account and by stage.
+    """
+    aggregation_types = list(aggregation_types)
+    for aggregation_type in aggregation_types:
+        if aggregation_type not in AGGREGATION_TYPES:
+            raise ValueError(
+                "Invalid aggregation level. Choose from 'daily', 'weekly', or 'monthly'."
+            )
+    missing = set(DEAL_COLUMNS) - set(deals.columns)
+    if missing:
+        raise ValueError(f"Missing required columns {sorted(missing)} in the data.")
+
+    deals = deals.dropna(subset=["created_at", "deal_size", "account_id"])
+    account_codes, accounts = pandas.factorize(deals["account_id"], sort=True)
+    stage_codes, stages = pandas.factorize(
+        deals["deal_stage"]
+        .map(lambda stage: getattr(stage, "value", stage))
+        .astype(object)
+        .fillna(""),
+        sort=True,
+    )
+    sizes = deals["deal_size"].to_numpy(dtype=float)
+    weighted_sizes = sizes * closure_probabilities(deals["probability_of_closure"])
+    created_at = pandas.to_datetime(deals["created_at"])
+    if created_at.dt.tz is not None:
+        created_at = created_at.dt.tz_localize(None)
+    buckets = bucket_days(created_at.to_numpy(dtype="datetime64[ns]"))
+
+    if not len(deals):
+        return _aggregates(_empty_buckets())
+
+    # key = ((type * periods + period) * accounts + account) * stages + stage
+    first_day = min(int(buckets[kind].min()) for kind in aggregation_types)
+    periods = max(int(buckets[kind].max()) for kind in aggregation_types) + 1
+    periods -= first_day
+    n_accounts, n_stages = len(accounts), len(stages)
+    keys = numpy.concatenate(
+        [
+            (
+                (type_code * periods + buckets[kind] - first_day) * n_accounts
+                + account_codes
+            )
+            * n_stages
+            + stage_codes
+            for type_code, kind in enumerate(aggregation_types)
+        ]
+    )
+    unique_keys, bucket_codes = numpy.unique(keys, return_inverse=True)
+    repeats = len(aggregation_types)
+    totals = numpy.bincount(bucket_codes, weights=numpy.tile(sizes, repeats))
+    weighted = numpy.bincount(bucket_codes, weights=numpy.tile(weighted_sizes, repeats))
+    counts = numpy.bincount(bucket_codes)
+
+    unique_keys, stage = numpy.divmod(unique_keys, n_stages)
+    unique_keys, account = numpy.divmod(unique_keys, n_accounts)
+    type_code, period = numpy.divmod(unique_keys, periods)
+    buckets = pandas.DataFrame(
+        {
+            "aggregation_type": pandas.Categorical.from_codes(
+                type_code, categories=aggregation_types
+            ),
+            "account_id": accounts.to_numpy(dtype=numpy.int64)[account],
+            "deal_stage": pandas.Categorical.from_codes(stage, categories=stages),
+            "aggregation_period": (period + first_day).astype("datetime64[D]"),
+            "total_deal_size": totals,
+            "deal_count": counts,
+            "weighted_deal_size": weighted,
+        }
+    )
+    return _aggregates(buckets)
+
+
+def _empty_buckets() -> pandas.DataFrame:
+    return pandas.DataFrame(
+        {
+            "aggregation_type": pandas.Categorical([], categories=AGGREGATION_TYPES),
+            "account_id": pandas.array([], dtype="int64"),
+            "deal_stage": pandas.Categorical([]),
+            "aggregation_period": pandas.to_datetime([]),
+            "total_deal_size": pandas.array([], dtype=float),
+            "deal_count": pandas.array([], dtype="int64"),
+            "weighted_deal_size": pandas.array([], dtype=float),
+        }
+    )
+
+
+def _rollup(buckets: pandas.DataFrame, keys: list[str]) -> pandas.DataFrame:
+    """Sum the buckets by account and stage up to coarser `keys`, adding the mean."""
+    rolled_up = (
+        buckets.groupby(keys, observed=True, sort=True)[
+            ["total_deal_size", "deal_count", "weighted_deal_size"]
+        ]
+        .sum()
+        .reset_index()
+    )
+    return _with_mean(rolled_up, keys)
+
+
+def _with_mean(buckets: pandas.DataFrame, keys: list[str]) -> pandas.DataFrame:
+    buckets["mean_deal_size"] = buckets["total_deal_size"] / buckets["deal_count"]
+    return buckets[keys + MEASURE_COLUMNS]
+
+
+def _aggregates(buckets: pandas.DataFrame) -> DealAggregates:
+    return DealAggregates(
+        by_account_and_stage=_with_mean(
+            buckets,
+            ["aggregation_type", "account_id", "deal_stage", "aggregation_period"],
+        ),
+        by_account=_rollup(
+            buckets, ["aggregation_type", "account_id", "aggregation_period"]
+        ),
+        by_stage=_rollup(
+            buckets, ["aggregation_type", "deal_stage", "aggregation_period"]
+        ),
+    )
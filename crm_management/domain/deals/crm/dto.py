@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Annotated
 
-from crm_management.crm.dto_base import BaseDTO
+from pydantic import AliasPath, BeforeValidator, Field
+
+from crm_management.crm.dto_base import BaseDTO, enum_dtype
 
 
 class DealStageCRMEnum(Enum):
@@ -16,27 +18,31 @@ class DealStageCRMEnum(Enum):
 
 class DealDTO(BaseDTO):
     id: int
-    deal_id: int
-    deal_name: str | None
-    deal_size: int | None
-    probability_of_closure: str | None
-    deal_stage: DealStageCRMEnum
-    account_id: int
+    deal_id: int = Field(validation_alias=AliasPath("custom_field", "cf_deal_id"))
+    deal_name: str | None = Field(None, validation_alias="name")
+    deal_size: Annotated[
+        int | None, BeforeValidator(lambda v: float(v) if v is not None else v)
+    ] = Field(validation_alias="amount")
+    probability_of_closure: str | None = Field(
+        "", validation_alias=AliasPath("custom_field", "cf_probability_of_closure")
+    )
+    deal_stage: DealStageCRMEnum = Field(
+        validation_alias=AliasPath("custom_field", "cf_deal_stage")
+    )
+    account_id: int = Field(validation_alias=AliasPath("custom_field", "cf_account_id"))
     created_at: datetime
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> DealDTO:
-        custom_fields = data.get("custom_field", {})
-        return cls(
-            id=data.get("id"),
-            deal_id=custom_fields.get("cf_deal_id"),
-            deal_name=data.get("name"),
-            deal_size=float(data.get("amount")),
-            probability_of_closure=custom_fields.get("cf_probability_of_closure", ""),
-            deal_stage=DealStageCRMEnum(custom_fields.get("cf_deal_stage")),
-            account_id=custom_fields.get("cf_account_id"),
-            created_at=data.get("created_at"),
-        )
+    frame_schema = {
+        "id": "Int64",
+        "deal_id": "Int64",
+        "deal_name": "string",
+        "deal_size": "Int64",
+        "probability_of_closure": "string",
+        "deal_stage": enum_dtype(DealStageCRMEnum),
+        "account_id": "Int64",
+        # In the wall-clock time of the deal, like the buckets of the SQL aggregates
+        "created_at": "datetime64[ns]",
+    }
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -1,33 +1,51 @@
+from crm_management.crm.async_client_base import AsyncAPIClient
+from crm_management.crm.async_service_base import AsyncCRMBaseAPI
 from crm_management.crm.service_base import CRMBaseAPI
 from crm_management.domain.deals.crm.dto import DealDTO
 
+DEALS_VIEW_ID = "202000979613"
+
 
 class CRMDealsAPI(CRMBaseAPI[DealDTO]):
     def __init__(self):
-        super().__init__(api_endpoint="/api/deals", dto_class=DealDTO)
-
-    def find_all(self) -> list[DealDTO]:
-        response = self._api_client.get(f"{self.api_endpoint}/view/202000979613").json()
-        items = response.get("deals")
-        return [self._dto_class.from_dict(item) for item in items]
+        super().__init__(
+            api_endpoint="/api/deals",
+            dto_class=DealDTO,
+            view_id=DEALS_VIEW_ID,
+            collection_key="deals",
+        )
 
     def find_by_id(self, entity_id: str) -> DealDTO:
         url = f"{self.api_endpoint}/{entity_id}"
         response = self._api_client.get(url).json()
-        return self._dto_class.from_dict(response)
+        return self._dto_class.from_dict(response.get("deal", response))
 
     def update_one(self, updated_data: DealDTO) -> DealDTO:
         url = f"{self.api_endpoint}/{updated_data.id}"
         response = (
             self._api_client.put(url, json=updated_data.to_dict()).json().get("deal")
         )
+        self.invalidate(updated_data.id)
         return self._dto_class.from_dict(response)
 
     def delete_one(self, entity_id: str) -> bool:
         url = f"{self.api_endpoint}/{entity_id}"
         response = self._api_client.delete(url)
+        self.invalidate(entity_id)
         return response.status_code == 204
 
     def create_one(self, new_data: DealDTO) -> DealDTO:
         response = self._api_client.post(self.api_endpoint, json=new_data.dict()).json()
         return self._dto_class.from_dict(response)
+
+
+class AsyncCRMDealsAPI(AsyncCRMBaseAPI[DealDTO]):
+    def __init__(self, api_client: AsyncAPIClient | None = None):
+        super().__init__(
+            api_endpoint="/api/deals",
+            dto_class=DealDTO,
+            item_key="deal",
+            view_id=DEALS_VIEW_ID,
+            collection_key="deals",
+            api_client=api_client,
+        )
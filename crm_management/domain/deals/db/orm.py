@@ -19,6 +19,10 @@ class DealORM(Base):
     deal_name = Column(String, nullable=False)
     deal_size = Column(Integer, nullable=True)
     probability_of_closure = Column(String, nullable=False)
-    deal_stage = Column(Enum(DealStageORMEnum), nullable=False)
-    account_id = Column(Integer, ForeignKey("accounts.account_id"), nullable=False)
+    deal_stage = Column(Enum(DealStageORMEnum), nullable=False, index=True)
+    account_id = Column(
+        Integer, ForeignKey("accounts.account_id"), nullable=False, index=True
+    )
     created_at = Column(DateTime, nullable=False)
+    # Digest of the canonical fields, see `BaseDTO.content_hash`
+    content_hash = Column(String(32), nullable=True)
@@ -1,3 +1,4 @@
+from crm_management.db.async_service_base import AsyncDBBaseAPI
 from crm_management.db.service_base import DBBaseAPI
 from crm_management.domain.deals.db.orm import DealORM
 
@@ -5,5 +6,16 @@ from crm_management.domain.deals.db.orm import DealORM
 class DBDealsAPI(DBBaseAPI[DealORM]):
     """Database operations for the Deal domain."""
 
+    natural_key = ("deal_id",)
+
+    def __init__(self, session):
+        super().__init__(session, DealORM)
+
+
+class AsyncDBDealsAPI(AsyncDBBaseAPI[DealORM]):
+    """Asynchronous database operations for the Deal domain."""
+
+    natural_key = DBDealsAPI.natural_key
+
     def __init__(self, session):
         super().__init__(session, DealORM)
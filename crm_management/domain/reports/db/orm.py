@@ -1,10 +1,19 @@
-from sqlalchemy import Column, Integer, Float, Date, String, ForeignKey
+from sqlalchemy import Column, Integer, Float, Date, String, ForeignKey, Index
 
 from crm_management.db.orm_base import Base
 
 
 class DealAggregationORM(Base):
     __tablename__ = "deal_aggregations"
+    __table_args__ = (
+        Index(
+            "uq_deal_aggregations_bucket",
+            "account_id",
+            "aggregation_type",
+            "aggregation_date",
+            unique=True,
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     account_id = Column(Integer, ForeignKey("accounts.account_id"), nullable=False)
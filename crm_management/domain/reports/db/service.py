@@ -1,9 +1,348 @@
-from crm_management.db.service_base import DBBaseAPI
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Iterable, Literal
+
+from sqlalchemy import (
+    Date,
+    Float,
+    cast,
+    delete,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    type_coerce,
+)
+from sqlalchemy.sql import ColumnElement, Select
+
+from crm_management.db.async_service_base import AsyncDBBaseAPI
+from crm_management.db.service_base import DBBaseAPI, UPSERT_DIALECTS
+from crm_management.domain.deals.db.orm import DealORM
 from crm_management.domain.reports.db.orm import DealAggregationORM
 
+AggregationType = Literal["daily", "weekly", "monthly"]
+AGGREGATION_TYPES: tuple[AggregationType, ...] = ("daily", "weekly", "monthly")
+
+# Unit Postgres truncates the timestamps to, and interval to the bucket's last day
+_POSTGRES_BUCKETS = {
+    "daily": ("day", "0 days"),
+    "weekly": ("week", "6 days"),
+    "monthly": ("month", "1 month - 1 day"),
+}
+
+
+def bucket_date(
+    created_at: ColumnElement, aggregation_type: AggregationType, dialect: str
+) -> ColumnElement:
+    """
+    SQL expression of the date a deal's bucket is stored under.
+
+    Buckets are labeled like the pandas groupers of `ServiceDeal.compute_aggregates`:
+    by the day, by the Sunday ending the week and by the last day of the month.
+
+    :param created_at: Timestamp column of the deals.
+    :param aggregation_type: Granularity of the bucket.
+    :param dialect: Name of the database dialect, `sqlite` or `postgresql`.
+    :return: Date expression.
+    """
+    if aggregation_type not in AGGREGATION_TYPES:
+        raise ValueError(
+            "Invalid aggregation type. Must be 'daily', 'weekly', or 'monthly'."
+        )
+    if dialect == "sqlite":
+        modifiers = {
+            "daily": (),
+            # Moves forward to the next Sunday, unless the day is one already
+            "weekly": ("weekday 0",),
+            "monthly": ("start of month", "+1 month", "-1 day"),
+        }[aggregation_type]
+        return func.date(created_at, *modifiers)
+    if dialect == "postgresql":
+        # Postgres weeks start on Monday
+        unit, to_last_day = _POSTGRES_BUCKETS[aggregation_type]
+        return cast(
+            func.date_trunc(unit, created_at)
+            + literal_column(f"INTERVAL '{to_last_day}'"),
+            Date,
+        )
+    raise NotImplementedError(f"Deals cannot be aggregated in SQL on {dialect}.")
+
+
+def bucket_of(created_at: datetime, aggregation_type: AggregationType) -> date:
+    """Date of the bucket a deal created at `created_at` falls in, see `bucket_date`."""
+    day = created_at.date()
+    if aggregation_type == "daily":
+        return day
+    if aggregation_type == "weekly":
+        return day + timedelta(days=6 - day.weekday())
+    if aggregation_type == "monthly":
+        return day.replace(day=calendar.monthrange(day.year, day.month)[1])
+    raise ValueError(
+        "Invalid aggregation type. Must be 'daily', 'weekly', or 'monthly'."
+    )
+
+
+@dataclass
+class AggregationRefresh:
+    """Number of buckets a refresh from the deals table wrote and removed."""
+
+    written: int = 0
+    deleted: int = 0
+
 
 class DBDealsAggregationAPI(DBBaseAPI[DealAggregationORM]):
     """Database operations for the Deal Aggregation domain."""
 
+    natural_key = ("account_id", "aggregation_type", "aggregation_date")
+
+    def __init__(self, session):
+        super().__init__(session, DealAggregationORM)
+
+    def refresh_from_deals(
+        self,
+        aggregation_types: Iterable[AggregationType] = AGGREGATION_TYPES,
+        account_ids: Iterable[int] | None = None,
+    ) -> AggregationRefresh:
+        """
+        Recompute the buckets from the `deals` table, inside the database.
+
+        Each aggregation type is written with one `INSERT ... SELECT ... GROUP BY`
+        upserting the `total_deal_size` and `deal_count` of every bucket, so no
+        deal is loaded into Python. Buckets whose values did not change are not
+        rewritten, and the buckets no deal falls in anymore are deleted.
+
+        :param aggregation_types: Granularities to refresh.
+        :param account_ids: Only refresh the buckets of these accounts.
+        :return: Number of buckets written and deleted.
+        """
+        dialect = self.session.get_bind().dialect.name
+        account_ids = None if account_ids is None else list(set(account_ids))
+        if self.entity_cache is not None:
+            self.entity_cache.invalidate_model(self.model, self.session)
+
+        result = AggregationRefresh()
+        try:
+            for aggregation_type in aggregation_types:
+                result.written += self.session.execute(
+                    self._upsert_buckets(aggregation_type, dialect, account_ids)
+                ).rowcount
+                result.deleted += self.session.execute(
+                    self._delete_stale_buckets(aggregation_type, dialect, account_ids)
+                ).rowcount
+            self._commit(result.written + result.deleted)
+        except Exception:
+            self._rollback()
+            raise
+        return result
+
+    def _deal_criteria(self, account_ids: list[int] | None) -> list[ColumnElement]:
+        """Deals taking part in the aggregates, as `compute_aggregates` drops the rest."""
+        criteria = [DealORM.created_at.is_not(None), DealORM.deal_size.is_not(None)]
+        if account_ids is not None:
+            criteria.append(DealORM.account_id.in_(account_ids))
+        return criteria
+
+    def _bucket_totals(
+        self,
+        aggregation_type: AggregationType,
+        dialect: str,
+        account_ids: list[int] | None,
+    ) -> Select:
+        """Rows of the buckets of one aggregation type, computed from the deals."""
+        bucket = bucket_date(DealORM.created_at, aggregation_type, dialect)
+        return (
+            select(
+                DealORM.account_id,
+                literal(aggregation_type),
+                # Read back as a date on SQLite too, where the functions return text
+                type_coerce(bucket, Date),
+                cast(func.sum(DealORM.deal_size), Float),
+                func.count(DealORM.id),
+            )
+            .where(*self._deal_criteria(account_ids))
+            .group_by(DealORM.account_id, bucket)
+        )
+
+    def compute_buckets(
+        self,
+        aggregation_type: AggregationType,
+        account_ids: Iterable[int] | None = None,
+    ) -> dict[tuple, tuple[float, int]]:
+        """
+        Compute the buckets of one aggregation type from the deals, without
+        storing them.
+
+        :return: Total deal size and deal count by natural key of the bucket.
+        """
+        dialect = self.session.get_bind().dialect.name
+        account_ids = None if account_ids is None else list(set(account_ids))
+        return {
+            (account_id, type_, aggregation_date): (total, count)
+            for account_id, type_, aggregation_date, total, count in self.session.execute(
+                self._bucket_totals(aggregation_type, dialect, account_ids)
+            )
+        }
+
+    def stored_buckets(
+        self, aggregation_type: AggregationType
+    ) -> dict[tuple, tuple[float, int]]:
+        """Total deal size and deal count of the stored buckets, by natural key."""
+        aggregation = self.model
+        return {
+            (account_id, aggregation_type, aggregation_date): (total, count)
+            for account_id, aggregation_date, total, count in self.session.execute(
+                select(
+                    aggregation.account_id,
+                    aggregation.aggregation_date,
+                    aggregation.total_deal_size,
+                    aggregation.deal_count,
+                ).where(aggregation.aggregation_type == aggregation_type)
+            )
+        }
+
+    def add_to_buckets(
+        self, deltas: dict[tuple, tuple[float, int]], chunk_size: int = 500
+    ) -> AggregationRefresh:
+        """
+        Add deltas to the total deal size and deal count of buckets, in one
+        transaction.
+
+        Each chunk is written with one `INSERT ... ON CONFLICT DO UPDATE`
+        statement adding to the stored values, creating the missing buckets.
+        The buckets left without deals are deleted.
+
+        :param deltas: Total deal size and deal count to add, by natural key of
+            the bucket.
+        :param chunk_size: Number of buckets written per statement.
+        :return: Number of buckets written and deleted.
+        """
+        table = self.model.__table__
+        upsert = UPSERT_DIALECTS.get(self.session.get_bind().dialect.name)
+        if upsert is None:
+            raise NotImplementedError(
+                "Deal aggregates can only be maintained incrementally on "
+                "SQLite and PostgreSQL."
+            )
+        if self.entity_cache is not None:
+            self.entity_cache.invalidate_model(self.model, self.session)
+
+        statement = upsert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c[name] for name in self.natural_key],
+            set_={
+                "total_deal_size": table.c.total_deal_size
+                + statement.excluded.total_deal_size,
+                "deal_count": table.c.deal_count + statement.excluded.deal_count,
+            },
+        )
+        rows = [
+            {
+                "account_id": account_id,
+                "aggregation_type": aggregation_type,
+                "aggregation_date": aggregation_date,
+                "total_deal_size": total,
+                "deal_count": count,
+            }
+            for (account_id, aggregation_type, aggregation_date), (
+                total,
+                count,
+            ) in deltas.items()
+        ]
+
+        result = AggregationRefresh()
+        try:
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                result.written += self.session.execute(statement, chunk).rowcount
+                result.deleted += self.session.execute(
+                    delete(self.model)
+                    .where(
+                        self.model.deal_count <= 0,
+                        self._natural_key_in([self._key(row) for row in chunk]),
+                    )
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+            self._commit(result.written + result.deleted)
+        except Exception:
+            self._rollback()
+            raise
+        return result
+
+    def _upsert_buckets(
+        self,
+        aggregation_type: AggregationType,
+        dialect: str,
+        account_ids: list[int] | None,
+    ):
+        table = self.model.__table__
+        buckets = self._bucket_totals(aggregation_type, dialect, account_ids)
+        columns = [
+            "account_id",
+            "aggregation_type",
+            "aggregation_date",
+            "total_deal_size",
+            "deal_count",
+        ]
+
+        statement = UPSERT_DIALECTS[dialect](table).from_select(columns, buckets)
+        updated_columns = [table.c.total_deal_size, table.c.deal_count]
+        return statement.on_conflict_do_update(
+            index_elements=[table.c[name] for name in self.natural_key],
+            set_={
+                column.key: statement.excluded[column.key] for column in updated_columns
+            },
+            where=or_(
+                *(
+                    column.is_distinct_from(statement.excluded[column.key])
+                    for column in updated_columns
+                )
+            ),
+        )
+
+    def _delete_stale_buckets(
+        self,
+        aggregation_type: AggregationType,
+        dialect: str,
+        account_ids: list[int] | None,
+    ):
+        aggregation = self.model
+        bucket = bucket_date(DealORM.created_at, aggregation_type, dialect)
+        # Listing the live buckets once is much cheaper than probing the deals
+        # of every stored bucket with a correlated NOT EXISTS
+        live_buckets = (
+            select(DealORM.account_id, bucket)
+            .where(*self._deal_criteria(account_ids))
+            .group_by(DealORM.account_id, bucket)
+        )
+        statement = delete(aggregation).where(
+            aggregation.aggregation_type == aggregation_type,
+            tuple_(aggregation.account_id, aggregation.aggregation_date).not_in(
+                live_buckets
+            ),
+        )
+        if account_ids is not None:
+            statement = statement.where(aggregation.account_id.in_(account_ids))
+        return statement.execution_options(synchronize_session=False)
+
+
+class AsyncDBDealsAggregationAPI(AsyncDBBaseAPI[DealAggregationORM]):
+    """Asynchronous database operations for the Deal Aggregation domain."""
+
+    natural_key = DBDealsAggregationAPI.natural_key
+
     def __init__(self, session):
         super().__init__(session, DealAggregationORM)
+        self._sync_api = DBDealsAggregationAPI(session.sync_session)
+
+    async def refresh_from_deals(
+        self,
+        aggregation_types: Iterable[AggregationType] = AGGREGATION_TYPES,
+        account_ids: Iterable[int] | None = None,
+    ) -> AggregationRefresh:
+        """Recompute the buckets from the `deals` table, see `DBDealsAggregationAPI`."""
+        return await self._run(
+            self._sync_api.refresh_from_deals, list(aggregation_types), account_ids
+        )
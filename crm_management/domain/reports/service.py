@@ -0,0 +1,157 @@
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, Protocol
+
+from sqlalchemy import select
+
+from crm_management.domain.deals.db.orm import DealORM
+from crm_management.domain.reports.db.service import (
+    AGGREGATION_TYPES,
+    AggregationRefresh,
+    AggregationType,
+    DBDealsAggregationAPI,
+    bucket_of,
+)
+
+
+class AggregatedDeal(Protocol):
+    """Fields of a deal the aggregates depend on, e.g. of a `DealDTO` or `DealORM`."""
+
+    account_id: int | None
+    created_at: datetime | None
+    deal_size: int | None
+
+
+@dataclass
+class RollupCheck:
+    """Outcome of comparing the stored deal aggregates to a full rebuild."""
+
+    # Natural keys of the buckets missing, stale or holding wrong values
+    mismatched: list[tuple] = field(default_factory=list)
+    repaired: AggregationRefresh | None = None
+
+    @property
+    def consistent(self) -> bool:
+        return not self.mismatched
+
+
+class DealRollupMaintainer:
+    """
+    Keep the deal aggregates up to date from the deals that changed.
+
+    Rather than recomputing every bucket, the old and new values of the
+    inserted, updated and deleted deals are turned into deltas of the
+    `total_deal_size` and `deal_count` of the buckets they fall in, which are
+    then added to the stored buckets. The cost of a run is proportional to the
+    number of changed deals, not to the size of the `deals` table. `verify`
+    compares the result to a full rebuild, to be run every so often.
+
+    ```python
+    old_deals = rollups.load_deals(updated_ids | deleted_ids)
+    ...  # write the deals
+    rollups.apply(old=old_deals, new=changed_deals)
+    ```
+    """
+
+    def __init__(
+        self,
+        aggregation_api: DBDealsAggregationAPI,
+        aggregation_types: Iterable[AggregationType] = AGGREGATION_TYPES,
+    ):
+        """
+        :param aggregation_api: DB API of the deal aggregations table.
+        :param aggregation_types: Granularities maintained.
+        """
+        self.aggregation_api = aggregation_api
+        self.aggregation_types = list(aggregation_types)
+
+    def load_deals(self, ids: Iterable[int]) -> list[AggregatedDeal]:
+        """
+        Read the current values of deals about to be updated or deleted, in one
+        query, so they can be subtracted from their buckets afterwards.
+
+        :param ids: Primary keys of the deals.
+        """
+        ids = list(set(ids))
+        if not ids:
+            return []
+        return self.aggregation_api.session.execute(
+            select(DealORM.account_id, DealORM.created_at, DealORM.deal_size).where(
+                DealORM.id.in_(ids)
+            )
+        ).all()
+
+    def deltas(
+        self, old: Iterable[AggregatedDeal], new: Iterable[AggregatedDeal]
+    ) -> dict[tuple, tuple[float, int]]:
+        """
+        Change of every bucket when the `old` deals are replaced by the `new` ones.
+
+        Updated deals appear in both, inserted deals only in `new` and deleted
+        deals only in `old`. Deals without an account, a creation date or a size
+        are left out, as by the full rebuild.
+
+        :return: Total deal size and deal count to add, by natural key of the
+            bucket, without the buckets left unchanged.
+        """
+        deltas: dict[tuple, list] = {}
+        for deals, sign in ((old, -1), (new, 1)):
+            for deal in deals:
+                if (
+                    deal.account_id is None
+                    or deal.created_at is None
+                    or deal.deal_size is None
+                ):
+                    continue
+                for aggregation_type in self.aggregation_types:
+                    key = (
+                        deal.account_id,
+                        aggregation_type,
+                        bucket_of(deal.created_at, aggregation_type),
+                    )
+                    delta = deltas.setdefault(key, [0.0, 0])
+                    delta[0] += sign * deal.deal_size
+                    delta[1] += sign
+        return {
+            key: (total, count)
+            for key, (total, count) in deltas.items()
+            if total or count
+        }
+
+    def apply(
+        self, old: Iterable[AggregatedDeal], new: Iterable[AggregatedDeal]
+    ) -> AggregationRefresh:
+        """
+        Update the buckets of the changed deals, see `deltas`.
+
+        :return: Number of buckets written and deleted.
+        """
+        return self.aggregation_api.add_to_buckets(self.deltas(old, new))
+
+    def verify(self, repair: bool = False) -> RollupCheck:
+        """
+        Compare every stored bucket to the one a full rebuild would compute.
+
+        :param repair: Rebuild the aggregates from the deals table if they differ.
+        :return: The buckets that differ and, if repaired, the rebuild's outcome.
+        """
+        check = RollupCheck()
+        for aggregation_type in self.aggregation_types:
+            expected = self.aggregation_api.compute_buckets(aggregation_type)
+            stored = self.aggregation_api.stored_buckets(aggregation_type)
+            for key in expected.keys() | stored.keys():
+                if key not in expected or key not in stored:
+                    check.mismatched.append(key)
+                    continue
+                expected_total, expected_count = expected[key]
+                stored_total, stored_count = stored[key]
+                if expected_count != stored_count or not math.isclose(
+                    expected_total, stored_total, abs_tol=1e-6
+                ):
+                    check.mismatched.append(key)
+        if repair and check.mismatched:
+            check.repaired = self.aggregation_api.refresh_from_deals(
+                self.aggregation_types
+            )
+        return check
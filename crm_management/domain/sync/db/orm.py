@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String, DateTime
+
+from crm_management.db.orm_base import Base
+
+
+class SyncStateORM(Base):
+    __tablename__ = "sync_state"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    domain = Column(String, unique=True, nullable=False)
+    high_water_mark = Column(DateTime, nullable=True)
+    last_full_sync_at = Column(DateTime, nullable=True)
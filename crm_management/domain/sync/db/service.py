@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from crm_management.db.service_base import DBBaseAPI
+from crm_management.domain.sync.db.orm import SyncStateORM
+
+
+class DBSyncStateAPI(DBBaseAPI[SyncStateORM]):
+    """Database operations for the Sync State domain."""
+
+    natural_key = ("domain",)
+
+    def __init__(self, session):
+        super().__init__(session, SyncStateORM)
+
+    def get_state(self, domain: str) -> SyncStateORM | None:
+        """Retrieve the sync state of a domain, if it was ever synced."""
+        return self.find_by_fields(domain=domain)
+
+    def save_state(
+        self,
+        domain: str,
+        high_water_mark: datetime,
+        last_full_sync_at: datetime | None = None,
+    ) -> SyncStateORM:
+        """Store the high-water mark of a domain and, after a full sync, its time."""
+        state = self.get_state(domain)
+        if state is None:
+            return self.create(
+                SyncStateORM(
+                    domain=domain,
+                    high_water_mark=high_water_mark,
+                    last_full_sync_at=last_full_sync_at,
+                )
+            )
+        state.high_water_mark = high_water_mark
+        if last_full_sync_at is not None:
+            state.last_full_sync_at = last_full_sync_at
+        self._commit()
+        return state
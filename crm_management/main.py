@@ -1,8 +1,7 @@
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from crm_management.db.orm_base import Base
+from crm_management.db.utils import create_db_engine, create_schema
 from crm_management.domain.deals.crm.service import CRMDealsAPI
 from crm_management.domain.deals.db.service import DBDealsAPI
 from crm_management.domain.deals.db.orm import DealORM
@@ -34,10 +33,10 @@ if __name__ == "__main__":
 
     DATABASE_URL = "sqlite:///example.db"  # Replace with your DB URL
 
-    engine = create_engine(DATABASE_URL, echo=True)
+    engine = create_db_engine(DATABASE_URL)
+    create_schema(engine)
     SessionLocal = sessionmaker(bind=engine)
     session = SessionLocal()
-    Base.metadata.create_all(engine)
 
     for deal_dto in all_deals:
         deal = DealORM(
@@ -1,20 +1,47 @@
 import csv
 import json
 from abc import abstractmethod
-from typing import Generic, TypeVar, Type, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from enum import Enum
+from typing import Generic, TypeVar, Type, Any, Iterable, Iterator
 
 import pandas
+import requests
 
+from crm_management.crm.config import APIConfig
 from crm_management.crm.dto_base import BaseDTO
 from crm_management.crm.service_base import CRMBaseAPI
 from crm_management.db.orm_base import Base
-from crm_management.db.service_base import DBBaseAPI
+from crm_management.db.service_base import DBBaseAPI, UpsertResult
+from crm_management.db.unit_of_work import UnitOfWork
+from crm_management.services.bulk import BulkWriteResult, RecordResult
+from crm_management.services.columnar import ColumnarFormat, write_snapshot
+from crm_management.services.dedup import DedupResult, KeepPolicy, deduplicate
+from crm_management.services.diff import ChangeSet, diff_records
 
 T = TypeVar("T", bound=BaseDTO)
 V = TypeVar("V", bound=Base)
 
 
+class Freshness(Enum):
+    """How up to date the records returned by a lookup must be."""
+
+    # Served from the local DB mirror only, as fresh as the last sync
+    MIRROR = "mirror"
+    # Matched on the DB mirror, then refetched from the CRM by id
+    VERIFIED = "verified"
+    # Matched by scanning the whole CRM view
+    LIVE = "live"
+
+
 class ServiceBase(Generic[T, V]):
+    # Fields identifying the duplicates of a record, and the one dating it
+    dedup_keys: tuple[str, ...] = ("id",)
+    newest_field: str | None = None
+    # Date field whose month partitions the columnar exports, if any
+    partition_month_field: str | None = None
+
     def __init__(self, crm_api: CRMBaseAPI, domain_api: DBBaseAPI):
         self.crm_api = crm_api
         self.domain_api = domain_api
@@ -39,54 +66,240 @@ class ServiceBase(Generic[T, V]):
             for model in crm_data:
                 writer.writerow(model.dict())
 
+    def save_crm_data_to_dataset(
+        self,
+        output_dir: str,
+        crm_data: list[T],
+        snapshot_date: date,
+        file_format: ColumnarFormat = "parquet",
+        compression: str | None = "zstd",
+    ) -> int:
+        """
+        Append a day's snapshot of the records to a partitioned Parquet or Arrow
+        dataset, with the domain's schema, see `write_snapshot`.
+
+        :return: Number of records written.
+        """
+        return write_snapshot(
+            crm_data,
+            output_dir,
+            snapshot_date,
+            partition_month_field=self.partition_month_field,
+            file_format=file_format,
+            compression=compression,
+        )
+
     def find_all(self) -> list[T]:
         return self.crm_api.find_all()
 
+    def iter_all(
+        self,
+        page_size: int | None = None,
+        prefetch_pages: int | None = None,
+        stream: bool | None = None,
+    ) -> Iterator[T]:
+        return self.crm_api.iter_all(
+            page_size=page_size, prefetch_pages=prefetch_pages, stream=stream
+        )
+
+    def find_all_in_db(self) -> list[T]:
+        """Retrieve every record of the local DB mirror."""
+        return [self._crm_dto_from_orm(item) for item in self.domain_api.get_all()]
+
+    def iter_all_in_db(self, chunk_size: int = 1000) -> Iterator[T]:
+        """Stream every record of the local DB mirror in constant memory."""
+        for item in self.domain_api.iter_all(chunk_size=chunk_size):
+            yield self._crm_dto_from_orm(item)
+
     def find_by_id(self, entity_id: str) -> T | None:
         return self.crm_api.find_by_id(entity_id=entity_id)
 
-    def find_by_field_name(self, field_name: str, value: Any) -> list[T]:
+    def find_by_field_name(
+        self, field_name: str, value: Any, freshness: Freshness = Freshness.VERIFIED
+    ) -> list[T]:
+        """
+        Find the records whose field matches a value.
+
+        Unless `freshness` is `LIVE`, the match is resolved with an indexed query on
+        the local DB mirror instead of downloading the whole CRM view. `VERIFIED`
+        then refetches each match from the CRM and drops those that no longer
+        match or were deleted from the CRM, which misses records that only started
+        matching since the last sync.
+
+        :param field_name: Name of the DTO field to match.
+        :param value: Value the field must be equal to.
+        :param freshness: How up to date the returned records must be.
+        :return: Matching records.
+        """
+        # DTOs hold the values of their enums
+        if isinstance(value, Enum):
+            value = value.value
+
+        if freshness is Freshness.LIVE:
+            return [
+                item for item in self.iter_all() if getattr(item, field_name) == value
+            ]
+
+        matches = [
+            self._crm_dto_from_orm(item)
+            for item in self.domain_api.get_field_and_value(field_name, value)
+        ]
+        if freshness is Freshness.MIRROR:
+            return matches
+
         results: list[T] = []
-        for item in self.find_all():
+        for match in matches:
+            try:
+                item = self.crm_api.find_by_id(entity_id=str(match.id))
+            except requests.HTTPError as error:
+                # Deleted from the CRM since the last sync
+                if error.response is not None and error.response.status_code == 404:
+                    continue
+                raise
             if getattr(item, field_name) == value:
                 results.append(item)
-
         return results
 
+    def transaction(self, batch_size: int | None = None) -> UnitOfWork:
+        """
+        Group the DB writes of the service into a unit of work, see `UnitOfWork`.
+
+        :param batch_size: Number of operations committed together, None to
+            commit only when the scope exits.
+        """
+        return self.domain_api.transaction(batch_size=batch_size)
+
     def update_one(self, updated_data: T) -> T:
-        entity_exists = self.domain_api.get(id=updated_data.id)
-        orm_instance = self._orm_from_crm_dto(updated_data)
-        if entity_exists:
-            self.domain_api.update(id=updated_data.id, updates=orm_instance)
-        else:
-            self.domain_api.create(orm_instance)
+        self.domain_api.upsert_many([self._to_orm(updated_data)])
         return self.crm_api.update_one(updated_data=updated_data)
 
-    def update_many(self, updated_data: list[T]) -> list[T]:
-        for data in updated_data:
-            self.update_one(updated_data=data)
-        return updated_data
+    def save_many_to_db(self, data: list[T]) -> UpsertResult:
+        """
+        Write a batch of CRM records to the DB mirror, without pushing them back.
+
+        :param data: Records fetched from the CRM.
+        :return: Number of rows inserted, updated and left unchanged.
+        """
+        return self.domain_api.upsert_many(self._to_orm(item) for item in data)
+
+    def diff(self, data: list[T]) -> ChangeSet[T]:
+        """
+        Compare a batch of CRM records against the DB mirror.
+
+        The content hashes of the whole mirror are loaded with a single query
+        and compared to the hashes of the batch, instead of loading and
+        comparing every record field by field.
+
+        :param data: Records fetched from the CRM.
+        :return: The records to insert, to update and left unchanged.
+        """
+        return diff_records(data, self.domain_api.get_content_hashes())
+
+    def update_many(
+        self,
+        updated_data: list[T],
+        max_workers: int = APIConfig.WRITE_WORKERS,
+        save_to_db: bool = True,
+    ) -> BulkWriteResult[T]:
+        """
+        Write a batch of records to the DB and then push them to the CRM.
+
+        All the records are saved to the DB in a single transaction, after which
+        they are sent to the CRM concurrently by a bounded pool of workers. A
+        record failing does not abort the rest of the batch: the outcome and the
+        failure reason of every record are reported in the result.
+
+        :param updated_data: Records to write.
+        :param max_workers: Maximum number of concurrent CRM requests.
+        :param save_to_db: Upsert the records into the DB first. Turn it off for
+            records already saved, e.g. with `save_many_to_db`, to only push them.
+        :return: Per-record outcome, in the same order as `updated_data`.
+        """
+        results: list[RecordResult[T] | None] = [None] * len(updated_data)
+        if save_to_db:
+            pending = self._save_before_push(updated_data, results)
+        else:
+            pending = list(range(len(updated_data)))
+
+        def push(index: int) -> RecordResult[T]:
+            data = updated_data[index]
+            try:
+                return RecordResult(
+                    record=data,
+                    success=True,
+                    result=self.crm_api.update_one(updated_data=data),
+                )
+            except Exception as error:
+                return RecordResult(record=data, success=False, error=repr(error))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for index, result in zip(pending, executor.map(push, pending)):
+                results[index] = result
+
+        return BulkWriteResult(results=results)
+
+    def _save_before_push(
+        self, updated_data: list[T], results: list[RecordResult[T] | None]
+    ) -> list[int]:
+        """
+        Upsert the records of `update_many` into the DB in one transaction.
+
+        :return: Positions of the records saved, the failures being reported in
+            `results`.
+        """
+        orm_instances: list[V] = []
+        pending: list[int] = []
+        for index, data in enumerate(updated_data):
+            try:
+                orm_instances.append(self._to_orm(data))
+                pending.append(index)
+            except Exception as error:
+                results[index] = RecordResult(
+                    record=data, success=False, error=repr(error)
+                )
+
+        try:
+            self.domain_api.upsert_many(orm_instances)
+        except Exception as error:
+            for index in pending:
+                results[index] = RecordResult(
+                    record=updated_data[index], success=False, error=repr(error)
+                )
+            pending = []
+        return pending
 
     @abstractmethod
-    def clean_crm_data(self, data: list[T]) -> list[T]:
+    def clean_crm_data(
+        self, data: Iterable[T], keep: KeepPolicy = KeepPolicy.FIRST
+    ) -> list[T]:
         pass
 
-    @staticmethod
-    def load_to_df(data: list[T]) -> pandas.DataFrame:
-        data = [deal.dict() for deal in data]
-        return pandas.DataFrame(data)
-
-    def _remove_duplicates(self, data: list[T], keys: list[str]) -> list[T]:
-        df = self.load_to_df(data=data)
+    def deduplicate(
+        self, data: Iterable[T], keep: KeepPolicy = KeepPolicy.FIRST
+    ) -> DedupResult[T]:
+        """
+        Drop the records sharing the domain's `dedup_keys`, in a single pass,
+        see `deduplicate`. The newest records are the ones with the greatest
+        `newest_field`.
 
-        df_unique = df.drop_duplicates(subset=keys)
+        :return: The records kept and the duplicates dropped.
+        """
+        return deduplicate(
+            data, keys=self.dedup_keys, keep=keep, newest_by=self.newest_field
+        )
 
-        unique_dtos = [
-            self.crm_api._dto_class.parse_obj(row)
-            for row in df_unique.to_dict(orient="records")
-        ]
+    @staticmethod
+    def load_to_df(data: list[T], columns: list[str] | None = None) -> pandas.DataFrame:
+        """
+        Load DTOs into a data frame typed by their `frame_schema`, see
+        `BaseDTO.to_frame`.
 
-        return unique_dtos
+        :param data: DTOs of one domain.
+        :param columns: Fields to load, all of them by default.
+        """
+        if not data:
+            return pandas.DataFrame(columns=columns)
+        return type(data[0]).to_frame(data, columns=columns)
 
     def _handle_missing_values(self, data: list[T]) -> list[T]:
         return data
@@ -99,6 +312,11 @@ class ServiceBase(Generic[T, V]):
     def _orm_from_crm_dto(self, data: V) -> T:
         pass
 
-    @abstractmethod
-    def has_changes(self, crm_data: T, db_data: V):
-        pass
+    def _to_orm(self, data: T) -> V:
+        """Map a CRM record to its DB row, stamped with its content hash."""
+        orm_instance = self._orm_from_crm_dto(data)
+        orm_instance.content_hash = data.content_hash()
+        return orm_instance
+
+    def has_changes(self, crm_data: T, db_data: V) -> bool:
+        return crm_data.content_hash() != db_data.content_hash
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+from crm_management.crm.dto_base import BaseDTO
+
+T = TypeVar("T", bound=BaseDTO)
+
+
+@dataclass
+class RecordResult(Generic[T]):
+    """Outcome of writing a single record as part of a bulk operation."""
+
+    record: T
+    success: bool
+    result: T | None = None
+    error: str | None = None
+
+
+@dataclass
+class BulkWriteResult(Generic[T]):
+    """Per-record outcome of a bulk operation, in the order records were given."""
+
+    results: list[RecordResult[T]] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> list[RecordResult[T]]:
+        return [result for result in self.results if result.success]
+
+    @property
+    def failed(self) -> list[RecordResult[T]]:
+        return [result for result in self.results if not result.success]
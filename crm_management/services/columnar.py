@@ -0,0 +1,109 @@
+import os
+import shutil
+from datetime import date
+from typing import Any, Literal
+
+import pandas
+import pyarrow
+import pyarrow.dataset
+
+from crm_management.crm.dto_base import BaseDTO
+
+# File formats of the columnar exports: Parquet or Arrow IPC (Feather v2)
+ColumnarFormat = Literal["parquet", "arrow"]
+
+_FILE_FORMATS = {
+    "parquet": pyarrow.dataset.ParquetFileFormat,
+    "arrow": pyarrow.dataset.IpcFileFormat,
+}
+
+# Hive partition column of the day of the snapshots
+SNAPSHOT_COLUMN = "snapshot_date"
+
+
+def arrow_type(dtype: Any) -> pyarrow.DataType:
+    """Arrow type of a column of a DTO's `frame_schema`."""
+    dtype = pandas.api.types.pandas_dtype(dtype)
+    if isinstance(dtype, pandas.CategoricalDtype):
+        # A fixed index width, so every snapshot of a dataset has the same schema
+        return pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+    if isinstance(dtype, pandas.DatetimeTZDtype):
+        return pyarrow.timestamp("us", tz=str(dtype.tz))
+    if isinstance(dtype, pandas.StringDtype) or dtype == object:
+        return pyarrow.string()
+    return pyarrow.from_numpy_dtype(getattr(dtype, "numpy_dtype", dtype))
+
+
+def arrow_schema(dto_class: type[BaseDTO]) -> pyarrow.Schema:
+    """Arrow schema of the exports of a domain, from the DTO's `frame_schema`."""
+    return pyarrow.schema(
+        [
+            (name, arrow_type(dto_class.frame_schema.get(name, object)))
+            for name in dto_class.model_fields
+        ]
+    )
+
+
+def write_snapshot(
+    records: list[BaseDTO],
+    base_dir: str,
+    snapshot_date: date,
+    partition_month_field: str | None = None,
+    file_format: ColumnarFormat = "parquet",
+    compression: str | None = "zstd",
+) -> int:
+    """
+    Write the records fetched on a day to a columnar dataset, next to the
+    snapshots of the other days.
+
+    The dataset is partitioned Hive-style by `snapshot_date` and, if given, by
+    the month of a date field, e.g. `snapshot_date=2024-06-01/created_at_month=2024-05/`,
+    so readers only open the files of the days and months they filter on. All
+    the files of the day, whatever their months, are replaced if it is written
+    again, the other days' are left as they are.
+
+    :param records: DTOs of one domain.
+    :param base_dir: Directory of the dataset.
+    :param snapshot_date: Day of the snapshot.
+    :param partition_month_field: Date field whose month partitions the records.
+    :param file_format: `parquet` or `arrow` (IPC).
+    :param compression: Codec of the files, e.g. `zstd`, `lz4` or None.
+    :return: Number of records written.
+    """
+    # The months of an earlier write of the day may not be written again
+    day_dir = os.path.join(base_dir, f"{SNAPSHOT_COLUMN}={snapshot_date.isoformat()}")
+    shutil.rmtree(day_dir, ignore_errors=True)
+    if not records:
+        return 0
+
+    dto_class = type(records[0])
+    schema = arrow_schema(dto_class)
+    partition_fields = [pyarrow.field(SNAPSHOT_COLUMN, pyarrow.string())]
+
+    frame = dto_class.to_frame(records)
+    frame[SNAPSHOT_COLUMN] = snapshot_date.isoformat()
+    if partition_month_field is not None:
+        month_column = f"{partition_month_field}_month"
+        frame[month_column] = (
+            frame[partition_month_field].dt.strftime("%Y-%m").fillna("unknown")
+        )
+        partition_fields.append(pyarrow.field(month_column, pyarrow.string()))
+
+    table = pyarrow.Table.from_pandas(
+        frame,
+        schema=pyarrow.schema(list(schema) + partition_fields),
+        preserve_index=False,
+    )
+    dataset_format = _FILE_FORMATS[file_format]()
+    pyarrow.dataset.write_dataset(
+        table,
+        base_dir,
+        format=dataset_format,
+        file_options=dataset_format.make_write_options(compression=compression),
+        partitioning=pyarrow.dataset.partitioning(
+            pyarrow.schema(partition_fields), flavor="hive"
+        ),
+        basename_template=f"part-{{i}}.{file_format}",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    return table.num_rows
@@ -0,0 +1,91 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Generic, Iterable, Sequence, TypeVar
+
+from crm_management.crm.dto_base import BaseDTO
+
+T = TypeVar("T", bound=BaseDTO)
+
+
+class KeepPolicy(Enum):
+    """Which record of a set of duplicates is kept."""
+
+    FIRST = "first"
+    LAST = "last"
+    # The one with the greatest value of a field, e.g. a creation date
+    NEWEST = "newest"
+
+
+@dataclass
+class DroppedDuplicate(Generic[T]):
+    """A record dropped as a duplicate of another one with the same key."""
+
+    record: T
+    key: Any
+
+
+@dataclass
+class DedupResult(Generic[T]):
+    """Records left after dropping the duplicates, and the ones dropped."""
+
+    records: list[T] = field(default_factory=list)
+    dropped: list[DroppedDuplicate[T]] = field(default_factory=list)
+
+
+def deduplicate(
+    records: Iterable[T],
+    keys: Sequence[str],
+    keep: KeepPolicy = KeepPolicy.FIRST,
+    newest_by: str | None = None,
+) -> DedupResult[T]:
+    """
+    Drop the records sharing the same values of `keys` but one, in a single
+    pass over a stream of records.
+
+    The records kept are indexed by key in a dict, so each record is checked
+    and, if needed, swapped in constant time, and only the records kept are
+    held in memory besides the stream. They are returned in the order of
+    their positions in the stream, like `DataFrame.drop_duplicates`.
+
+    :param records: Records, e.g. the DTOs fetched from the CRM.
+    :param keys: Fields identifying a record.
+    :param keep: Record kept out of each set of duplicates.
+    :param newest_by: Field compared by `KeepPolicy.NEWEST`. Records without a
+        value are older than any other, and of records with the same value the
+        last one is kept.
+    :return: The records kept and the duplicates dropped.
+    """
+    if not keys:
+        raise ValueError("At least one key is needed to find duplicates.")
+    if keep is KeepPolicy.NEWEST and newest_by is None:
+        raise ValueError("Keeping the newest duplicates needs a `newest_by` field.")
+
+    key_of = attrgetter(*keys)
+    newest_of = attrgetter(newest_by) if newest_by is not None else None
+    kept: dict[Any, T] = {}
+    result: DedupResult[T] = DedupResult()
+    for record in records:
+        key = key_of(record)
+        current = kept.get(key)
+        if current is None:
+            kept[key] = record
+            continue
+        if keep is KeepPolicy.FIRST or (
+            keep is KeepPolicy.NEWEST
+            and _is_older(newest_of(record), newest_of(current))
+        ):
+            result.dropped.append(DroppedDuplicate(record=record, key=key))
+            continue
+        result.dropped.append(DroppedDuplicate(record=current, key=key))
+        # Moved to the end, so the dict stays in the order of the records' positions
+        del kept[key]
+        kept[key] = record
+    result.records = list(kept.values())
+    return result
+
+
+def _is_older(value: Any, other: Any) -> bool:
+    if value is None:
+        return True
+    return other is not None and value < other
@@ -0,0 +1,44 @@
+from dataclasses import dataclass, field
+from typing import Generic, Iterable, TypeVar
+
+from crm_management.crm.dto_base import BaseDTO
+
+T = TypeVar("T", bound=BaseDTO)
+
+
+@dataclass
+class ChangeSet(Generic[T]):
+    """How a batch of CRM records differs from the DB mirror."""
+
+    inserted: list[T] = field(default_factory=list)
+    updated: list[T] = field(default_factory=list)
+    unchanged: list[T] = field(default_factory=list)
+
+    @property
+    def changed(self) -> list[T]:
+        """Records to write to the mirror, i.e. the new and the updated ones."""
+        return self.inserted + self.updated
+
+
+def diff_records(
+    records: Iterable[T], stored_hashes: dict[int, str | None]
+) -> ChangeSet[T]:
+    """
+    Sort a batch of records by comparing their content hash to the stored one.
+
+    Rows stored without a hash, e.g. before the hash column was added, count
+    as updated so that they get one on the next write.
+
+    :param records: CRM records, keyed by their `id`.
+    :param stored_hashes: Content hash of every row of the mirror, by id.
+    :return: The records to insert, to update and left unchanged.
+    """
+    changes: ChangeSet[T] = ChangeSet()
+    for record in records:
+        if record.id not in stored_hashes:
+            changes.inserted.append(record)
+        elif stored_hashes[record.id] != record.content_hash():
+            changes.updated.append(record)
+        else:
+            changes.unchanged.append(record)
+    return changes
@@ -0,0 +1,142 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Generic, TypeVar
+
+from crm_management.crm.dto_base import BaseDTO
+from crm_management.domain.sync.db.service import DBSyncStateAPI
+from crm_management.services.base import ServiceBase
+
+T = TypeVar("T", bound=BaseDTO)
+
+
+def utc_now() -> datetime:
+    """Current time as a naive UTC datetime, the way sync timestamps are stored."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass
+class SyncBatch(Generic[T]):
+    """Records fetched from the CRM by one run of `IncrementalSync`."""
+
+    domain: str
+    full: bool
+    started_at: datetime
+    high_water_mark: datetime
+    records: list[T] = field(default_factory=list)
+    deleted_ids: set[int] = field(default_factory=set)
+
+
+class IncrementalSync:
+    """
+    Fetch only the CRM records modified since the previous run of each domain.
+
+    The high-water mark of every domain is kept in the `sync_state` table. A
+    full resync is run instead when a domain was never synced or its last full
+    resync is older than `full_resync_interval`; it refetches every record and is
+    the only way to detect records deleted from the CRM.
+    """
+
+    def __init__(
+        self,
+        sync_state_api: DBSyncStateAPI,
+        full_resync_interval: timedelta = timedelta(days=7),
+        clock_skew: timedelta = timedelta(minutes=5),
+    ):
+        """
+        :param sync_state_api: DB API of the sync state table.
+        :param full_resync_interval: Maximum time between two full resyncs of a domain.
+        :param clock_skew: Margin subtracted from our clock when it is used as the
+            high-water mark, to tolerate drift against the CRM's clock.
+        """
+        self.sync_state_api = sync_state_api
+        self.full_resync_interval = full_resync_interval
+        self.clock_skew = clock_skew
+
+    def needs_full_resync(self, domain: str) -> bool:
+        state = self.sync_state_api.get_state(domain)
+        return (
+            state is None
+            or state.high_water_mark is None
+            or state.last_full_sync_at is None
+            or utc_now() - state.last_full_sync_at >= self.full_resync_interval
+        )
+
+    def fetch(
+        self, domain: str, service: ServiceBase, force_full: bool = False
+    ) -> SyncBatch[T]:
+        """
+        Fetch the records of a domain that changed since its high-water mark.
+
+        :param domain: Name the domain's sync state is stored under.
+        :param service: Service of the domain.
+        :param force_full: Run a full resync regardless of the last one.
+        :return: Fetched records, with the ids deleted from the CRM on a full resync.
+            Records listed by the CRM but rejected by the DTO are not deleted.
+        """
+        started_at = utc_now()
+
+        if force_full or self.needs_full_resync(domain):
+            errors_before = service.crm_api.decode_error_count
+            records = service.find_all()
+            undecoded_ids = self._undecoded_ids(
+                service, service.crm_api.decode_error_count - errors_before
+            )
+            if undecoded_ids is None:
+                deleted_ids = set()
+            else:
+                crm_ids = {record.id for record in records} | undecoded_ids
+                deleted_ids = service.domain_api.get_ids() - crm_ids
+            return SyncBatch(
+                domain=domain,
+                full=True,
+                started_at=started_at,
+                high_water_mark=started_at - self.clock_skew,
+                records=records,
+                deleted_ids=deleted_ids,
+            )
+
+        high_water_mark = self.sync_state_api.get_state(domain).high_water_mark
+        records = []
+        for record, updated_at in service.crm_api.iter_modified_since(high_water_mark):
+            records.append(record)
+            high_water_mark = max(high_water_mark, updated_at)
+        return SyncBatch(
+            domain=domain,
+            full=False,
+            started_at=started_at,
+            high_water_mark=high_water_mark,
+            records=records,
+        )
+
+    @staticmethod
+    def _undecoded_ids(service: ServiceBase, errors: int) -> set[int] | None:
+        """
+        Ids of the last `errors` records the CRM API could not decode.
+
+        These records still exist in the CRM, so they must not be taken for
+        deleted ones. None if some of them are no longer kept in
+        `decode_errors` or have no id, in which case nothing can be deleted.
+        """
+        decode_errors = list(service.crm_api.decode_errors)
+        if errors > len(decode_errors):
+            return None
+        try:
+            return {
+                int(error.item["id"])
+                for error in decode_errors[len(decode_errors) - errors :]
+            }
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def complete(self, batch: SyncBatch[T]) -> None:
+        """
+        Move the domain's high-water mark forward once the batch was persisted.
+
+        Call it only after the batch has been written, so a failed run is
+        fetched again by the next one.
+        """
+        self.sync_state_api.save_state(
+            domain=batch.domain,
+            high_water_mark=batch.high_water_mark,
+            last_full_sync_at=batch.started_at if batch.full else None,
+        )
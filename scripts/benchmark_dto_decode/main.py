@@ -0,0 +1,77 @@
+import random
+import timeit
+from datetime import datetime, timedelta
+
+import click
+
+from crm_management.domain.deals.crm.dto import DealDTO, DealStageCRMEnum
+
+
+def make_raw_deals(count: int) -> list[dict]:
+    """Generate raw deal records shaped like the ones listed by the CRM views."""
+    stages = [stage.value for stage in DealStageCRMEnum]
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "id": index,
+            "name": f"Deal {index}",
+            "amount": str(random.randint(1_000, 100_000)),
+            "created_at": (start + timedelta(hours=index)).isoformat() + "Z",
+            "custom_field": {
+                "cf_deal_id": 100_000 + index,
+                "cf_probability_of_closure": f"{random.randint(0, 100)}%",
+                "cf_deal_stage": random.choice(stages),
+                "cf_account_id": random.randint(1, 500),
+            },
+        }
+        for index in range(count)
+    ]
+
+
+def legacy_from_dict(data: dict) -> DealDTO:
+    """The per-record mapping the DTOs did before they declared aliases."""
+    custom_fields = data.get("custom_field", {})
+    return DealDTO(
+        id=data.get("id"),
+        deal_id=custom_fields.get("cf_deal_id"),
+        deal_name=data.get("name"),
+        deal_size=float(data.get("amount")),
+        probability_of_closure=custom_fields.get("cf_probability_of_closure", ""),
+        deal_stage=DealStageCRMEnum(custom_fields.get("cf_deal_stage")),
+        account_id=custom_fields.get("cf_account_id"),
+        created_at=data.get("created_at"),
+    )
+
+
+@click.command()
+@click.option("--records", type=int, default=10_000, show_default=True)
+@click.option("--repeat", type=int, default=5, show_default=True)
+def benchmark(records: int, repeat: int) -> None:
+    """Compare the per-record and batch paths that decode raw CRM deals into DTOs."""
+    raw_deals = make_raw_deals(records)
+
+    cases = {
+        "legacy per-record mapping": lambda: [
+            legacy_from_dict(item) for item in raw_deals
+        ],
+        "per-record from_dict": lambda: [DealDTO.from_dict(item) for item in raw_deals],
+        "batch from_dicts": lambda: DealDTO.from_dicts(raw_deals),
+    }
+
+    timings = {
+        name: min(timeit.repeat(case, number=1, repeat=repeat))
+        for name, case in cases.items()
+    }
+
+    click.echo(f"Decoding {records} deals, best of {repeat} runs:")
+    for name, seconds in timings.items():
+        click.echo(f"  {name:<26} {seconds * 1000:9.1f} ms")
+    click.echo(
+        "Raw payloads: batch is "
+        f"{timings['legacy per-record mapping'] / timings['batch from_dicts']:.1f}x "
+        "faster than the legacy path."
+    )
+
+
+if __name__ == "__main__":
+    benchmark()
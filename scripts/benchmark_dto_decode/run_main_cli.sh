@@ -0,0 +1,3 @@
+#!/bin/bash
+
+docker run --rm crm-extraction-cli "scripts/benchmark_dto_decode/main.py" "$@"
@@ -1,12 +1,12 @@
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import click
 from dotenv import load_dotenv
 from sqlalchemy.orm import sessionmaker
 
-from crm_management.db.utils import init_db
+from crm_management.db.utils import init_db, create_schema
 from crm_management.domain.accounts.crm.service import CRMAccountsAPI
 from crm_management.domain.accounts.service import ServiceAccount
 from crm_management.domain.contacts.crm.service import CRMContactsAPI
@@ -16,22 +16,71 @@ from crm_management.domain.deals.crm.service import CRMDealsAPI
 from crm_management.domain.deals.db.service import DBDealsAPI
 from crm_management.domain.accounts.db.service import DBAccountsAPI
 from crm_management.domain.deals.service import ServiceDeal
+from crm_management.domain.reports.db.service import DBDealsAggregationAPI
+from crm_management.domain.reports.service import DealRollupMaintainer
+from crm_management.domain.sync.db.service import DBSyncStateAPI
+from crm_management.services.sync import IncrementalSync
 
 
 THIS_FILE_PATH = Path(__file__)
 
 
 @click.command()
-def export_data():
+@click.option(
+    "--full-resync",
+    is_flag=True,
+    default=False,
+    help="Refetch every record instead of only those modified since the last run.",
+)
+@click.option(
+    "--full-resync-days",
+    type=int,
+    default=7,
+    show_default=True,
+    help="Days after which a full resync is run to catch deleted records.",
+)
+@click.option(
+    "--db-batch-size",
+    type=int,
+    default=None,
+    help="Commit the DB writes every this many rows instead of once per domain.",
+)
+@click.option(
+    "--create-schema",
+    "create_missing_schema",
+    is_flag=True,
+    default=False,
+    help="Create the missing tables and indexes first, e.g. on a new database.",
+)
+@click.option(
+    "--columnar-format",
+    type=click.Choice(["parquet", "arrow", "none"]),
+    default="parquet",
+    show_default=True,
+    help="Format of the partitioned datasets the records are appended to.",
+)
+def export_data(
+    full_resync: bool,
+    full_resync_days: int,
+    db_batch_size: int | None,
+    create_missing_schema: bool,
+    columnar_format: str,
+):
     today = datetime.now().strftime("%Y-%m-%d")
 
     db_engine = init_db()
+    if create_missing_schema:
+        create_schema(db_engine)
     session_local = sessionmaker(bind=db_engine)
     session = session_local()
 
     contacts_service = ServiceContact(CRMContactsAPI(), DBContactsAPI(session))
     deals_service = ServiceDeal(CRMDealsAPI(), DBDealsAPI(session))
     accounts_service = ServiceAccount(CRMAccountsAPI(), DBAccountsAPI(session))
+    deal_rollups = DealRollupMaintainer(DBDealsAggregationAPI(session))
+    incremental_sync = IncrementalSync(
+        DBSyncStateAPI(session), full_resync_interval=timedelta(days=full_resync_days)
+    )
 
     entities = [
         ("accounts", accounts_service),
@@ -43,32 +92,88 @@ def export_data():
     os.makedirs(output_dir, exist_ok=True)
 
     for entity_name, service in entities:
-        data = service.find_all()
+        batch = incremental_sync.fetch(entity_name, service, force_full=full_resync)
+        data = batch.records
+        print(
+            f"Fetched {len(data)} {entity_name} records "
+            f"({'full resync' if batch.full else 'modified since last run'})."
+        )
+
+        if data:
+            suffix = "" if batch.full else "_incremental"
+            json_filename = os.path.join(
+                output_dir, f"{today}_{entity_name}{suffix}.json"
+            )
+            service.save_crm_data_to_json(json_filename, data)
 
-        json_filename = os.path.join(output_dir, f"{today}_{entity_name}.json")
-        service.save_crm_data_to_json(json_filename, data)
+            csv_filename = os.path.join(
+                output_dir, f"{today}_{entity_name}{suffix}.csv"
+            )
+            service.save_crm_data_to_csv(csv_filename, data)
 
-        csv_filename = os.path.join(output_dir, f"{today}_{entity_name}.csv")
-        service.save_crm_data_to_csv(csv_filename, data)
+            print(f"Exported {entity_name} data to {json_filename} and {csv_filename}.")
 
-        print(f"Exported {entity_name} data to {json_filename} and {csv_filename}.")
+            if columnar_format != "none":
+                dataset_dir = os.path.join(output_dir, f"{entity_name}{suffix}")
+                service.save_crm_data_to_dataset(
+                    dataset_dir,
+                    data,
+                    snapshot_date=datetime.now().date(),
+                    file_format=columnar_format,
+                )
+                print(f"Appended {entity_name} data to the dataset {dataset_dir}.")
 
         clean_data = service.clean_crm_data(data=data)
-
-        for crm_data in clean_data:
-            db_data = service.domain_api.get(id=crm_data.id)
-            if db_data is None or service.has_changes(crm_data, db_data):
-                service.update_one(updated_data=crm_data)
-
-        if entity_name == "deals":
-            clean_data_df = service.compute_aggregates(
-                deals=clean_data, aggregation="monthly"
+        if len(clean_data) < len(data):
+            print(
+                f"Dropped {len(data) - len(clean_data)} duplicate {entity_name} records."
             )
-            service.save_aggregates_to_db(
-                aggregates=clean_data_df, aggregation_type="monthly"
+
+        changes = service.diff(clean_data)
+        print(
+            f"Compared {entity_name} to the DB: {len(changes.inserted)} new, "
+            f"{len(changes.updated)} changed, {len(changes.unchanged)} unchanged."
+        )
+
+        # The aggregates are updated from the old and new values of the deals
+        # that changed, the old ones being read before they are overwritten
+        if entity_name == "deals" and not batch.full:
+            old_deals = deal_rollups.load_deals(
+                {record.id for record in changes.updated} | batch.deleted_ids
             )
 
-        service.update_many(updated_data=clean_data)
+        # The mirror of a domain and its high-water mark are written together,
+        # so a failed run leaves neither half-written
+        with service.transaction(batch_size=db_batch_size):
+            service.save_many_to_db(changes.changed)
+
+            if batch.deleted_ids:
+                service.domain_api.delete_many(batch.deleted_ids)
+                print(
+                    f"Removed {len(batch.deleted_ids)} {entity_name} deleted from the CRM."
+                )
+
+            if entity_name == "deals" and batch.full:
+                check = deal_rollups.verify(repair=True)
+                print(
+                    "Deal aggregates checked against a full rebuild: "
+                    f"{len(check.mismatched)} buckets repaired."
+                )
+            elif entity_name == "deals":
+                rollup = deal_rollups.apply(old=old_deals, new=changes.changed)
+                print(
+                    f"Updated the deal aggregates: {rollup.written} buckets "
+                    f"written, {rollup.deleted} removed."
+                )
+
+            incremental_sync.complete(batch)
+
+        # Already saved to the DB above, only pushed to the CRM
+        result = service.update_many(updated_data=changes.changed, save_to_db=False)
+        for failure in result.failed:
+            print(
+                f"Failed to update {entity_name} id={failure.record.id}: {failure.error}"
+            )
 
 
 if __name__ == "__main__":
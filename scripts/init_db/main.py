@@ -0,0 +1,28 @@
+from pathlib import Path
+
+import click
+from dotenv import load_dotenv
+
+from crm_management.db.utils import init_db, create_schema
+from crm_management.domain.accounts.db.orm import AccountORM  # noqa: F401
+from crm_management.domain.contacts.db.orm import ContactORM  # noqa: F401
+from crm_management.domain.deals.db.orm import DealORM  # noqa: F401
+from crm_management.domain.reports.db.orm import DealAggregationORM  # noqa: F401
+from crm_management.domain.sync.db.orm import SyncStateORM  # noqa: F401
+
+THIS_FILE_PATH = Path(__file__)
+
+
+@click.command()
+def init_schema() -> None:
+    """Create the missing tables and indexes of the database at DATABASE_URL."""
+    engine = init_db()
+    create_schema(engine)
+    click.echo(
+        f"Schema of {engine.url.render_as_string(hide_password=True)} is up to date."
+    )
+
+
+if __name__ == "__main__":
+    load_dotenv(f"{THIS_FILE_PATH.parent.parent.parent}/.env")
+    init_schema()
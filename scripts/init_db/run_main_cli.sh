@@ -0,0 +1,3 @@
+#!/bin/bash
+
+docker run --rm crm-extraction-cli "scripts/init_db/main.py"
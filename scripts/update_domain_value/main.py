@@ -16,7 +16,7 @@ from crm_management.domain.deals.db.service import DBDealsAPI
 from sqlalchemy.orm import sessionmaker
 
 from crm_management.domain.deals.service import ServiceDeal
-from crm_management.services.base import ServiceBase
+from crm_management.services.base import ServiceBase, Freshness
 
 
 THIS_FILE_PATH = Path(__file__)
@@ -75,13 +75,32 @@ def setup_service(service_name: str) -> ServiceBase:
 @click.option("--value", type=str, required=True, help="Value of field to query for.")
 @click.option("--key-to-update", type=str, required=True, help="Old value for the field.")
 @click.option("--update-value", type=str, required=True, help="New value for the field.")
-def update_record(domain: str, key: str, value: Any, key_to_update: str, update_value: Any) -> None:
+@click.option(
+    "--freshness",
+    type=click.Choice(
+        [freshness.value for freshness in Freshness], case_sensitive=False
+    ),
+    default=Freshness.VERIFIED.value,
+    show_default=True,
+    help="Match records on the DB mirror ('mirror'), on the mirror then refetch them "
+    "from the CRM ('verified'), or by scanning the whole CRM view ('live').",
+)
+def update_record(
+    domain: str,
+    key: str,
+    value: Any,
+    key_to_update: str,
+    update_value: Any,
+    freshness: str,
+) -> None:
     service = setup_service(domain)
 
     key_casted_value = cast_to_field_type(service.crm_api._dto_class, key, value)
     update_key_casted_value = cast_to_field_type(service.crm_api._dto_class, key_to_update, update_value)
 
-    crm_api_entry = service.find_by_field_name(field_name=key, value=key_casted_value)
+    crm_api_entry = service.find_by_field_name(
+        field_name=key, value=key_casted_value, freshness=Freshness(freshness)
+    )
 
     if not crm_api_entry:
         click.echo(f"Entity with key={key} and value={value} not found in the CRM.")
@@ -90,7 +109,13 @@ def update_record(domain: str, key: str, value: Any, key_to_update: str, update_
     for entry in crm_api_entry:
         setattr(entry, key_to_update, update_key_casted_value)
 
-    service.update_many(updated_data=crm_api_entry)
+    result = service.update_many(updated_data=crm_api_entry)
+
+    click.echo(f"Updated {len(result.succeeded)} of {len(result.results)} records.")
+    for failure in result.failed:
+        click.echo(
+            f"Failed to update record with id={failure.record.id}: {failure.error}"
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from crm_management.db.utils import create_db_engine, create_schema
+from crm_management.domain.accounts.db.orm import AccountORM  # noqa: F401
+from crm_management.domain.contacts.db.orm import ContactORM  # noqa: F401
+from crm_management.domain.deals.db.orm import DealORM  # noqa: F401
+from crm_management.domain.reports.db.orm import DealAggregationORM  # noqa: F401
+from crm_management.domain.sync.db.orm import SyncStateORM  # noqa: F401
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'crm.db'}")
+    create_schema(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def session(session_factory):
+    with session_factory() as session:
+        yield session
@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from crm_management.crm.async_client_base import AsyncAPIClient
+from crm_management.domain.accounts.crm.dto import AccountDTO, RegionCRMEnum
+from crm_management.domain.accounts.crm.service import (
+    ACCOUNTS_VIEW_ID,
+    AsyncCRMAccountsAPI,
+)
+
+VIEW_PATH = f"/api/sales_accounts/view/{ACCOUNTS_VIEW_ID}"
+
+
+def raw_account(account_id: int) -> dict:
+    return {
+        "id": account_id,
+        "name": f"Account {account_id}",
+        "custom_field": {
+            "cf_account_id": account_id,
+            "cf_industry": "Retail",
+            "cf_account_value": 100,
+            "cf_region": "Europe",
+        },
+    }
+
+
+class FakeCRM:
+    """In-process stand-in of the CRM accounts endpoints."""
+
+    def __init__(self, accounts: int, with_meta: bool, throttled_pages: set[int]):
+        self.accounts = [raw_account(account_id) for account_id in range(accounts)]
+        self.with_meta = with_meta
+        self.throttled_pages = set(throttled_pages)
+        self.requests: list[tuple[str, str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, request.url.path))
+        if request.url.path == VIEW_PATH:
+            return self._page(request)
+        if request.method == "GET":
+            return httpx.Response(200, json={"sales_account": self.accounts[7]})
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(200, json={"sales_account": json.loads(request.content)})
+
+    def _page(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page in self.throttled_pages:
+            self.throttled_pages.discard(page)
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        per_page = int(request.url.params["per_page"])
+        payload = {
+            "sales_accounts": self.accounts[(page - 1) * per_page : page * per_page]
+        }
+        if self.with_meta:
+            payload["meta"] = {"total_pages": -(-len(self.accounts) // per_page)}
+        return httpx.Response(200, json=payload)
+
+
+def make_api(crm: FakeCRM) -> AsyncCRMAccountsAPI:
+    return AsyncCRMAccountsAPI(
+        api_client=AsyncAPIClient(
+            base_url="https://crm.test",
+            backoff_factor=0.0,
+            transport=httpx.MockTransport(crm),
+        )
+    )
+
+
+@pytest.mark.parametrize("with_meta", [True, False])
+@pytest.mark.parametrize("prefetch_pages", [0, 3])
+def test_find_all_walks_every_page_and_retries_throttled_ones(
+    with_meta, prefetch_pages
+):
+    crm = FakeCRM(accounts=25, with_meta=with_meta, throttled_pages={2})
+
+    async def find_all():
+        api = make_api(crm)
+        try:
+            return await api.find_all(page_size=10, prefetch_pages=prefetch_pages)
+        finally:
+            await api.aclose()
+
+    accounts = asyncio.run(find_all())
+
+    assert [account.id for account in accounts] == list(range(25))
+    assert [path for _, path in crm.requests].count(VIEW_PATH) == 4
+
+
+def test_crud_responses_are_unwrapped_from_the_item_key():
+    crm = FakeCRM(accounts=10, with_meta=True, throttled_pages=set())
+    account = AccountDTO.from_dict(raw_account(3)).model_copy(
+        update={"region": RegionCRMEnum.ASIA.value}
+    )
+
+    async def crud():
+        api = make_api(crm)
+        try:
+            return (
+                await api.find_by_id("7"),
+                await api.update_one(account),
+                await api.create_one(account),
+                await api.delete_one("3"),
+            )
+        finally:
+            await api.aclose()
+
+    found, updated, created, deleted = asyncio.run(crud())
+
+    assert found == AccountDTO.from_dict(raw_account(7))
+    assert updated == account
+    assert created == account
+    assert deleted is True
+    assert crm.requests == [
+        ("GET", "/api/sales_accounts/7"),
+        ("PUT", "/api/sales_accounts/3"),
+        ("POST", "/api/sales_accounts"),
+        ("DELETE", "/api/sales_accounts/3"),
+    ]
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from crm_management.db.utils import create_async_db_engine
+from crm_management.domain.accounts.db.orm import AccountORM, RegionORMEnum
+from crm_management.domain.accounts.db.service import AsyncDBAccountsAPI
+
+
+def make_account(account_id: int) -> AccountORM:
+    return AccountORM(
+        account_id=account_id,
+        account_name=f"Account {account_id}",
+        industry="Retail",
+        account_value=100,
+        region=RegionORMEnum.EUROPE,
+    )
+
+
+async def write_in_nested_scopes(db_url: str) -> set[int]:
+    engine = create_async_db_engine(db_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            api = AsyncDBAccountsAPI(session)
+            with pytest.raises(RuntimeError, match="outer scope failed"):
+                async with api.transaction():
+                    await api.create(make_account(1))
+                    await api.create(make_account(2))
+                    async with api.transaction():
+                        await api.create(make_account(3))
+                        await api.create(make_account(4))
+                    raise RuntimeError("outer scope failed")
+
+        async with session_factory() as session:
+            return await AsyncDBAccountsAPI(session).get_ids()
+    finally:
+        await engine.dispose()
+
+
+def test_nested_transaction_rolls_back_with_the_outer_one(engine, tmp_path):
+    stored_ids = asyncio.run(
+        write_in_nested_scopes(f"sqlite+aiosqlite:///{tmp_path / 'crm.db'}")
+    )
+
+    assert stored_ids == set()
@@ -0,0 +1,59 @@
+from datetime import date, datetime
+
+import pyarrow.dataset
+import pytest
+
+from crm_management.domain.deals.crm.dto import DealDTO
+from crm_management.services.columnar import write_snapshot
+
+
+def make_deals(months: list[int]) -> list[DealDTO]:
+    return [
+        DealDTO(
+            id=index + 1,
+            deal_id=index + 1,
+            deal_name=f"Deal {index + 1}",
+            deal_size=100,
+            probability_of_closure="40%",
+            deal_stage="Prospecting",
+            account_id=1,
+            created_at=datetime(2024, month, 15),
+        )
+        for index, month in enumerate(months)
+    ]
+
+
+def read_days(base_dir, file_format: str) -> dict[str, int]:
+    table = pyarrow.dataset.dataset(
+        base_dir,
+        format="parquet" if file_format == "parquet" else "ipc",
+        partitioning="hive",
+    ).to_table()
+    days = table.column("snapshot_date").to_pylist()
+    return {day: days.count(day) for day in set(days)}
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_rewriting_a_day_replaces_all_its_months(tmp_path, file_format):
+    base_dir = str(tmp_path / "deals")
+    write_snapshot(
+        make_deals([1, 1, 2]), base_dir, date(2024, 5, 31), "created_at", file_format
+    )
+    write_snapshot(
+        make_deals([1, 2, 3, 3, 4, 5, 6, 6, 6]),
+        base_dir,
+        date(2024, 6, 1),
+        "created_at",
+        file_format,
+    )
+
+    written = write_snapshot(
+        make_deals([6, 6]), base_dir, date(2024, 6, 1), "created_at", file_format
+    )
+
+    assert written == 2
+    assert read_days(base_dir, file_format) == {"2024-05-31": 3, "2024-06-01": 2}
+    assert sorted(
+        path.name
+        for path in (tmp_path / "deals" / "snapshot_date=2024-06-01").iterdir()
+    ) == ["created_at_month=2024-06"]
@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from crm_management.domain.deals.crm.dto import DealDTO
+from crm_management.domain.deals.db.service import DBDealsAPI
+from crm_management.domain.deals.service import ServiceDeal
+
+
+@pytest.mark.parametrize(
+    "offset",
+    [None, timezone.utc, timezone(timedelta(hours=5, minutes=30))],
+)
+def test_records_read_back_from_the_mirror_hash_the_same(session, offset):
+    deal = DealDTO(
+        id=1,
+        deal_id=1,
+        deal_name="Deal 1",
+        deal_size=100,
+        probability_of_closure="40%",
+        deal_stage="Prospecting",
+        account_id=1,
+        created_at=datetime(2024, 1, 1, 22, 30, tzinfo=offset),
+    )
+    service = ServiceDeal(crm_api=None, domain_api=DBDealsAPI(session))
+    service.save_many_to_db([deal])
+
+    [mirrored] = service.find_all_in_db()
+
+    assert mirrored.content_hash() == deal.content_hash()
+    assert service.diff([mirrored]).unchanged == [mirrored]
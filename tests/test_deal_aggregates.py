@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from crm_management.domain.deals.crm.dto import DealDTO
+from crm_management.domain.deals.db.service import DBDealsAPI
+from crm_management.domain.deals.service import ServiceDeal
+from crm_management.domain.reports.db.service import (
+    AGGREGATION_TYPES,
+    DBDealsAggregationAPI,
+)
+
+STAGES = ["Prospecting", "Negotiation", "Closed-Won", "Closed-Lost"]
+
+
+def make_deals(count: int, offset: timezone) -> list[DealDTO]:
+    start = datetime(2024, 1, 1, tzinfo=offset)
+    return [
+        DealDTO(
+            id=index + 1,
+            deal_id=index + 1,
+            deal_name=f"Deal {index + 1}",
+            deal_size=100 + index,
+            probability_of_closure="40%",
+            deal_stage=STAGES[index % len(STAGES)],
+            account_id=index % 7,
+            # Steps of 7 hours, so deals fall on both sides of midnight
+            created_at=start + timedelta(hours=7 * index),
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("aggregation_type", AGGREGATION_TYPES)
+@pytest.mark.parametrize(
+    "offset",
+    [
+        timezone.utc,
+        timezone(timedelta(hours=5, minutes=30)),
+        timezone(-timedelta(hours=8)),
+    ],
+)
+def test_compute_aggregates_matches_sql_buckets(session, aggregation_type, offset):
+    deals = make_deals(300, offset)
+    service = ServiceDeal(crm_api=None, domain_api=DBDealsAPI(session))
+    service.save_many_to_db(deals)
+
+    computed = service.compute_aggregates(deals, aggregation_type)
+    buckets = DBDealsAggregationAPI(session).compute_buckets(aggregation_type)
+
+    assert {
+        (row.account_id, aggregation_type, row.aggregation_period.date()): (
+            row.total_deal_size,
+            row.deal_count,
+        )
+        for row in computed.itertuples()
+    } == pytest.approx(buckets)
@@ -0,0 +1,77 @@
+from datetime import datetime
+
+import pytest
+
+from crm_management.db.entity_cache import EntityCache
+from crm_management.db.service_base import DBBaseAPI
+from crm_management.domain.deals.db.orm import DealORM, DealStageORMEnum
+from crm_management.domain.deals.db.service import DBDealsAPI
+
+
+@pytest.fixture
+def entity_cache():
+    cache = EntityCache()
+    DBBaseAPI.use_entity_cache(cache)
+    yield cache
+    DBBaseAPI.use_entity_cache(None)
+
+
+@pytest.fixture
+def deal(session_factory):
+    with session_factory() as session:
+        session.add(
+            DealORM(
+                id=1,
+                deal_id=1,
+                deal_name="b",
+                deal_size=100,
+                probability_of_closure="40%",
+                deal_stage=DealStageORMEnum.PROSPECTING,
+                account_id=1,
+                created_at=datetime(2024, 1, 1),
+            )
+        )
+        session.commit()
+
+
+def test_rows_read_are_cached_once_committed(session_factory, entity_cache, deal):
+    with session_factory() as session:
+        DBDealsAPI(session).get(1)
+        assert entity_cache.get((DealORM, 1)) is None
+        session.commit()
+    assert entity_cache.get((DealORM, 1))["deal_name"] == "b"
+
+
+def test_uncommitted_writes_are_not_served_to_other_sessions(
+    session_factory, entity_cache, deal
+):
+    with session_factory() as writer, session_factory() as reader:
+        writer_api = DBDealsAPI(writer)
+        with pytest.raises(RuntimeError):
+            with writer_api.transaction():
+                writer_api.update(1, DealORM(deal_name="d"))
+                writer.flush()
+                writer.expire_all()
+                # Read back from the transaction in progress
+                assert writer_api.get(1).deal_name == "d"
+
+                assert DBDealsAPI(reader).get(1).deal_name == "b"
+                raise RuntimeError("rolled back")
+
+    with session_factory() as session:
+        assert DBDealsAPI(session).get(1).deal_name == "b"
+
+
+def test_committed_writes_replace_cached_rows(session_factory, entity_cache, deal):
+    with session_factory() as session:
+        DBDealsAPI(session).get(1)
+        session.commit()
+
+    with session_factory() as session:
+        api = DBDealsAPI(session)
+        with api.transaction():
+            api.update(1, DealORM(deal_name="d"))
+            api.get(1)
+
+    with session_factory() as session:
+        assert DBDealsAPI(session).get(1).deal_name == "d"
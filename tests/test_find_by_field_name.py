@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+import requests
+
+from crm_management.domain.deals.crm.dto import DealDTO
+from crm_management.domain.deals.crm.service import CRMDealsAPI
+from crm_management.domain.deals.db.service import DBDealsAPI
+from crm_management.domain.deals.service import ServiceDeal
+from crm_management.services.base import Freshness
+
+
+def make_deal(deal_id: int, deal_stage: str = "Prospecting") -> DealDTO:
+    return DealDTO(
+        id=deal_id,
+        deal_id=deal_id,
+        deal_name=f"Deal {deal_id}",
+        deal_size=100,
+        probability_of_closure="40%",
+        deal_stage=deal_stage,
+        account_id=1,
+        created_at=datetime(2024, 1, 1),
+    )
+
+
+def crm_response(status_code: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = "https://crm.test/api/deals"
+    return response
+
+
+def make_service(session, crm_deals: dict[int, DealDTO], status_code: int = 404):
+    def find_by_id(entity_id: str) -> DealDTO:
+        if int(entity_id) not in crm_deals:
+            crm_response(status_code).raise_for_status()
+        return crm_deals[int(entity_id)]
+
+    crm_api = CRMDealsAPI()
+    crm_api.find_by_id = find_by_id
+    service = ServiceDeal(crm_api=crm_api, domain_api=DBDealsAPI(session))
+    service.save_many_to_db([make_deal(deal_id) for deal_id in (1, 2, 3)])
+    return service
+
+
+def test_verified_lookup_skips_records_deleted_from_the_crm(session):
+    service = make_service(
+        session, {1: make_deal(1), 3: make_deal(3, deal_stage="Negotiation")}
+    )
+
+    results = service.find_by_field_name(
+        "deal_stage", "Prospecting", freshness=Freshness.VERIFIED
+    )
+
+    assert [record.id for record in results] == [1]
+
+
+def test_verified_lookup_raises_other_crm_errors(session):
+    service = make_service(session, {1: make_deal(1)}, status_code=500)
+
+    with pytest.raises(requests.HTTPError):
+        service.find_by_field_name(
+            "deal_stage", "Prospecting", freshness=Freshness.VERIFIED
+        )
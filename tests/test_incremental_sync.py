@@ -0,0 +1,72 @@
+from datetime import datetime
+
+import pytest
+
+from crm_management.domain.deals.crm.dto import DealDTO
+from crm_management.domain.deals.crm.service import CRMDealsAPI
+from crm_management.domain.deals.db.service import DBDealsAPI
+from crm_management.domain.deals.service import ServiceDeal
+from crm_management.domain.sync.db.service import DBSyncStateAPI
+from crm_management.services.sync import IncrementalSync
+
+
+def make_deal(deal_id: int) -> DealDTO:
+    return DealDTO(
+        id=deal_id,
+        deal_id=deal_id,
+        deal_name=f"Deal {deal_id}",
+        deal_size=100,
+        probability_of_closure="40%",
+        deal_stage="Prospecting",
+        account_id=1,
+        created_at=datetime(2024, 1, 1),
+    )
+
+
+def raw_deal(deal_id: int) -> dict:
+    return {
+        "id": deal_id,
+        "name": f"Deal {deal_id}",
+        "amount": "100",
+        "created_at": "2024-01-01T00:00:00Z",
+        "custom_field": {
+            "cf_deal_id": deal_id,
+            "cf_probability_of_closure": "40%",
+            "cf_deal_stage": "Prospecting",
+            "cf_account_id": 1,
+        },
+    }
+
+
+@pytest.fixture
+def service(session, monkeypatch):
+    monkeypatch.setenv("CRM_STREAM_RESPONSES", "false")
+    service = ServiceDeal(crm_api=CRMDealsAPI(), domain_api=DBDealsAPI(session))
+    service.save_many_to_db([make_deal(deal_id) for deal_id in (1, 2, 3)])
+    return service
+
+
+def full_resync(service, session, crm_items: list[dict]):
+    service.crm_api._fetch_page = lambda page, page_size: {"deals": crm_items}
+    return IncrementalSync(DBSyncStateAPI(session)).fetch(
+        "deals", service, force_full=True
+    )
+
+
+def test_full_resync_deletes_only_the_records_gone_from_the_crm(service, session):
+    invalid = {**raw_deal(2), "amount": "not a number"}
+
+    batch = full_resync(service, session, [raw_deal(1), invalid])
+
+    assert [record.id for record in batch.records] == [1]
+    assert batch.deleted_ids == {3}
+
+
+def test_full_resync_deletes_nothing_when_an_undecodable_record_has_no_id(
+    service, session
+):
+    invalid = {key: value for key, value in raw_deal(2).items() if key != "id"}
+
+    batch = full_resync(service, session, [raw_deal(1), invalid])
+
+    assert batch.deleted_ids == set()
@@ -0,0 +1,24 @@
+from crm_management.domain.accounts.db.orm import AccountORM, RegionORMEnum
+from crm_management.domain.accounts.db.service import DBAccountsAPI
+
+
+def test_iter_all_filters_with_keyword_criteria(session):
+    api = DBAccountsAPI(session)
+    api.upsert_many(
+        AccountORM(
+            account_id=account_id,
+            account_name=f"Account {account_id}",
+            industry="Retail" if account_id % 2 else "Finance",
+            account_value=100 * account_id,
+            region=RegionORMEnum.EUROPE,
+        )
+        for account_id in range(1, 8)
+    )
+
+    filtered = api.iter_all(
+        row_format="dict", criteria=[AccountORM.account_value > 200], chunk_size=2
+    )
+    by_field = api.iter_field_and_value("industry", "Retail", chunk_size=2)
+
+    assert [row["account_id"] for row in filtered] == [3, 4, 5, 6, 7]
+    assert [account.account_id for account in by_field] == [1, 3, 5, 7]
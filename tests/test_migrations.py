@@ -0,0 +1,57 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import Index, inspect, text
+
+from crm_management.db.utils import create_schema
+from crm_management.domain.accounts.db.orm import AccountORM
+
+
+def index_names(engine, table_name: str) -> set[str]:
+    return {index["name"] for index in inspect(engine).get_indexes(table_name)}
+
+
+def test_duplicate_aggregates_are_removed_for_the_unique_index(engine):
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX uq_deal_aggregations_bucket"))
+        for total in (1.0, 2.0):
+            connection.execute(
+                text(
+                    "INSERT INTO deal_aggregations (account_id, aggregation_type, "
+                    "aggregation_date, total_deal_size, deal_count) "
+                    "VALUES (1, 'daily', :day, :total, 1)"
+                ),
+                {"day": date(2024, 1, 1), "total": total},
+            )
+
+    create_schema(engine)
+
+    assert "uq_deal_aggregations_bucket" in index_names(engine, "deal_aggregations")
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text("SELECT total_deal_size FROM deal_aggregations")
+        ).all()
+    assert rows == [(2.0,)]
+
+
+def test_duplicates_in_mirror_tables_are_reported_not_deleted(engine):
+    with engine.begin() as connection:
+        for account_id in (1, 2):
+            connection.execute(
+                text(
+                    "INSERT INTO accounts (account_id, account_name, industry, "
+                    "account_value, region) VALUES (:id, 'Acme', 'Tech', 1, 'EUROPE')"
+                ),
+                {"id": account_id},
+            )
+
+    index = Index("uq_accounts_account_name", AccountORM.account_name, unique=True)
+    try:
+        with pytest.raises(ValueError, match=r"uq_accounts_account_name.*'Acme'"):
+            create_schema(engine)
+    finally:
+        AccountORM.__table__.indexes.discard(index)
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM accounts")).scalar() == 2
+    assert "uq_accounts_account_name" not in index_names(engine, "accounts")
@@ -0,0 +1,29 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from crm_management.crm.rate_limiter import TokenBucket
+from crm_management.crm.service_base import CRMBaseAPI
+
+
+def test_default_capacity_lets_a_burst_through():
+    bucket = TokenBucket(requests_per_minute=120)
+
+    started_at = time.monotonic()
+    for _ in range(20):
+        bucket.acquire()
+
+    assert bucket.capacity == 20
+    assert time.monotonic() - started_at < 0.1
+
+
+def test_slow_plans_still_send_one_request_at_once():
+    assert TokenBucket(requests_per_minute=3).capacity == 1.0
+
+
+def test_apis_created_concurrently_share_one_limiter(monkeypatch):
+    monkeypatch.setattr(CRMBaseAPI, "_CRMBaseAPI__rate_limiter", None)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        limiters = list(executor.map(lambda _: CRMBaseAPI._rate_limiter(), range(64)))
+
+    assert len({id(limiter) for limiter in limiters}) == 1
@@ -0,0 +1,75 @@
+import json
+
+import requests
+from requests.adapters import BaseAdapter
+
+from crm_management.crm.cache import LRUResponseCache
+from crm_management.crm.client_base import APIClient
+from crm_management.domain.accounts.crm.service import (
+    ACCOUNTS_VIEW_ID,
+    CRMAccountsAPI,
+)
+
+
+def raw_account(account_id: int) -> dict:
+    return {
+        "id": account_id,
+        "name": f"Account {account_id}",
+        "custom_field": {
+            "cf_account_id": account_id,
+            "cf_industry": "Retail",
+            "cf_account_value": 100,
+            "cf_region": "Europe",
+        },
+    }
+
+
+class FakeCRMAdapter(BaseAdapter):
+    """Serves the CRM accounts endpoints with an ETag, like the real API."""
+
+    def send(self, request, **kwargs):
+        if f"/view/{ACCOUNTS_VIEW_ID}" in request.url:
+            payload = {
+                "sales_accounts": [raw_account(1), raw_account(2)],
+                "meta": {"total_pages": 1},
+            }
+        else:
+            payload = {"sales_account": raw_account(1)}
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.headers["ETag"] = '"v1"'
+        response._content = json.dumps(payload).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+def make_api(cache_view_pages: bool | None = None) -> CRMAccountsAPI:
+    client = APIClient(base_url="https://crm.test", cache=LRUResponseCache())
+    client._session.mount("https://", FakeCRMAdapter())
+    api = CRMAccountsAPI()
+    api.cache_view_pages = cache_view_pages
+    api._CRMBaseAPI__api_client = client
+    return api
+
+
+def test_view_pages_are_not_cached_by_default(monkeypatch):
+    monkeypatch.delenv("CRM_CACHE_VIEW_PAGES", raising=False)
+    api = make_api()
+
+    assert [account.id for account in api.find_all(stream=False)] == [1, 2]
+    api.find_by_id("1")
+
+    cache = api._api_client.cache
+    assert list(cache._entries) == ["https://crm.test/api/sales_accounts/1"]
+    assert cache.stats.misses == 1
+
+
+def test_view_pages_are_cached_when_enabled():
+    api = make_api(cache_view_pages=True)
+
+    api.find_all(stream=False)
+
+    assert len(api._api_client.cache._entries) == 1
@@ -0,0 +1,45 @@
+from datetime import datetime
+
+import pytest
+
+from crm_management.domain.deals.crm.dto import DealDTO
+from crm_management.domain.deals.crm.service import CRMDealsAPI
+from crm_management.domain.deals.db.service import DBDealsAPI
+from crm_management.domain.deals.service import ServiceDeal
+
+
+def make_deal(deal_id: int) -> DealDTO:
+    return DealDTO(
+        id=deal_id,
+        deal_id=deal_id,
+        deal_name=f"Deal {deal_id}",
+        deal_size=100,
+        probability_of_closure="40%",
+        deal_stage="Prospecting",
+        account_id=1,
+        created_at=datetime(2024, 1, 1),
+    )
+
+
+@pytest.fixture
+def service(session):
+    crm_api = CRMDealsAPI()
+    crm_api.pushed = []
+
+    def update_one(updated_data: DealDTO) -> DealDTO:
+        crm_api.pushed.append(updated_data.id)
+        return updated_data
+
+    crm_api.update_one = update_one
+    return ServiceDeal(crm_api=crm_api, domain_api=DBDealsAPI(session))
+
+
+@pytest.mark.parametrize("save_to_db", [True, False])
+def test_update_many_saves_to_the_db_only_if_asked(service, save_to_db):
+    deals = [make_deal(deal_id) for deal_id in (1, 2)]
+
+    result = service.update_many(updated_data=deals, save_to_db=save_to_db)
+
+    assert [record.success for record in result.results] == [True, True]
+    assert sorted(service.crm_api.pushed) == [1, 2]
+    assert service.domain_api.get_ids() == ({1, 2} if save_to_db else set())
@@ -0,0 +1,60 @@
+from datetime import date
+
+from crm_management.db.service_base import UpsertResult
+from crm_management.domain.accounts.db.orm import AccountORM, RegionORMEnum
+from crm_management.domain.accounts.db.service import DBAccountsAPI
+from crm_management.domain.reports.db.service import DBDealsAggregationAPI
+
+
+def make_account(account_id: int, account_value: int) -> AccountORM:
+    return AccountORM(
+        account_id=account_id,
+        account_name=f"Account {account_id}",
+        industry="Retail",
+        account_value=account_value,
+        region=RegionORMEnum.EUROPE,
+    )
+
+
+def test_upsert_many_counts_inserted_updated_and_unchanged_rows(session):
+    api = DBAccountsAPI(session)
+
+    assert api.upsert_many(
+        [make_account(account_id, 100) for account_id in range(1, 5)], chunk_size=3
+    ) == UpsertResult(inserted=4)
+    assert api.upsert_many(
+        [
+            make_account(1, 100),
+            make_account(2, 200),
+            make_account(3, 100),
+            make_account(5, 100),
+        ],
+        chunk_size=3,
+    ) == UpsertResult(inserted=1, updated=1, unchanged=2)
+    assert {
+        account.account_id: account.account_value
+        for account in session.query(AccountORM)
+    } == {1: 100, 2: 200, 3: 100, 4: 100, 5: 100}
+
+
+def test_upsert_rows_counts_rows_by_composite_natural_key(session):
+    api = DBDealsAggregationAPI(session)
+    rows = [
+        {
+            "account_id": 1,
+            "aggregation_type": "daily",
+            "aggregation_date": date(2024, 1, day),
+            "total_deal_size": 10.0 * day,
+            "deal_count": day,
+        }
+        for day in (1, 2, 3)
+    ]
+
+    assert api.upsert_rows(rows) == UpsertResult(inserted=3)
+    assert api.upsert_rows(
+        [
+            rows[0],
+            {**rows[1], "deal_count": 9},
+            {**rows[2], "aggregation_type": "weekly"},
+        ]
+    ) == UpsertResult(inserted=1, updated=1, unchanged=1)